@@ -0,0 +1,180 @@
+"""
+Module to archive finished competition databases.
+
+Archiving checkpoints and vacuums the live database, compresses it into a read-only `.db.xz` bundle under
+`comp_dbs/archive/`, records it in the archive index and removes the live file. Archived competitions are
+opened straight into memory, without unpacking to disk.
+
+Dependencies:
+    os: Used for file operations and permissions.
+    json: Used for reading and writing the archive index.
+    lzma: Used for compressing archive bundles.
+    hashlib: Used for checksumming archived databases.
+    sqlite3: Used for compacting and opening competition databases.
+    tempfile: Used when the sqlite3 module cannot deserialize into memory.
+    os.path: Standard Python library functions for file and directory path manipulations.
+    datetime: Used for timestamping archive entries.
+
+Example:
+    To use the archive functions, import them into your bot's file:
+
+    ```python
+    from archive import archive, open_archive
+    ```
+"""
+
+import os
+import json
+import lzma
+import hashlib
+import sqlite3
+import tempfile
+from os.path import join, dirname, abspath, basename, exists, getsize, splitext
+from datetime import datetime
+
+ARCHIVE_DIR = str(join(dirname(dirname(abspath(__file__))), 'mathletics/comp_dbs/archive'))
+INDEX_NAME = 'index.json'
+BUNDLE_SUFFIX = '.db.xz'
+
+
+def load_index(archive_dir: str = ARCHIVE_DIR) -> dict:
+    """Reads the archive index.
+
+    Args:
+        archive_dir (str): Archive directory. Default is comp_dbs/archive.
+
+    Returns:
+        dict: Archive entries keyed by competition name.
+    """
+    path = join(archive_dir, INDEX_NAME)
+    if not exists(path):
+        return {}
+    with open(path, 'r') as index_file:
+        return json.load(index_file)
+
+
+def _save_index(index: dict, archive_dir: str) -> None:
+    path = join(archive_dir, INDEX_NAME)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as index_file:
+        json.dump(index, index_file, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def compact(db_path: str) -> dict:
+    """Checkpoints and vacuums a competition database in place.
+
+    Args:
+        db_path (str): Path to the competition database.
+
+    Returns:
+        dict: Row counts of the teams, questions and progress tables.
+    """
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)") # fold any WAL content into the main file
+    conn.execute("PRAGMA journal_mode=DELETE") # so the file is self-contained
+    conn.execute("VACUUM")
+
+    counts = {}
+    for table in ('teams', 'questions', 'progress'):
+        try:
+            counts[table] = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        except sqlite3.OperationalError:
+            counts[table] = 0
+    conn.close()
+    return counts
+
+
+def archive(db_path: str, archive_dir: str = ARCHIVE_DIR) -> dict:
+    """Finalizes a competition database into a compressed read-only bundle and indexes it.
+
+    Args:
+        db_path (str): Path to the competition database.
+        archive_dir (str): Archive directory. Default is comp_dbs/archive.
+
+    Returns:
+        dict: The new index entry (bundle path, sizes, checksum, row counts, archive time).
+
+    Raises:
+        FileExistsError: A competition of the same name is already archived; its bundle is left untouched.
+    """
+    os.makedirs(archive_dir, exist_ok=True)
+    name = splitext(basename(db_path))[0]
+    bundle = join(archive_dir, name + BUNDLE_SUFFIX)
+    if exists(bundle) or name in load_index(archive_dir):
+        raise FileExistsError(f"{name} is already archived")
+    counts = compact(db_path)
+
+    tmp_bundle = bundle + '.tmp'
+    digest = hashlib.sha256()
+    with open(db_path, 'rb') as source, lzma.open(tmp_bundle, 'wb', preset=9) as target:
+        for block in iter(lambda: source.read(1 << 16), b''):
+            digest.update(block)
+            target.write(block)
+
+    os.replace(tmp_bundle, bundle)
+    os.chmod(bundle, 0o444)
+
+    entry = {
+        'bundle': basename(bundle),
+        'size': getsize(db_path),
+        'compressed_size': getsize(bundle),
+        'sha256': digest.hexdigest(),
+        'counts': counts,
+        'archived_at': datetime.now().isoformat(timespec='seconds'),
+    }
+    index = load_index(archive_dir)
+    index[name] = entry
+    _save_index(index, archive_dir)
+
+    # the bundle is now the only copy
+    for path in (db_path, db_path + '-wal', db_path + '-shm'):
+        if exists(path):
+            os.remove(path)
+
+    return entry
+
+
+def open_archive(name: str, archive_dir: str = ARCHIVE_DIR) -> sqlite3.Connection:
+    """Opens an archived competition as an in-memory database.
+
+    Args:
+        name (str): Competition name (e.g. '2023-10-02_competition') or path to a bundle.
+        archive_dir (str): Archive directory. Default is comp_dbs/archive.
+
+    Returns:
+        sqlite3.Connection: Connection to an in-memory copy of the archived database.
+
+    Raises:
+        FileNotFoundError: No bundle exists for the name.
+    """
+    path = name if name.endswith(BUNDLE_SUFFIX) else join(archive_dir, name + BUNDLE_SUFFIX)
+    with lzma.open(path, 'rb') as bundle:
+        data = bundle.read()
+
+    if hasattr(sqlite3.Connection, 'deserialize'): # Python 3.11+
+        conn = sqlite3.connect(':memory:')
+        conn.deserialize(data)
+        return conn
+
+    # older Pythons: unpack to a temporary file, copy it into memory and remove it
+    tmp = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+    try:
+        with tmp:
+            tmp.write(data)
+        source = sqlite3.connect(f"file:{tmp.name}?immutable=1", uri=True)
+        conn = sqlite3.connect(':memory:')
+        source.backup(conn)
+        source.close()
+    finally:
+        os.remove(tmp.name)
+    return conn
+
+
+def list_archives(archive_dir: str = ARCHIVE_DIR) -> list:
+    """Lists archived competition names, oldest first.
+
+    Args:
+        archive_dir (str): Archive directory. Default is comp_dbs/archive.
+    """
+    return sorted(load_index(archive_dir))
@@ -0,0 +1,263 @@
+"""
+Module to keep a reusable bank of competition questions.
+
+Questions are stored once in comp_dbs/bank.sqlite, keyed by a hash of their content (prompt, base score, matcher and
+canonical answer), so uploading the same set again, or another set sharing questions with it, stores nothing new.
+Sets are ordered lists of question hashes. A competition takes a set with one `INSERT ... SELECT` from the attached
+bank instead of parsing a CSV upload again.
+
+Each question carries an answer matcher, compiled once per competition into a plain callable:
+    exact: The answer must match character for character (the default, and the behaviour of CSV uploads).
+    text: Case, surrounding whitespace and repeated spaces are ignored.
+    number: Any equal number matches, e.g. `0.5`, `1/2` and `.50` for an answer of `1/2`.
+    regex: The answer must fully match a regular expression.
+
+Classes:
+    QuestionBank: Content-addressed store of questions and sets.
+
+Functions:
+    canonical: Normalizes an answer for its matcher.
+    question_hash: Content hash of a question.
+    compile_matcher: Builds the answer check for a question.
+    compile_questions: Builds the answer checks of every question in a competition.
+    load_set: Replaces a competition's questions with a bank set.
+
+Dependencies:
+    re: Used for regex matchers.
+    hashlib: Used for content hashes.
+    sqlite3: Used for storing the bank.
+    fractions: Used for exact numeric comparison.
+    os.path: Standard Python library functions for file and directory path manipulations.
+    datetime: Used for timestamping sets.
+
+Example:
+    To use the question bank, import it into your bot's file:
+
+    ```python
+    from bank import QuestionBank, load_set, compile_questions
+    ```
+"""
+
+import re
+import hashlib
+import sqlite3
+from fractions import Fraction
+from os.path import join, dirname, abspath, exists
+from datetime import datetime
+
+BANK_PATH = str(join(dirname(dirname(abspath(__file__))), 'mathletics/comp_dbs/bank.sqlite'))
+MATCHERS = ('exact', 'text', 'number', 'regex')
+
+# numbers a 'number' matcher accepts: decimals, fractions and small exponents. Fraction alone would expand an answer
+# like 1e100000000 into a hundred-million-digit integer and stall the bot, so anything else is rejected unparsed.
+NUMBER = re.compile(r'[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d{1,3})?(?:/\d+)?')
+MAX_NUMBER_LENGTH = 64
+
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS questions (
+        hash TEXT PRIMARY KEY,
+        prompt TEXT,
+        answer TEXT,
+        canonical TEXT,
+        base_score INTEGER,
+        matcher TEXT
+    );
+    CREATE TABLE IF NOT EXISTS sets (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE,
+        added TEXT
+    );
+    CREATE TABLE IF NOT EXISTS set_questions (
+        set_id INTEGER,
+        number INTEGER,
+        hash TEXT,
+        PRIMARY KEY (set_id, number)
+    );
+'''
+
+
+def _number(text: str):
+    text = text.strip().replace(',', '')
+    if len(text) > MAX_NUMBER_LENGTH or not NUMBER.fullmatch(text):
+        return None
+    try:
+        return Fraction(text)
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def canonical(matcher: str, answer: str) -> str:
+    """Normalizes an answer for its matcher, so equivalent answers hash the same.
+
+    Args:
+        matcher (str): 'exact', 'text', 'number' or 'regex'.
+        answer (str): Answer as written in the set.
+
+    Returns:
+        str: Canonical answer.
+
+    Raises:
+        ValueError: Unknown matcher, a 'number' answer that is not a number, or an invalid regular expression.
+    """
+    if matcher == 'exact':
+        return answer
+    if matcher == 'text':
+        return ' '.join(answer.split()).casefold()
+    if matcher == 'number':
+        value = _number(answer)
+        if value is None:
+            raise ValueError(f"{answer!r} is not a number")
+        return str(value)
+    if matcher == 'regex':
+        try:
+            re.compile(answer)
+        except re.error as e:
+            raise ValueError(f"invalid regular expression {answer!r}: {e}")
+        return answer
+    raise ValueError(f"unknown matcher {matcher!r}; expected one of {', '.join(MATCHERS)}")
+
+
+def question_hash(prompt: str, base_score: int, matcher: str, canonical_answer: str) -> str:
+    """Returns the content hash identifying a question in the bank."""
+    content = '\x1f'.join((prompt or '', str(base_score), matcher, canonical_answer))
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def compile_matcher(matcher: str, answer: str):
+    """Builds the answer check for a question.
+
+    Args:
+        matcher (str): 'exact', 'text', 'number' or 'regex'. None is read as 'exact'.
+        answer (str): The question's answer.
+
+    Returns:
+        callable: Takes a submitted answer and returns True if it is correct.
+    """
+    matcher = matcher or 'exact'
+    if matcher == 'exact':
+        return answer.__eq__
+    expected = canonical(matcher, answer)
+    if matcher == 'text':
+        return lambda response: ' '.join(response.split()).casefold() == expected
+    if matcher == 'number':
+        value = Fraction(expected)
+        return lambda response: _number(response) == value
+    pattern = re.compile(expected)
+    return lambda response: pattern.fullmatch(response.strip()) is not None
+
+
+def compile_questions(conn: sqlite3.Connection) -> dict:
+    """Builds the answer checks of every question in a competition database.
+
+    Args:
+        conn (sqlite3.Connection): Connection to the competition database.
+
+    Returns:
+        dict: Maps question numbers to answer checks.
+    """
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(questions)")}
+    query = "SELECT id, answer, matcher FROM questions" if 'matcher' in columns else "SELECT id, answer, NULL FROM questions"
+    return {qid: compile_matcher(matcher, str(answer)) for qid, answer, matcher in conn.execute(query)}
+
+
+def load_set(conn: sqlite3.Connection, set_id: int, path: str = BANK_PATH) -> int:
+    """Replaces a competition's questions with a bank set, in one transaction.
+
+    Args:
+        conn (sqlite3.Connection): Connection to the competition database.
+        set_id (int): Bank set ID.
+        path (str): Path to the bank. Default is comp_dbs/bank.sqlite.
+
+    Returns:
+        int: Questions loaded; 0 if the set does not exist, in which case the questions are left unchanged.
+    """
+    if not exists(path):
+        return 0
+    conn.execute("ATTACH DATABASE ? AS bank", (path,))
+    try:
+        if conn.execute("SELECT COUNT(*) FROM bank.set_questions WHERE set_id = ?", (set_id,)).fetchone()[0] == 0:
+            return 0
+        with conn:
+            conn.execute("DELETE FROM questions")
+            cursor = conn.execute('''
+                INSERT INTO questions (id, answer, base_score, matcher)
+                SELECT s.number, q.answer, q.base_score, q.matcher
+                FROM bank.set_questions s JOIN bank.questions q ON q.hash = s.hash
+                WHERE s.set_id = ?
+                ORDER BY s.number
+            ''', (set_id,))
+        return cursor.rowcount
+    finally:
+        conn.execute("DETACH DATABASE bank")
+
+
+class QuestionBank:
+    """
+    Content-addressed store of questions and the sets they appear in, kept in comp_dbs/bank.sqlite.
+
+    Args:
+        path (str): Path to the bank database. Default is comp_dbs/bank.sqlite.
+    """
+    def __init__(self, path: str = BANK_PATH) -> None:
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def add_set(self, name: str, rows) -> tuple:
+        """Stores a question set; questions already in the bank are referenced, not copied.
+
+        Args:
+            name (str): Set name, unique in the bank.
+            rows (iterable): CSV rows, either (question number, answer, base score[, matcher[, prompt]]) as for
+                `!set_questions`, or (prompt, answer, base score[, matcher]) as for the CLI, numbered in order.
+
+        Returns:
+            tuple: (set ID, questions in the set, questions new to the bank).
+
+        Raises:
+            ValueError: The name is taken, a row is malformed or an answer does not suit its matcher.
+        """
+        entries = []
+        for position, row in enumerate(rows, start=1):
+            if len(row) < 3:
+                raise ValueError(f"row {row!r} needs a question, an answer and a base score")
+            try:
+                base_score = int(row[2])
+            except ValueError:
+                raise ValueError(f"row {row!r} has a base score that is not a whole number")
+            answer = row[1]
+            matcher = row[3].strip().lower() if len(row) > 3 and row[3].strip() else 'exact'
+            if row[0].strip().isdigit():
+                number, prompt = int(row[0]), (row[4] if len(row) > 4 else None)
+            else:
+                number, prompt = position, row[0]
+            canonical_answer = canonical(matcher, answer)
+            entries.append((number, question_hash(prompt, base_score, matcher, canonical_answer), prompt, answer, canonical_answer, base_score, matcher))
+        if not entries:
+            raise ValueError("the set has no questions")
+
+        try:
+            with self.conn:
+                set_id = self.conn.execute("INSERT INTO sets (name, added) VALUES (?, ?)", (name, datetime.now().isoformat(timespec='seconds'))).lastrowid
+                before = self.conn.total_changes
+                self.conn.executemany("INSERT OR IGNORE INTO questions (hash, prompt, answer, canonical, base_score, matcher) VALUES (?, ?, ?, ?, ?, ?)", [entry[1:] for entry in entries])
+                added = self.conn.total_changes - before
+                self.conn.executemany("INSERT INTO set_questions (set_id, number, hash) VALUES (?, ?, ?)", [(set_id, entry[0], entry[1]) for entry in entries])
+        except sqlite3.IntegrityError as e:
+            raise ValueError(f"set name {name!r} is taken" if 'sets.name' in str(e) else "question numbers must be unique within a set")
+        return set_id, len(entries), added
+
+    def sets(self) -> list:
+        """Lists the sets in the bank.
+
+        Returns:
+            list: (set ID, name, question count, added) rows, oldest first.
+        """
+        return self.conn.execute('''
+            SELECT s.id, s.name, COUNT(q.hash), s.added
+            FROM sets s LEFT JOIN set_questions q ON q.set_id = s.id
+            GROUP BY s.id ORDER BY s.id
+        ''').fetchall()
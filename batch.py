@@ -0,0 +1,60 @@
+"""
+Module to read batch answer submissions.
+
+A batch is a CSV or plain text file with one answer per line, as `question,answer` or, in text files, separated by
+a comma, semicolon, colon, tab or space (e.g. `Q3: 42`). Lines that do not start with a question number, such as a
+header row, are reported back rather than failing the batch. Only the first answer to each question counts.
+
+Functions:
+    parse_batch: Splits a batch file into (question, answer) pairs.
+
+Dependencies:
+    re: Used for parsing text lines.
+    csv: Used for parsing CSV files.
+
+Example:
+    To use the parse_batch function, import it into your bot's file:
+
+    ```python
+    from batch import parse_batch
+    ```
+"""
+
+import re
+import csv
+
+MAX_BATCH = 200 # answers per batch
+LINE = re.compile(r'^\s*[Qq]?(\d+)\s*[,;:\t ]\s*(.*?)\s*$')
+
+
+def parse_batch(text: str, is_csv: bool = False) -> tuple:
+    """Splits a batch file into answers.
+
+    Args:
+        text (str): Contents of the file.
+        is_csv (bool): Parse as CSV, so quoted answers may contain commas. Default is False.
+
+    Returns:
+        tuple: (list of (question number, answer) pairs in file order, list of unreadable lines, list of
+            question numbers answered more than once).
+    """
+    lines = [line for line in text.strip().splitlines() if line.strip()]
+    pairs, unreadable, repeated, seen = [], [], [], set()
+    rows = csv.reader(lines) if is_csv else ([line] for line in lines)
+    for line, row in zip(lines, rows):
+        if is_csv:
+            number = row[0].strip().lstrip('Qq') if row else ''
+            answer = row[1].strip() if len(row) > 1 else ''
+        else:
+            match = LINE.match(row[0])
+            number, answer = match.groups() if match else ('', '')
+        if not number.isdigit() or not answer:
+            unreadable.append(line)
+            continue
+        number = int(number)
+        if number in seen:
+            repeated.append(number)
+            continue
+        seen.add(number)
+        pairs.append((number, answer))
+    return pairs, unreadable, repeated
@@ -0,0 +1,82 @@
+"""
+Benchmark of per-message overhead for traffic from channels the competition does not use.
+
+Compares the previous path, where every message ran the relayer's checks and every pending `bot.wait_for`
+check (as discord.py's Client.dispatch does), with the dispatcher, which drops the message after one frozenset
+lookup. Pending waits model teams sitting at the answer prompt.
+
+Usage:
+    python benchmarks/bench_dispatch.py [--waits 40] [--messages 200000]
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+from types import SimpleNamespace
+from os.path import dirname, abspath
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from relayer import Relayer, Route
+from dispatch import Dispatcher
+
+
+def make_message(channel_id: int, author):
+    channel = SimpleNamespace(id=channel_id)
+    return SimpleNamespace(channel=channel, author=author, content="hello")
+
+
+async def bench(waits: int, messages: int) -> None:
+    bot = SimpleNamespace(user=SimpleNamespace(name='steward'), get_channel=lambda channel_id: None)
+    member = SimpleNamespace(name='member')
+    loop = asyncio.get_running_loop()
+
+    relayer = Relayer(bot)
+    relayer.set_routes({i: [Route(0)] for i in range(1, waits + 1)})
+    team_channels = [SimpleNamespace(id=i) for i in range(1, waits + 1)]
+
+    # previous path: the relayer plus one discord.py wait_for listener per team at the answer prompt
+    listeners = []
+    for channel in team_channels:
+        listeners.append((loop.create_future(), lambda sender, channel=channel: sender.channel == channel))
+
+    async def before(message):
+        for future, check in listeners:
+            if not future.cancelled() and check(message):
+                future.set_result(message)
+        await relayer.on_message(message)
+
+    dispatcher = Dispatcher(bot)
+    dispatcher.handlers.append(relayer.on_message)
+    dispatcher.set_channels(relayer.enabled_channels)
+    pending = [asyncio.ensure_future(dispatcher.wait_for(channel.id, lambda sender: True)) for channel in team_channels]
+    await asyncio.sleep(0) # register the waits
+
+    # irrelevant traffic: many busy channels outside the competition
+    traffic = [make_message(10_000 + i % 500, member) for i in range(messages)]
+
+    print(f"{waits} pending waits, {messages} irrelevant messages")
+    print(f"{'path':<12}{'ns/message':>12}")
+    for name, handler in (('before', before), ('dispatcher', dispatcher.dispatch)):
+        start = time.perf_counter()
+        for message in traffic:
+            await handler(message)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<12}{elapsed / messages * 1e9:>12.0f}")
+
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--waits', type=int, default=40)
+    parser.add_argument('--messages', type=int, default=200000)
+    args = parser.parse_args()
+    asyncio.run(bench(args.waits, args.messages))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark of the matplotlib (graph.graph) and Pillow (fast_graph.graph) leaderboard renderers.
+
+Builds a throwaway competition database with random team scores, renders it repeatedly with each renderer and
+reports mean render time and peak Python memory (tracemalloc) per render.
+
+Usage:
+    python benchmarks/bench_graph.py [--teams 15] [--runs 20]
+"""
+
+import os
+import sys
+import time
+import random
+import sqlite3
+import argparse
+import warnings
+import tempfile
+import tracemalloc
+from os.path import join, dirname, abspath
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+import matplotlib
+matplotlib.use('Agg')
+warnings.filterwarnings('ignore', module='graph') # set_ticklabels warning from graph.graph
+
+import graph
+import fast_graph
+
+
+def make_db(path: str, teams: int) -> None:
+    conn = sqlite3.connect(path)
+    c = conn.cursor()
+    c.execute("CREATE TABLE teams (id INTEGER PRIMARY KEY, team_name TEXT, members TEXT, completed_qid TEXT, score INTEGER)")
+    c.executemany("INSERT INTO teams VALUES (?, ?, '[]', '', ?)", [(i, f"Team {i}", random.randint(0, 300)) for i in range(1, teams + 1)])
+    conn.commit()
+    conn.close()
+
+
+def bench(renderer, db_path: str, save_path: str, runs: int) -> tuple:
+    renderer(db_path, save_path) # warm up: font loading, caches, imports
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        renderer(db_path, save_path)
+    mean = (time.perf_counter() - start) / runs
+
+    tracemalloc.start()
+    renderer(db_path, save_path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return mean, peak, os.path.getsize(save_path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--teams', type=int, default=15)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = join(tmp, 'bench.db')
+        make_db(db_path, args.teams)
+
+        print(f"{args.teams} teams, {args.runs} runs")
+        print(f"{'renderer':<12}{'mean ms':>10}{'peak KiB':>12}{'png KiB':>10}")
+        for name, renderer in (('matplotlib', graph.graph), ('pillow', fast_graph.graph)):
+            mean, peak, size = bench(renderer, db_path, join(tmp, f'{name}.png'), args.runs)
+            print(f"{name:<12}{mean * 1000:>10.1f}{peak / 1024:>12.0f}{size / 1024:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
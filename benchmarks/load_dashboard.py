@@ -0,0 +1,103 @@
+"""
+Local load test of the live leaderboard dashboard with many concurrent viewers.
+
+Starts the dashboard on a local port, connects the given number of viewers to its event stream, then publishes
+score changes at a fixed rate as `submit` would. Every viewer parses the events it receives; the report gives the
+time from publish to receipt across all viewers, the bytes sent per event, and how many viewers were dropped for
+falling behind.
+
+Usage:
+    python benchmarks/load_dashboard.py [--viewers 500] [--teams 100] [--events 2000] [--rate 200] [--port 8765]
+"""
+
+import sys
+import json
+import time
+import asyncio
+import argparse
+import statistics
+from os.path import dirname, abspath
+
+import aiohttp
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from dashboard import Dashboard
+
+
+async def viewer(session: aiohttp.ClientSession, url: str, sent_at: dict, latencies: list, ready: asyncio.Event, counts: dict) -> None:
+    async with session.get(url) as response:
+        event = None
+        async for line in response.content:
+            line = line.rstrip(b'\n')
+            if line.startswith(b'event: '):
+                event = line[7:]
+            elif line.startswith(b'data: '):
+                if event == b'snapshot':
+                    counts['connected'] += 1
+                    if counts['connected'] == counts['viewers']:
+                        ready.set()
+                elif event == b'score':
+                    tid, score = json.loads(line[6:])[:2]
+                    latencies.append(time.perf_counter() - sent_at[(tid, score)])
+                    counts['bytes'] += len(line) + 16 # plus the event line and blank line
+
+
+async def load(viewers: int, teams: int, events: int, rate: float, port: int) -> None:
+    dashboard = Dashboard(port=port)
+    await dashboard.start()
+    dashboard.load((tid, f"Team {tid}", 0) for tid in range(1, teams + 1))
+
+    sent_at, latencies = {}, []
+    counts = {'viewers': viewers, 'connected': 0, 'bytes': 0}
+    ready = asyncio.Event()
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=None)) as session:
+        tasks = [asyncio.create_task(viewer(session, f"http://127.0.0.1:{port}/events", sent_at, latencies, ready, counts)) for _ in range(viewers)]
+        await asyncio.wait_for(ready.wait(), 60)
+        print(f"{viewers} viewers connected, {teams} teams, publishing {events} events at {rate:g}/s")
+
+        scores = dict.fromkeys(range(1, teams + 1), 0)
+        start = time.perf_counter()
+        for i in range(events):
+            tid = i % teams + 1
+            scores[tid] += 1
+            sent_at[(tid, scores[tid])] = time.perf_counter()
+            dashboard.publish(tid, scores[tid])
+            # pace against the schedule, not the previous event, so slow sends do not lower the rate
+            delay = start + (i + 1) / rate - time.perf_counter()
+            await asyncio.sleep(max(delay, 0))
+
+        # let the last events drain, then disconnect everyone
+        expected = events * (viewers - dashboard.dropped)
+        deadline = time.perf_counter() + 10
+        while len(latencies) < expected and time.perf_counter() < deadline:
+            await asyncio.sleep(0.05)
+        elapsed = time.perf_counter() - start
+        await dashboard.stop()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    latencies.sort()
+    stats = dashboard.stats()
+    print(f"delivered {len(latencies)}/{events * viewers} events in {elapsed:.1f}s ({len(latencies) / elapsed:,.0f} events/s)")
+    print(f"bytes per event: {counts['bytes'] / len(latencies):.0f}" if latencies else "no events delivered")
+    if latencies:
+        print(f"latency ms: p50 {statistics.median(latencies) * 1e3:.2f}  p99 {latencies[int(len(latencies) * 0.99)] * 1e3:.2f}  max {latencies[-1] * 1e3:.2f}")
+    print(f"slow viewers dropped: {stats['dropped']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--viewers', type=int, default=500)
+    parser.add_argument('--teams', type=int, default=100)
+    parser.add_argument('--events', type=int, default=2000)
+    parser.add_argument('--rate', type=float, default=200.0, help="events published per second")
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+    asyncio.run(load(args.viewers, args.teams, args.events, args.rate, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Module to keep a catalog of every competition.
+
+The catalog is a small SQLite database next to the competition databases, with one row per competition: its name,
+date, status, team and question counts, and a digest of its final standings. The competition commands keep it up to
+date, so checking a name and listing past competitions are single indexed queries instead of directory listings and
+archive reads. Competitions that predate the catalog are added from the competition directory and the archive index
+the first time the catalog is created.
+
+Classes:
+    Catalog: Index of past and current competitions.
+
+Functions:
+    standings_digest: Summarises final standings as a podium line and a checksum.
+
+Dependencies:
+    glob: Used for finding competitions that predate the catalog.
+    hashlib: Used for checksumming final standings.
+    sqlite3: Used for storing the catalog.
+    pathlib: Used for building read-only database URIs.
+    os.path: Standard Python library functions for file and directory path manipulations.
+    datetime: Used for timestamping catalog entries.
+    archive: A custom module for reading the archive index.
+
+Example:
+    To use the Catalog class, import it into your bot's file:
+
+    ```python
+    from catalog import Catalog
+    ```
+"""
+
+import glob
+import hashlib
+import sqlite3
+from pathlib import Path
+from os.path import join, dirname, abspath, basename, splitext
+from datetime import datetime
+from archive import ARCHIVE_DIR, load_index
+
+CATALOG_PATH = str(join(dirname(dirname(abspath(__file__))), 'mathletics/comp_dbs/catalog.sqlite'))
+PODIUM_SIZE = 3
+
+# competition lifecycle, in order
+STATUSES = ('set', 'active', 'stopped', 'archived')
+
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS competitions (
+        name TEXT PRIMARY KEY,
+        date TEXT,
+        status TEXT,
+        teams INTEGER,
+        questions INTEGER,
+        podium TEXT,
+        digest TEXT,
+        location TEXT,
+        updated TEXT
+    )
+'''
+
+
+def standings_digest(standings: list) -> tuple:
+    """Summarises final standings.
+
+    Args:
+        standings (list): (team name, score) pairs in leaderboard order.
+
+    Returns:
+        tuple: (podium line such as "Alpha 120, Beta 95, Gamma 80", SHA-256 prefix of the full standings).
+    """
+    podium = ', '.join(f"{name} {score}" for name, score in standings[:PODIUM_SIZE])
+    checksum = hashlib.sha256('\n'.join(f"{name}\t{score}" for name, score in standings).encode()).hexdigest()[:16]
+    return podium, checksum
+
+
+class Catalog:
+    """
+    Index of past and current competitions, stored in comp_dbs/catalog.sqlite.
+
+    Args:
+        path (str): Path to the catalog database. Default is comp_dbs/catalog.sqlite.
+        db_dir (str): Directory of competition databases, scanned when the catalog is first created. Default is
+            the directory holding the catalog.
+        archive_dir (str): Archive directory, whose index is read when the catalog is first created. Default is
+            comp_dbs/archive.
+    """
+    def __init__(self, path: str = CATALOG_PATH, db_dir: str = None, archive_dir: str = ARCHIVE_DIR) -> None:
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(SCHEMA)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS competitions_date ON competitions (date)")
+        self.conn.commit()
+        if self.conn.execute("SELECT COUNT(*) FROM competitions").fetchone()[0] == 0:
+            self.backfill(db_dir or dirname(path), archive_dir)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def exists(self, name: str) -> bool:
+        """Returns True if a competition with the name is in the catalog."""
+        return self.conn.execute("SELECT 1 FROM competitions WHERE name = ?", (name,)).fetchone() is not None
+
+    def record(self, name: str, status: str, teams: int = None, questions: int = None, standings: list = None, location: str = None) -> None:
+        """Adds or updates a competition; fields left as None keep their recorded value.
+
+        Args:
+            name (str): Competition name, e.g. '2023-10-02_competition'.
+            status (str): 'set', 'active', 'stopped' or 'archived'.
+            teams (int): Number of teams.
+            questions (int): Number of questions.
+            standings (list): Final (team name, score) pairs in leaderboard order.
+            location (str): Database path or archive bundle name.
+
+        Raises:
+            ValueError: Unknown status.
+        """
+        if status not in STATUSES:
+            raise ValueError(f"unknown competition status {status!r}; expected one of {', '.join(STATUSES)}")
+        podium, digest = standings_digest(standings) if standings is not None else (None, None)
+        date = name[:10] if name[:10].count('-') == 2 else None # names carry their set_comp date
+        self.conn.execute('''
+            INSERT INTO competitions (name, date, status, teams, questions, podium, digest, location, updated)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (name) DO UPDATE SET
+                status = excluded.status,
+                teams = COALESCE(excluded.teams, teams),
+                questions = COALESCE(excluded.questions, questions),
+                podium = COALESCE(excluded.podium, podium),
+                digest = COALESCE(excluded.digest, digest),
+                location = COALESCE(excluded.location, location),
+                updated = excluded.updated
+        ''', (name, date, status, teams, questions, podium, digest, location, datetime.now().isoformat(timespec='seconds')))
+        self.conn.commit()
+
+    def search(self, term: str = None, limit: int = 10) -> list:
+        """Lists competitions, newest first.
+
+        Args:
+            term (str): Case-insensitive text matched against names, dates and podiums. Default lists all.
+            limit (int): Most rows returned. Default is 10.
+
+        Returns:
+            list: (name, date, status, teams, questions, podium, digest) rows.
+        """
+        query = "SELECT name, date, status, teams, questions, podium, digest FROM competitions"
+        params = ()
+        if term:
+            query += " WHERE name LIKE ? OR date LIKE ? OR podium LIKE ?"
+            pattern = f"%{term}%"
+            params = (pattern, pattern, pattern)
+        query += " ORDER BY date DESC, name DESC LIMIT ?"
+        return self.conn.execute(query, params + (limit,)).fetchall()
+
+    def backfill(self, db_dir: str, archive_dir: str = ARCHIVE_DIR) -> int:
+        """Adds competitions that predate the catalog, from live databases and the archive index.
+
+        Args:
+            db_dir (str): Directory of competition databases.
+            archive_dir (str): Archive directory.
+
+        Returns:
+            int: Competitions added.
+        """
+        added = 0
+        for name, entry in load_index(archive_dir).items():
+            counts = entry.get('counts', {})
+            self.record(name, 'archived', counts.get('teams'), counts.get('questions'), location=entry.get('bundle'))
+            added += 1
+
+        for path in sorted(glob.glob(join(db_dir, '*.db'))):
+            name = splitext(basename(path))[0]
+            if self.exists(name):
+                continue
+            try:
+                conn = sqlite3.connect(Path(path).resolve().as_uri() + "?mode=ro", uri=True)
+                try:
+                    teams = conn.execute("SELECT COUNT(*) FROM teams").fetchone()[0]
+                    questions = conn.execute("SELECT COUNT(*) FROM questions").fetchone()[0]
+                    standings = conn.execute("SELECT team_name, score FROM teams ORDER BY score DESC, id").fetchall()
+                finally:
+                    conn.close()
+            except sqlite3.DatabaseError:
+                continue # not a competition database
+            self.record(name, 'stopped', teams, questions, standings, location=path)
+            added += 1
+        return added
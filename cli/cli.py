@@ -3,6 +3,11 @@ import os
 import time
 import csv
 from math import log
+from journal import Journal
+
+# shared modules live in the repository root, one level up
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from progress import ProgressMatrix, OPEN
 
 class Team:
     """
@@ -11,15 +16,10 @@ class Team:
     def __init__(self, name):
         self.name = name
         self.members = []
-        self.scores = {}
-        self.questions_taken = set()
-        self.questions_completed = set()
-        self.incorrect_attempts = {}
-        self.start_times = {}
-        self.end_times = {}
+        self.progress = None # TeamRow of the shared progress matrix, set by bind_progress
         
     def total_score(self):
-        return sum(self.scores.values())
+        return self.progress.total()
 
     def add_member(self, member):
         self.members.append(member)
@@ -77,10 +77,67 @@ def configure_questions(file_path):
             question_list.append(Question(question, answer, base_score))
     return question_list
 
+# gives every team a row of one shared progress matrix
+def bind_progress(teams, questions):
+    matrix = ProgressMatrix(len(teams), len(questions))
+    for i, team in enumerate(teams):
+        team.progress = matrix.row(i)
+    return matrix
+
+# registers a taken question on a team
+def apply_take(team, question_index, start_time):
+    # keep track of start time, no answers yet, and zero score
+    team.progress.cell(question_index).open(start_time)
+
+# registers a marked answer on a team
+def apply_mark(team, question_index, correct, end_time, points):
+    cell = team.progress.cell(question_index)
+    if correct:
+        # mark question complete, counting the correct answer as an attempt
+        cell.solve(cell.attempts + 1, end_time - cell.started, cell.score + points)
+    else:
+        # add an incorrect attempt
+        cell.attempts += 1
+
+# json-friendly state of every team: team names in row order and the progress matrix
+def teams_state(teams):
+    matrix = teams[0].progress.matrix if teams else ProgressMatrix(0, 0)
+    return {"teams": [team.name for team in teams], "progress": matrix.state()}
+
+# rebuilds team state from the last snapshot and the journal records after it
+def replay(teams, state, records):
+    by_name = {team.name: team for team in teams}
+    if state and "progress" in state:
+        # rows are matched by team name, so reordering teams.csv between runs is harmless
+        saved = ProgressMatrix.from_state(state["progress"])
+        for row, name in enumerate(state["teams"]):
+            if name in by_name:
+                by_name[name].progress.matrix.copy_row(saved, row, by_name[name].progress.team)
+    skipped = 0
+    for record in records:
+        team = by_name.get(record["team"])
+        if team is None:
+            continue
+        # questions are journaled by position; positions past the end of questions.csv no longer exist
+        if not 0 <= record["question"] < team.progress.matrix.questions:
+            skipped += 1
+            continue
+        if record["action"] == "take":
+            apply_take(team, record["question"], record["time"])
+        elif record["action"] == "mark":
+            apply_mark(team, record["question"], record["correct"], record["time"], record["points"])
+    if skipped:
+        print(f"Skipped {skipped} journal record(s) for questions that are no longer in questions.csv.")
+
+# writes an action to the journal and compacts it when a snapshot is due
+def record_action(journal, teams, action, **fields):
+    if journal.append(action, **fields):
+        journal.snapshot(teams_state(teams))
+
 # for when a team takes a question
-def take_question(teams, questions):
+def take_question(teams, questions, journal):
     # if all questions have been taken, return
-    if len([team for team in teams if len(team.questions_taken) < len(questions)]) == 0:
+    if len([team for team in teams if len(team.progress.open()) < len(questions)]) == 0:
         return
     
     # choose team
@@ -103,7 +160,7 @@ def take_question(teams, questions):
     update_display(teams, questions)
     print("Select question:")
     for i, question in enumerate(questions):
-        if i not in teams[team_index].questions_taken:
+        if teams[team_index].progress.cell(i).status != OPEN:
             print(f"{i + 1}. {question.question}")
     
     try:
@@ -116,18 +173,13 @@ def take_question(teams, questions):
     elif question_index == -1 or question_index > len(questions) - 1:
         return
 
-    # keep track of start time and add the question to that team's list
-    teams[team_index].questions_taken.add(question_index)
-    teams[team_index].start_times[question_index] = time.time()
-    
-    # init score, incorrect attempts, and end time to 0
-    teams[team_index].scores[question_index] = 0
-    teams[team_index].incorrect_attempts[question_index] = 1
-    teams[team_index].end_times[question_index] = 0
+    start_time = time.time()
+    apply_take(teams[team_index], question_index, start_time)
+    record_action(journal, teams, "take", team=teams[team_index].name, question=question_index, time=start_time)
 
-def answer_question(teams, questions):
+def answer_question(teams, questions, journal):
     # if no teams have questions out, return
-    if len([team for team in teams if len(team.questions_taken) > 0]) == 0:
+    if len([team for team in teams if team.progress.open()]) == 0:
         return
     
     # choose team
@@ -150,7 +202,7 @@ def answer_question(teams, questions):
     update_display(teams, questions)
     print("Select question:")
     for i, question in enumerate(questions):
-        if i in teams[team_index].questions_taken:
+        if teams[team_index].progress.cell(i).status == OPEN:
             print(f"{i + 1}. {question.question}")
 
     try:
@@ -162,58 +214,73 @@ def answer_question(teams, questions):
         return
     elif question_index == -1 or question_index > len(questions) - 1:
         return
+    cell = teams[team_index].progress.cell(question_index)
+    if cell.status != OPEN:
+        return
 
     # mark answer
     update_display(teams, questions)
     print(f"Markscheme: {questions[question_index].answer}")
     print("Is the answer correct? (y/n)")
     correct = input().lower() == 'y'
+    end_time = time.time()
+    gained_points = 0
     if correct:
         # calculate the time taken 
-        time_taken = int(time.time() - teams[team_index].start_times[question_index])
+        time_taken = int(end_time - cell.started)
         print(f"Time taken: {time_taken} seconds")
         
-        # display attempts
-        print(f"Total attempts: {teams[team_index].incorrect_attempts[question_index]}")
+        # display attempts, the incorrect ones so far plus this correct one
+        print(f"Total attempts: {cell.attempts + 1}")
         
         # calculate the score
-        gained_points = scoring(teams[team_index].incorrect_attempts[question_index], questions[question_index].base_score, time_taken)
-        teams[team_index].scores[question_index] += gained_points
+        gained_points = scoring(cell.attempts + 1, questions[question_index].base_score, time_taken)
         print(f"Points gained: {gained_points}")
-        
-        # mark question complete
-        teams[team_index].questions_taken.remove(question_index)
-        teams[team_index].questions_completed.add(question_index)
-        teams[team_index].end_times[question_index] = time.time()
-    else:
-        # add an incorrect attempt
-        teams[team_index].incorrect_attempts[question_index] += 1
+
+    apply_mark(teams[team_index], question_index, correct, end_time, gained_points)
+    record_action(journal, teams, "mark", team=teams[team_index].name, question=question_index, correct=correct, time=end_time, points=gained_points)
 
     input("Press enter to return")
     
 def main():
     team_file_path = "teams.csv"
     question_file_path = "questions.csv"
+    journal_file_path = "competition.journal"
     teams = configure_teams(team_file_path)
     questions = configure_questions(question_file_path)
+    bind_progress(teams, questions)
+
+    # a previous run (crash, Ctrl-C, closed terminal, or last week's competition) left its journal behind
+    journal = Journal(journal_file_path)
+    if journal.exists():
+        print(f"Resume the previous competition saved in {journal_file_path}? (y/n)")
+        if input().lower() != 'y':
+            suffix = journal.archive()
+            print(f"Previous competition archived as {journal_file_path}{suffix}")
+    state, records = journal.load()
+    replay(teams, state, records)
+    journal.open()
     
-    while True:
-        update_display(teams, questions)
-        
-        # Print the options
-        print("1. Register question taken")
-        print("2. Mark answer")
-        print("\nEnter to refresh")
-        
-        choice = input()
-        if choice == "":
-            update_display(teams, questions)
-        elif choice == "1":
-            take_question(teams, questions)
-        elif choice == "2":
-            answer_question(teams, questions)
-        else:
+    try:
+        while True:
             update_display(teams, questions)
+            
+            # Print the options
+            print("1. Register question taken")
+            print("2. Mark answer")
+            print("\nEnter to refresh")
+            
+            choice = input()
+            if choice == "":
+                update_display(teams, questions)
+            elif choice == "1":
+                take_question(teams, questions, journal)
+            elif choice == "2":
+                answer_question(teams, questions, journal)
+            else:
+                update_display(teams, questions)
+    finally:
+        journal.close()
 
 # updates leaderboard
 def update_display(teams, questions):
@@ -225,8 +292,9 @@ def update_display(teams, questions):
     print(f"-------------------------")
     print(f"Score\tTeam")
     print(f"-------------------------")
-    for team in sorted(teams, key=lambda team: team.total_score(), reverse=True):
-        print(f"{team.total_score():03d}\t{team.name}")
+    totals = teams[0].progress.matrix.totals() if teams else []
+    for i in sorted(range(len(teams)), key=lambda i: totals[i], reverse=True):
+        print(f"{totals[i]:03d}\t{teams[i].name}")
     print(f"-------------------------\n")
 
     # Print the questions currently out
@@ -234,9 +302,10 @@ def update_display(teams, questions):
     print(f"-------------------------")
     for count, team in enumerate(teams):
         print(f"{team.name}:")
-        for question_index in team.questions_taken:
+        for question_index in team.progress.open():
             question = questions[question_index]
-            print(f"{question.question} (attempt {team.incorrect_attempts[question_index]}, {int(time.time() - team.start_times[question_index])} seconds taken so far)")
+            cell = team.progress.cell(question_index)
+            print(f"{question.question} (attempt {cell.attempts + 1}, {int(time.time() - cell.started)} seconds taken so far)")
         print(f"-------------------------")
     print(f"\n", end='')
         
@@ -245,9 +314,10 @@ def update_display(teams, questions):
     print(f"-------------------------")
     for count, team in enumerate(teams):
         print(f"{team.name}:")
-        for question_index in team.questions_completed:
+        for question_index in team.progress.solved():
             question = questions[question_index]
-            print(f"{question.question} ({team.scores[question_index]} point(s), {team.incorrect_attempts[question_index]} attempt(s), {round(team.end_times[question_index] - team.start_times[question_index])} seconds taken)")
+            cell = team.progress.cell(question_index)
+            print(f"{question.question} ({cell.score} point(s), {cell.attempts} attempt(s), {round(cell.elapsed)} seconds taken)")
         print(f"-------------------------")
     print(f"\n", end='')
     
@@ -0,0 +1,138 @@
+import os
+import json
+import time
+
+class Journal:
+    """
+    Append-only journal of competition actions with periodic compact snapshots.
+
+    Every record is handed to the OS as soon as it is appended, so a Ctrl-C or a
+    crashed terminal never loses an action. fsync is batched (every `sync_every`
+    records or `sync_interval` seconds) so durability against power loss costs
+    one disk flush per batch instead of one per action.
+    """
+    def __init__(self, path, snapshot_path=None, sync_every=16, sync_interval=1.0, snapshot_every=256):
+        self.path = path
+        self.snapshot_path = snapshot_path or path + ".snapshot"
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.snapshot_every = snapshot_every
+        self.seq = 0
+        self.since_snapshot = 0
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+        self.file = None
+
+    def exists(self):
+        """
+        Returns True if a previous run left a journal or snapshot behind.
+        """
+        return os.path.exists(self.path) or os.path.exists(self.snapshot_path)
+
+    def archive(self):
+        """
+        Moves the journal and its snapshot aside under a timestamp suffix so the
+        next load starts empty. Returns the suffix used.
+        """
+        suffix = time.strftime(".%Y%m%d-%H%M%S")
+        for path in (self.path, self.snapshot_path):
+            if os.path.exists(path):
+                os.replace(path, path + suffix)
+        self.seq = 0
+        self.since_snapshot = 0
+        return suffix
+
+    def load(self):
+        """
+        Reads the latest snapshot and every journal record written after it.
+        Returns a (state, records) pair; state is None if no snapshot exists.
+        """
+        state = None
+        snapshot_seq = 0
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'r') as snapshot_file:
+                snapshot = json.load(snapshot_file)
+            snapshot_seq = snapshot["seq"]
+            state = snapshot["state"]
+
+        records = []
+        good_offset = 0
+        if os.path.exists(self.path):
+            with open(self.path, 'rb') as journal_file:
+                for line in journal_file:
+                    # a torn final line means we crashed mid-write; drop it and everything after
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break
+                    good_offset += len(line)
+                    # records already folded into the snapshot are skipped
+                    if record["seq"] > snapshot_seq:
+                        records.append(record)
+
+            # cut off the torn tail so new appends don't land behind garbage
+            if os.path.getsize(self.path) > good_offset:
+                with open(self.path, 'r+b') as journal_file:
+                    journal_file.truncate(good_offset)
+
+        self.seq = records[-1]["seq"] if records else snapshot_seq
+        self.since_snapshot = len(records)
+        return state, records
+
+    def open(self):
+        self.file = open(self.path, 'ab')
+        self.last_sync = time.monotonic()
+
+    def append(self, action, **fields):
+        """
+        Appends one action record. Returns True when a snapshot is due.
+        """
+        self.seq += 1
+        record = {"seq": self.seq, "action": action, **fields}
+        self.file.write(json.dumps(record, separators=(',', ':')).encode() + b"\n")
+        self.file.flush() # hand the record to the OS right away
+
+        self.unsynced += 1
+        self.since_snapshot += 1
+        if self.unsynced >= self.sync_every or time.monotonic() - self.last_sync >= self.sync_interval:
+            self.sync()
+
+        return self.since_snapshot >= self.snapshot_every
+
+    def sync(self):
+        if self.file is None or self.unsynced == 0:
+            return
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    def snapshot(self, state):
+        """
+        Writes a compact snapshot of the full state, then empties the journal.
+        """
+        self.sync()
+
+        # write to a temporary file and swap it in so a crash never leaves half a snapshot
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, 'w') as snapshot_file:
+            json.dump({"seq": self.seq, "state": state}, snapshot_file, separators=(',', ':'))
+            snapshot_file.flush()
+            os.fsync(snapshot_file.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+
+        # records up to self.seq now live in the snapshot; replay skips them even if we die before truncating
+        if self.file is not None:
+            self.file.truncate(0)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+        self.since_snapshot = 0
+
+    def close(self):
+        if self.file is None:
+            return
+        self.sync()
+        self.file.close()
+        self.file = None
@@ -6,13 +6,16 @@ Classes:
     Competition: Manages the entire competition.
 
 Dependencies:
+    io: Used to hand rendered leaderboard images to Discord without temporary files.
     os: Provides a way to interact with the operating system, particularly for environment variable 
         access and path operations.
     csv: Implements classes to read and write tabular data in CSV format.
+    tempfile: Used for staging exported files before upload.
     asyncio: Enables asynchronous programming, used for managing asynchronous tasks and coroutines.
     sqlite3: A built-in library for interacting with SQLite databases.
     discord: The core library for Discord bot development, enabling bot functionalities.
     relayer: A custom module for message relaying functionalities in Discord.
+    dispatch: A custom module for gating message events by channel.
     db_init: A custom module for initializing the database.
     typing: Provides support for type hints, enhancing code readability and type checking.
     os.path: Submodule of 'os' for manipulating file system paths.
@@ -20,7 +23,27 @@ Dependencies:
     discord.ext.commands: Extension of the discord.py library, simplifies command parsing and 
         handling.
     graph: A custom module for generating live leaderboard graphs
+    fast_graph: A custom module for generating the same leaderboard graphs with Pillow.
+    render_cache: A custom module for caching rendered leaderboard images by content.
+    report: A custom module for building end-of-competition team reports.
+    export: A custom module for exporting competition results to columnar files.
+    archive: A custom module for compacting and archiving finished competition databases.
+    timeline: A custom module for drawing score timelines and bar races from score events.
+    qstats: A custom module for running per-question statistics.
+    ratelimit: A custom module for limiting answer attempts per team.
+    timers: A custom module for timing open questions with time limits on the monotonic clock.
     scoring: A custom module for calculating scores.
+    ranking: A custom module for answering leaderboard rank queries in memory.
+    members: A custom module for mapping Discord members to teams.
+    status: A custom module for the live competition status snapshot.
+    progress: A custom module for the dense teams x questions progress matrix.
+    snapshot: A custom module for serving read queries from an in-memory database snapshot.
+    dashboard: A custom module for the optional local live leaderboard web page.
+    catalog: A custom module for the index of past and current competitions.
+    batch: A custom module for reading batch answer submissions.
+    profiler: A custom module for profiling commands and listeners on demand.
+    bank: A custom module for the reusable question bank and answer matchers.
+    leaderboard: A custom module for building text and embed leaderboards.
 
 Example:
     To use the Competition class, load this cog as an extension:
@@ -36,19 +59,43 @@ Note:
     Discord bot.
 """
 
+import io
 import os
 import csv
 import asyncio
 import sqlite3
+import tempfile
+from math import ceil
 from typing import Optional
 from os.path import join, dirname, abspath
 from datetime import datetime
 import discord
-from relayer import Relayer
+from relayer import ReactionRelayer, Relayer, Route
+from dispatch import Dispatcher
 from db_init import create_db
 from discord.ext import commands
-from graph import graph
+from graph import plot
+import fast_graph
+from render_cache import RenderCache
+from report import MAX_DESCRIPTION, fetch_report, report_embeds, batch_embeds, report_csv
+from export import FORMATS, export
+from archive import ARCHIVE_DIR, BUNDLE_SUFFIX, archive, load_index
+from timeline import load_timeline, line_chart, race
+from qstats import StatsBook
+from ratelimit import GuessLimiter
+from timers import TimerWheel, QuestionTimers, TimeExpired, format_duration
 from scoring import scoring
+from ranking import RankIndex
+from members import MemberIndex
+from status import StatusSnapshot
+from progress import ProgressMatrix, UNTOUCHED, OPEN, SOLVED, FORFEITED
+from snapshot import ReadSnapshot
+from dashboard import Dashboard, DASHBOARD_PORT
+from catalog import Catalog
+from batch import MAX_BATCH, parse_batch
+from profiler import Profiler
+from bank import QuestionBank, load_set, compile_questions, compile_matcher
+from leaderboard import LEADERBOARD_MODES, IMAGE_MODES, text_pages, embed_pages
 
 NOCOMP = "No active competitions. Run `!set_comp` to instantiate a competition."
 
@@ -65,14 +112,30 @@ class Comp:
         plots_path (str): Path to temporary live leaderboard files.
         competitor (dict): Tracks competitor channels.
         submitting_channels (set): Channels allowed to submit competition entries.
+        ranks (RankIndex): In-memory rank index over team totals, kept in sync with the teams table.
+        leaderboard_mode (str): How the live leaderboard is shown: 'image', 'fast', 'text' or 'embed'.
+        leaderboard_messages (list): Messages currently showing the text or embed leaderboard, edited in place.
+        leaderboard_pages (list): Page contents last sent, used to skip edits that would change nothing.
+        qstats (StatsBook): Per-question statistics, updated on every verdict.
+        relay_routes (dict): Extra relay routes beyond the moderation channel, keyed by source channel ID, with
+            None for routes that apply to every competitor channel.
+        members (MemberIndex): Maps Discord members to team IDs, for authorizing answers.
+        answering (dict): Maps (team ID, question number) to the channel the question is being answered in.
+        status (StatusSnapshot): Live per-team status, updated on every event and shown by `!status`.
+        progress (ProgressMatrix): Dense teams x questions progress, answering submit's status checks without a query.
+        reads (ReadSnapshot): In-memory snapshot of the database serving report and timeline queries.
+        matchers (dict): Maps question numbers to compiled answer checks.
+        started_at (float): Timestamp the competition was first started, or None. Batch answers to questions that
+            were never opened are timed from it.
 
     Args:
         name (str): The name of the competition.
         mod (discord.TextChannel): The Discord channel for moderation.
         res (discord.TextChannel): The Discord channel for posting results.
         path (str): File path to the competitions database.
+        mode (str): Leaderboard output mode. Default is 'image'.
     """
-    def __init__(self, name, mod, res, path) -> None:
+    def __init__(self, name, mod, res, path, mode='image') -> None:
         self.comp_name = name
         self.mod_channel = mod
         self.res_channel = res
@@ -81,6 +144,29 @@ class Comp:
         self.plots_path = str(join(dirname(dirname(abspath(__file__))), 'mathletics/plots/current_plot.png'))
         self.competitor = {} # list of competitor channels
         self.submitting_channels = set()
+        self.ranks = RankIndex()
+        self.leaderboard_mode = mode
+        self.leaderboard_messages = []
+        self.leaderboard_pages = []
+        self.qstats = StatsBook()
+        self.relay_routes = {}
+        self.members = MemberIndex()
+        self.answering = {}
+        self.status = StatusSnapshot()
+        self.progress = ProgressMatrix(0, 0)
+        self.reads = ReadSnapshot(path)
+        self.matchers = {}
+        self.started_at = None
+
+    def route_table(self) -> dict:
+        """Builds the relay routing table: every competitor channel goes to the moderation channel, then to the
+        routes shared by all competitor channels, then to its own routes.
+
+        Returns:
+            dict: Maps competitor channel IDs to tuples of Routes.
+        """
+        shared = (Route(self.mod_channel.id),) + self.relay_routes.get(None, ())
+        return {channel: shared + self.relay_routes.get(channel, ()) for channel in self.competitor}
 
 class Competition(commands.Cog):
     """
@@ -89,7 +175,17 @@ class Competition(commands.Cog):
     Attributes:
         bot (discord.ext.commands.Bot): Current instance of the Discord bot.
         relayer (Relayer): Message relayer for current bot instance. 
+        reaction_relayer (ReactionRelayer): Relays messages once they are marked with a reaction.
+        dispatcher (Dispatcher): Channel gate in front of the relayer and every message wait.
         comp (Comp): Comp class instance. Default is none. 
+        render_cache (RenderCache): Rendered leaderboard images keyed by standings and renderer.
+        guess_limiter (GuessLimiter): Per-team token buckets limiting answer attempts.
+        timer_wheel (TimerWheel): Timer wheel holding every question deadline, advanced by one background task.
+        question_timers (QuestionTimers): Start times and time limits of open questions.
+        dashboard (Dashboard): Local live leaderboard server, or None while it is off.
+        catalog (Catalog): Index of every competition, kept current by the competition lifecycle commands.
+        bank (QuestionBank): Reusable question sets.
+        profiler (Profiler): On-demand profiler wrapped around every command and listener of the cog.
 
     Args:
         bot (discord.ext.commands.Bot): Current instance of the Discord bot.
@@ -97,7 +193,136 @@ class Competition(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.relayer = Relayer(bot)
+        self.dispatcher = Dispatcher(bot)
+        self.reaction_relayer = ReactionRelayer(bot)
+        self.dispatcher.handlers.append(self.relayer.on_message)
+        self.dispatcher.handlers.append(self.reaction_relayer.on_message)
         self.comp = None
+        self.render_cache = RenderCache()
+        self.guess_limiter = GuessLimiter()
+        self.timer_wheel = TimerWheel()
+        self.question_timers = QuestionTimers(self.timer_wheel)
+        self.dashboard = None
+        self.catalog = Catalog()
+        self.bank = QuestionBank()
+        self.profiler = Profiler()
+
+    async def cog_load(self) -> None:
+        self.timer_wheel.start()
+
+    async def cog_unload(self) -> None:
+        self.timer_wheel.stop()
+        self.profiler.stop(restore=False) # the cog's listeners have already been removed
+        if self.dashboard is not None:
+            await self.dashboard.stop()
+            self.dashboard = None
+
+    async def cog_before_invoke(self, ctx) -> None:
+        self.profiler.enter(ctx, ctx.command.qualified_name)
+
+    async def cog_after_invoke(self, ctx) -> None:
+        self.profiler.exit(ctx)
+
+    def questions_changed(self, conn: sqlite3.Connection) -> None:
+        """Rebuilds everything derived from the questions table after it is replaced.
+
+        Args:
+            conn (sqlite3.Connection): Connection to the competition database.
+        """
+        self.comp.qstats = StatsBook.from_conn(conn)
+        self.comp.progress = ProgressMatrix.from_conn(conn)
+        self.comp.matchers = compile_questions(conn)
+        self.comp.reads.invalidate()
+
+    def publish_standings(self) -> None:
+        """Sends the full standings to the dashboard, if it is on. Used when the teams change wholesale."""
+        if self.dashboard is None:
+            return
+        ranks = self.comp.ranks if getattr(self, 'comp', None) is not None else RankIndex()
+        self.dashboard.load((tid, ranks.names.get(tid, f"Team {tid}"), score) for _, tid, score in ranks.standings())
+
+    def refresh_channels(self) -> None:
+        """Rebuilds the dispatcher's channel set from the competitor, relay-enabled and reaction relay channels.
+
+        Called whenever any of them changes, so the per-message check stays a single frozenset lookup.
+        """
+        channels = set(self.relayer.enabled_channels) | self.reaction_relayer.enabled_channels
+        if getattr(self, 'comp', None) is not None:
+            channels.update(self.comp.competitor)
+        self.dispatcher.set_channels(channels)
+
+    def apply_routes(self) -> None:
+        """Swaps in the competition's relay routes while it is active, or clears them otherwise, then refreshes the
+        dispatcher's channel set.
+        """
+        comp = getattr(self, 'comp', None)
+        self.relayer.set_routes(comp.route_table() if comp is not None and comp.active else {})
+        self.refresh_channels()
+
+    async def update_leaderboard(self) -> None:
+        """Refreshes the live leaderboard in the results channel using the competition's leaderboard mode.
+
+        In 'image' and 'fast' mode the results channel is cleared and a new graph is posted, drawn with matplotlib
+        or Pillow respectively. Rendered images are cached by standings, so unchanged standings are re-posted
+        without rendering. In 'text' and 'embed' mode the standings are built from the rank index and the
+        existing leaderboard messages are edited in place, one message per page; pages whose content has not
+        changed are left untouched.
+
+        Sends:
+            image: Leaderboard graph ('image' and 'fast' mode).
+            message: Leaderboard pages ('text' and 'embed' mode).
+        """
+        res_channel = self.comp.res_channel
+
+        if self.comp.leaderboard_mode in IMAGE_MODES:
+            ranks = self.comp.ranks
+            standings = [(ranks.names[tid], score) for _, tid, score in ranks.standings()]
+            key = RenderCache.key(standings, (self.comp.leaderboard_mode,))
+
+            image = self.render_cache.get(key)
+            if image is None:
+                renderer = plot if self.comp.leaderboard_mode == 'image' else fast_graph.render
+                buffer = io.BytesIO()
+                renderer([team for team, _ in standings], [score for _, score in standings], buffer)
+                image = buffer.getvalue()
+                self.render_cache.put(key, image)
+
+            await res_channel.purge(limit=5) # clear channel
+            leaderboard = discord.File(io.BytesIO(image), filename='leaderboard.png')
+            embed = discord.Embed(title='Live Leaderboard', color=0xb8eefa)
+            embed.set_image(url='attachment://leaderboard.png')
+            await res_channel.send(embed=embed, file=leaderboard)
+            return
+
+        if self.comp.leaderboard_mode == 'text':
+            pages = [{'content': content, 'embed': None} for content in text_pages(self.comp.ranks)]
+        else:
+            pages = [{'content': None, 'embed': embed} for embed in embed_pages(self.comp.ranks)]
+        keys = [page['content'] if page['embed'] is None else page['embed'].to_dict() for page in pages]
+
+        messages = self.comp.leaderboard_messages
+        if not messages:
+            await res_channel.purge(limit=5) # clear channel before the first post
+
+        for i, page in enumerate(pages):
+            if i < len(messages):
+                if i < len(self.comp.leaderboard_pages) and self.comp.leaderboard_pages[i] == keys[i]:
+                    continue # page unchanged
+                try:
+                    await messages[i].edit(**page)
+                except discord.NotFound:
+                    messages[i] = await res_channel.send(**page)
+            else:
+                messages.append(await res_channel.send(**page))
+
+        # drop pages left over from a longer leaderboard
+        for message in messages[len(pages):]:
+            try:
+                await message.delete()
+            except discord.NotFound:
+                pass
+        del messages[len(pages):]
+        self.comp.leaderboard_pages = keys
 
     @commands.command()
     async def hello(self, ctx):
@@ -114,32 +339,37 @@ class Competition(commands.Cog):
     @commands.command()
     @commands.has_role('Invigilator')
     async def status(self, ctx) -> None:
-        """Indicates competition status and outlines assigned channels.
+        """Indicates competition status, outlines assigned channels and shows every team's live progress.
 
         Args:
             ctx (commands.Context): The context (channel) in which the command is called. 
 
         Sends:
             message: Error message.
-            embed: Competition name, moderation channel, results channel, status, competitor channels.
+            embed: Competition name, moderation channel, results channel, status and question totals.
+            embed: Team pages with channels, score, solved, forfeited and open questions, batched per message.
 
         Note:
-            Only sends status when a competition is active.
+            Only sends status when a competition is active. Team pages come from the status snapshot, which is
+            updated as events happen and only re-rendered after a change.
         """
         if not hasattr(self, 'comp') or self.comp is None:
             await ctx.send("Competition has not started.") 
             return
-        embed = discord.Embed(title="Status", description=f"Competition: {self.comp.comp_name}", color=0xb8eefa)  # 0x00ff00 is a green color for "correct"
+        snapshot = self.comp.status
+        embed = discord.Embed(title="Status", description=f"Competition: {self.comp.comp_name}", color=0xb8eefa)
         embed.add_field(name="moderation channel", value=f"{self.comp.mod_channel}", inline=True)
         embed.add_field(name="results channel", value=f"{self.comp.res_channel}", inline=True)
         embed.add_field(name="active", value=f"{self.comp.active}", inline=True)
-        for pair in self.comp.competitor:
-            embed.add_field(name="competitors", value=f"{pair}", inline=True)
-        await ctx.send(embed=embed)
+        embed.add_field(name="teams", value=str(len(snapshot.teams)), inline=True)
+        embed.add_field(name="competitor channels", value=str(len(self.comp.competitor)), inline=True)
+        embed.add_field(name="questions", value=f"{snapshot.open} open · {snapshot.solved} solved · {snapshot.forfeited} forfeited", inline=True)
+        for batch in batch_embeds([embed] + snapshot.embeds()):
+            await ctx.send(embeds=batch)
         
     @commands.command()
     @commands.has_role('Invigilator')
-    async def set_comp(self, ctx, comp_name=None, mod_c: Optional[discord.TextChannel] = None, res_c: Optional[discord.TextChannel] = None) -> None:
+    async def set_comp(self, ctx, comp_name=None, mod_c: Optional[discord.TextChannel] = None, res_c: Optional[discord.TextChannel] = None, mode: str = 'image') -> None:
         """Indicates competition status and outlines assigned channels.
 
         Args:
@@ -147,6 +377,7 @@ class Competition(commands.Cog):
             comp_name (str): The name of the competition. Default is None.
             mod_c (discord.TextChannel): Competition moderation channel object. Default is None.
             res_c (discord.TextChannel): Live results channel object. Default is None.
+            mode (str): Leaderboard output mode: 'image', 'fast', 'text' or 'embed'. Default is 'image'.
 
         Sends:
             message: Argument handling error messages.
@@ -157,7 +388,7 @@ class Competition(commands.Cog):
         """
         # Argument validity checking
         if comp_name is None or mod_c is None or res_c is None:
-            await ctx.send("Usage: `!set_comp <competition name> <#moderation-channel> <#results channel>`")
+            await ctx.send(f"Usage: `!set_comp <competition name> <#moderation-channel> <#results channel> [{'|'.join(LEADERBOARD_MODES)}]`")
             return
         if not isinstance(mod_c, discord.TextChannel) or not isinstance(res_c, discord.TextChannel):
             await ctx.send("Invalid channel(s). Use Discord's typing suggestions to ensure channel validity.")
@@ -165,18 +396,24 @@ class Competition(commands.Cog):
         if mod_c == res_c:
             await ctx.send("Moderation and results channels must be different.")
             return
+        if mode not in LEADERBOARD_MODES:
+            await ctx.send(f"Invalid leaderboard mode. Choose one of: {', '.join(LEADERBOARD_MODES)}.")
+            return
         
         comp_name = datetime.now().strftime('%Y-%m-%d_') + comp_name
 
         path = str(join(dirname(dirname(abspath(__file__))), f'mathletics/comp_dbs/{comp_name}.db'))
 
-        if os.path.exists(path):
+        if self.catalog.exists(comp_name) or os.path.exists(path) or comp_name in load_index():
             await ctx.send("Competition name taken. Please select a new one.")
             return
         
         # instantiate competition class and create competition database
-        self.comp = Comp(comp_name, mod_c, res_c, path)
+        self.comp = Comp(comp_name, mod_c, res_c, path, mode)
         create_db(comp_name)
+        self.catalog.record(comp_name, 'set', location=path)
+        self.apply_routes()
+        self.publish_standings()
 
         await ctx.send(f"Competition {comp_name} created! Moderation will be done in {mod_c.mention} and results will be posted in {res_c.mention}.")
         await ctx.send("Please use `!set_questions <csv>` to add questions and `!set_teams <csv>` to add teams to the competition.")
@@ -206,25 +443,19 @@ class Competition(commands.Cog):
             return
 
         self.comp.active = True
+        if self.comp.started_at is None:
+            self.comp.started_at = datetime.now().timestamp()
+        self.catalog.record(self.comp.comp_name, 'active')
 
-        # enable message relay from competitor channels to moderation channel
+        # enable message relay from competitor channels, swapping in every route at once
+        self.apply_routes()
         for channel in self.comp.competitor:
-            await self.relayer.enable_relay(channel, self.comp.mod_channel)
             channel_obj = self.bot.get_channel(channel)
+            await channel_obj.send(f"Relaying enabled. Destination: {self.comp.mod_channel.mention}.")
             await channel_obj.send("The competition has started. Use `!submit <question number>` to start a question.")
         
         # display initial leaderboard
-        await self.comp.res_channel.purge(limit=5) # clear channel
-
-        graph(self.comp.db_path, self.comp.plots_path)
-        leaderboard = discord.File(self.comp.plots_path, filename='leaderboard.png')
-        
-        embed = discord.Embed(title='Live Leaderboard', color=0xb8eefa)
-        embed.set_image(url='attachment://leaderboard.png')
-        
-        await self.comp.res_channel.send(embed=embed, file=leaderboard)
-
-        os.remove(self.comp.plots_path)
+        await self.update_leaderboard()
 
         await ctx.send("Competition started.")
     
@@ -239,6 +470,7 @@ class Competition(commands.Cog):
         Sends:
             message: Status error messages.
             message: Confirmation messages.
+            embed: Per-team summaries, up to ten per message, with the full report attached as CSV.
 
         Note:
             Only stops comp if comp is active and is set.
@@ -251,30 +483,39 @@ class Competition(commands.Cog):
             await ctx.send("Competition has not been started.")
             return
 
-        # enable message relay from competitor channels to moderation channel
+        self.comp.active = False
+        self.question_timers.clear() # no auto-forfeits once the competition is over
+
+        # disable message relay from every competitor channel at once
+        self.apply_routes()
         for channel in self.comp.competitor:
-            await self.relayer.disable_relay(channel)
             channel_obj = self.bot.get_channel(channel)
+            await channel_obj.send("Relay disabled.")
 
             embed = discord.Embed(title="Question Overview", description=f"**The competition has ended. Congratulations on your results. You can view the leaderboard in {self.comp.res_channel.mention}.**", color=0xffff00)
             await channel_obj.send(embed=embed)
-
-        self.comp.active = False
         
         # Final Leaderboard Update
-        await self.comp.res_channel.purge(limit=5) # clear channel
-
-        # SEND PROGRESS TABLE in EMBED, SEND EACH TEAM'S SUMMARY IN A SEPARATE EMBED, SORT BY QUESTION NUMBER, DISPLAY QUESTION NUMBER, ATTEMPTS, TIME TAKEN, AND SCORE FOR EACH QUESTION. DISPLAY 'FORFEITED' IF ATTEMPTS IS LESS THAN ZERO. 
-
-        graph(self.comp.db_path, self.comp.plots_path)
-        leaderboard = discord.File(self.comp.plots_path, filename='leaderboard.png')
-        
-        embed = discord.Embed(title='Live Leaderboard', color=0xb8eefa)
-        embed.set_image(url='attachment://leaderboard.png')
-        
-        await self.comp.res_channel.send(embed=embed, file=leaderboard)
-
-        os.remove(self.comp.plots_path)
+        await self.update_leaderboard()
+
+        # Per-team summaries: one joined query on a fresh snapshot, sent as batches of embeds with the CSV on the last message
+        conn = await asyncio.to_thread(self.comp.reads.connection, 0)
+        reports = fetch_report(conn)
+
+        ranks = self.comp.ranks
+        standings = [(ranks.names.get(tid, f"Team {tid}"), score) for _, tid, score in ranks.standings()]
+        questions = conn.execute("SELECT COUNT(*) FROM questions").fetchone()[0]
+        self.catalog.record(self.comp.comp_name, 'stopped', len(standings), questions, standings)
+
+        report_file = discord.File(io.BytesIO(report_csv(reports)), filename=f'{self.comp.comp_name}_report.csv')
+        batches = batch_embeds(report_embeds(reports))
+        for i, batch in enumerate(batches):
+            if i == len(batches) - 1:
+                await self.comp.res_channel.send(embeds=batch, file=report_file)
+            else:
+                await self.comp.res_channel.send(embeds=batch)
+        if not batches: # no teams, so no embeds to attach the report to
+            await self.comp.res_channel.send(file=report_file)
 
         await self.comp.res_channel.send("The competition has ended. The final results for this section are shown above.")
 
@@ -320,6 +561,13 @@ class Competition(commands.Cog):
             tid = self.comp.competitor.get(ctx.channel.id) # Team ID
             time = 0
 
+            if tid is None:
+                await ctx.send("This channel is not a competitor channel.")
+                return
+            if not self.comp.members.authorized(ctx.author, tid):
+                await ctx.send("You are not a member of this team.")
+                return
+
             conn = sqlite3.connect(self.comp.db_path)
             c = conn.cursor()
                      
@@ -353,7 +601,7 @@ class Competition(commands.Cog):
                 return sender.author == ctx.author and sender.channel == ctx.channel
 
             try: # waiting for message
-                confirmation = await self.bot.wait_for('message', check=confirm, timeout=30.0) 
+                confirmation = await self.dispatcher.wait_for(ctx.channel.id, confirm, timeout=30.0)
             except asyncio.TimeoutError: # time out
                 await ctx.send("Command timed out.")
                 return
@@ -368,89 +616,144 @@ class Competition(commands.Cog):
                 return
 
             #enter qid, tid 
-            row = c.execute("SELECT * FROM progress WHERE qid = ? AND tid = ?", (question, tid)).fetchone()
-            if row:
-                exists = row[0]
+            # the progress matrix mirrors the progress table; teams missing from the teams table fall back to a query
+            position = self.comp.progress.locate(tid, int(question))
+            if position is not None:
+                cell = self.comp.progress.cell(*position)
+                status = cell.status
             else:
-                exists = None
-            if exists: 
-                status = c.execute("SELECT attempts FROM progress WHERE qid = ? AND tid = ?", (question, tid)).fetchone()[0]
-                if status == -1:
-                    await ctx.send("Question forfeited. Please select a different question.")
-                    return
-                elif status > 0:
-                    await ctx.send("Question already completed.")
-                    return
-            else: 
+                cell = None
+                row = c.execute("SELECT attempts FROM progress WHERE qid = ? AND tid = ?", (question, tid)).fetchone()
+                status = UNTOUCHED if row is None else OPEN if not row[0] else FORFEITED if row[0] < 0 else SOLVED
+            if status == FORFEITED:
+                await ctx.send("Question forfeited. Please select a different question.")
+                return
+            elif status == SOLVED:
+                await ctx.send("Question already completed.")
+                return
+            elif status == UNTOUCHED: 
                 # create row if doesn't exist
                 c.execute("INSERT INTO progress (qid, tid, attempts) VALUES (?, ?, 0)", (question, tid))
                 conn.commit()
-                start_time = datetime.now()
+                if cell is not None:
+                    cell.open(datetime.now().timestamp())
+                self.comp.qstats.opened(int(question))
+                self.comp.status.opened(tid, int(question))
+            elif cell is not None:
+                attempts = cell.attempts # incorrect answers already made, e.g. in a batch
+
+            key = (tid, int(question))
+            channel_id = self.comp.answering.get(key)
+            if channel_id is not None and channel_id != ctx.channel.id and self.dispatcher.waiting(channel_id):
+                await ctx.send(f"Question {question} is already being answered in <#{channel_id}>.")
+                return
+            self.comp.answering[key] = ctx.channel.id
 
-                await ctx.send(f"Timer for question {question} started.")
+            if key not in self.question_timers: # an open question from before a restart is timed from now
+                channel_id = ctx.channel.id
 
-            while correct is False:
-                await ctx.send(f"Enter your answer for question {question} or `skip` to forfeit:")
+                async def warn(remaining):
+                    await ctx.send(f"**{format_duration(remaining)} left for question {question}.**")
 
-                def verify(sender):
-                    return sender.channel == ctx.channel
+                def expire():
+                    self.dispatcher.interrupt(channel_id, TimeExpired(), tag=key)
 
-                response = await self.bot.wait_for('message', check=verify)
+                self.question_timers.start(key, on_warning=warn, on_expire=expire)
+                limit = self.question_timers.remaining(key)
+                await ctx.send(f"Timer for question {question} started." + (f" Time limit: {format_duration(limit)}." if limit is not None else ""))
 
-                if response.content.startswith('!'):
-                    await ctx.send("Answer cannot begin with `!`")
-                    await ctx.send("This response will not affect your attempts.")
-                    attempts -= 1
+            # answer check compiled when the questions were set
+            is_correct = self.comp.matchers.get(int(question))
+            if is_correct is None:
+                is_correct = compile_matcher('exact', str(c.execute("SELECT answer FROM questions WHERE id = ?", (question,)).fetchone()[0]))
 
-                attempts += 1
+            # only members of the team may answer; anyone else in the channel is ignored
+            def verify(sender):
+                return sender.channel == ctx.channel and self.comp.members.authorized(sender.author, tid)
+
+            async def next_message():
+                # an expiry while prompts or embeds were being sent had no wait to interrupt, so check first;
+                # nothing is awaited between this check and the wait being registered
+                if self.question_timers.expired(key):
+                    raise TimeExpired()
+                return await self.dispatcher.wait_for(ctx.channel.id, verify, tag=key)
+
+            # the time limit interrupts this question's pending wait, and is checked again before grading
+            prompt = True
+            try:
+                while correct is False:
+                    if prompt:
+                        await ctx.send(f"Enter your answer for question {question} or `skip` to forfeit:")
+                    prompt = True
+
+                    # rate limited messages are dropped before they cost a comparison, a write or an embed;
+                    # the team gets a single cooldown notice per cooldown
+                    while True:
+                        response = await next_message()
+                        wait = self.guess_limiter.acquire(tid)
+                        if wait == 0:
+                            break
+                        if self.guess_limiter.should_notify(tid, wait):
+                            await ctx.send(f"Too many answers. You can answer again in {ceil(wait)} seconds; answers sent before then are ignored and do not count as attempts.")
+
+                    if self.question_timers.expired(key):
+                        raise TimeExpired()
+
+                    if response.content.startswith('!'):
+                        await ctx.send("Answer cannot begin with `!`. This response will not affect your attempts.")
+                        prompt = False
+                        continue
                 
-                #if message: skip then BREAK and return, question deemed INCORRECT, cannot be re-attempted (flag: attempts = -1)
-                if response.content == 'skip':
-                    await ctx.send("You will not be able to re-attempt this question. Enter `y` to skip or any character to cancel skip:")
-                    try: # waiting for message
-                        response = await self.bot.wait_for('message', check=verify) 
-                    except asyncio.TimeoutError: # time out
-                        await ctx.send("Command timed out.")
-                        attempts -= 1
-                    
-                    if response.content == "y": 
-                        attempts = -1 
-                        await ctx.send("Question forfeited.")
-                        break
+                    #if message: skip then BREAK and return, question deemed INCORRECT, cannot be re-attempted (flag: attempts = -1)
+                    if response.content == 'skip':
+                        await ctx.send("You will not be able to re-attempt this question. Enter `y` to skip or any character to cancel skip:")
+                        response = await next_message()
+                        if response.content == "y": 
+                            attempts = -1 
+                            await ctx.send("Question forfeited.")
+                            break
+                        await ctx.send("Skip cancelled.")
+                        continue
+
+                    attempts += 1
+                    if is_correct(response.content):
+                        correct = True
+                        time = int(self.question_timers.stop(key))
+                        if cell is not None:
+                            cell.attempts = attempts
+                        self.comp.answering.pop(key, None)
+
+                        embed = discord.Embed(title="Submission Results", description=f"Question: {question}", color=0x00ff00) # 0x00ff00 is a green color for "correct"
+                        embed.add_field(name="Result", value="Correct", inline=True)
+                        embed.add_field(name="Attempts", value=f"{attempts}", inline=True)
+                        embed.add_field(name="Time", value=f"{time}", inline=True)
+                        await ctx.send(embed=embed)
+
+                        mod_embed = discord.Embed(title=f"Team {tid}", description=f"Question {question} Submission Results", color=0x00ff00) # Green for "correct"
+                        mod_embed.add_field(name="Result", value="Correct", inline=True)
+                        mod_embed.add_field(name="Attempts", value=f"{attempts}", inline=True)
+                        mod_embed.add_field(name="Time", value=f"{time}", inline=True)
+                        await self.comp.mod_channel.send(embed=mod_embed)
+
                     else:
-                        attempts -= 1
-                
-                answer = c.execute("SELECT answer FROM questions WHERE id = ?", (question)).fetchone()[0] # get answer of question
-                if response.content == answer:
-                    correct = True
-                    time = (datetime.now() - start_time).seconds
-
-                    embed = discord.Embed(title="Submission Results", description=f"Question: {question}", color=0x00ff00) # 0x00ff00 is a green color for "correct"
-                    embed.add_field(name="Result", value="Correct", inline=True)
-                    embed.add_field(name="Attempts", value=f"{attempts}", inline=True)
-                    embed.add_field(name="Time", value=f"{time}", inline=True)
-                    await ctx.send(embed=embed)
-
-                    mod_embed = discord.Embed(title=f"Team {tid}", description=f"Question {question} Submission Results", color=0x00ff00) # Green for "correct"
-                    mod_embed.add_field(name="Result", value="Correct", inline=True)
-                    mod_embed.add_field(name="Attempts", value=f"{attempts}", inline=True)
-                    mod_embed.add_field(name="Time", value=f"{time}", inline=True)
-                    await self.comp.mod_channel.send(embed=mod_embed)
-
-                else:
-                    time = (datetime.now() - start_time).seconds
-
-                    embed = discord.Embed(title="Submission Results", description=f"Question: {question}", color=0xff0000) # 0xff0000 is red for "incorrect"
-                    embed.add_field(name="Result", value="Incorrect", inline=True)
-                    embed.add_field(name="Attempts", value=str(attempts), inline=True)
-                    embed.add_field(name="Elapsed Time", value=f"{time} seconds", inline=True)
-                    await ctx.send(embed=embed)
-
-                    mod_embed = discord.Embed(title=f"Team {tid}", description=f"Question {question} Submission Results", color=0xff0000) # 0xff0000 is red, representing "incorrect"
-                    mod_embed.add_field(name="Result", value="Incorrect", inline=False)
-                    mod_embed.add_field(name="Attempts", value=str(attempts), inline=True)
-                    mod_embed.add_field(name="Elapsed Time", value=f"{time} seconds", inline=True)
-                    await self.comp.mod_channel.send(embed=mod_embed)
+                        time = int(self.question_timers.elapsed(key))
+                        if cell is not None:
+                            cell.attempts = attempts
+
+                        embed = discord.Embed(title="Submission Results", description=f"Question: {question}", color=0xff0000) # 0xff0000 is red for "incorrect"
+                        embed.add_field(name="Result", value="Incorrect", inline=True)
+                        embed.add_field(name="Attempts", value=str(attempts), inline=True)
+                        embed.add_field(name="Elapsed Time", value=f"{time} seconds", inline=True)
+                        await ctx.send(embed=embed)
+
+                        mod_embed = discord.Embed(title=f"Team {tid}", description=f"Question {question} Submission Results", color=0xff0000) # 0xff0000 is red, representing "incorrect"
+                        mod_embed.add_field(name="Result", value="Incorrect", inline=False)
+                        mod_embed.add_field(name="Attempts", value=str(attempts), inline=True)
+                        mod_embed.add_field(name="Elapsed Time", value=f"{time} seconds", inline=True)
+                        await self.comp.mod_channel.send(embed=mod_embed)
+            except TimeExpired:
+                attempts = -1
+                await ctx.send(f"**Time is up for question {question}.**")
 
             if attempts < 0:
                 # send zero summary
@@ -461,9 +764,15 @@ class Competition(commands.Cog):
                 await ctx.send(embed=embed)
 
                 # send to moderator channels
+                time = int(self.question_timers.stop(key))
+                self.comp.answering.pop(key, None)
                 c.execute("UPDATE progress SET attempts = ?, time = ? WHERE qid = ? AND tid = ?", (attempts, time, question, tid))
                 conn.commit()
                 conn.close()
+                self.comp.qstats.forfeited(int(question))
+                self.comp.status.closed(tid, int(question), solved=False)
+                if cell is not None:
+                    cell.forfeit(time)
 
                 await ctx.send("Use `!submit <question number>` to start next question.")
                 return
@@ -475,7 +784,15 @@ class Competition(commands.Cog):
             new_completed_q = completed_q + f"{question}, "
             c.execute("UPDATE teams SET completed_qid = ?, score = ? WHERE id = ?", (new_completed_q, new_score, tid))
             c.execute("UPDATE progress SET attempts = ?, time = ? WHERE qid = ? AND tid = ?", (attempts, time, question, tid))
+            c.execute("INSERT INTO score_events (tid, qid, delta, ts) VALUES (?, ?, ?, ?)", (tid, question, score, datetime.now().timestamp()))
             conn.commit()
+            self.comp.ranks.update(tid, new_score)
+            if self.dashboard is not None:
+                self.dashboard.publish(tid, new_score, self.comp.ranks.names.get(tid))
+            self.comp.qstats.solved(int(question), attempts, time)
+            self.comp.status.closed(tid, int(question), solved=True, score=new_score)
+            if cell is not None:
+                cell.solve(attempts, time, score)
 
             # send summary message
             embed = discord.Embed(title="Result", description=f"Question {question} Summary", color=0xb8eefa)
@@ -496,19 +813,720 @@ class Competition(commands.Cog):
             await self.comp.mod_channel.send(embed=mod_embed)
 
             # Update leaderboard
-            await self.comp.res_channel.purge(limit=5) # clear channel
-            graph(self.comp.db_path, self.comp.plots_path)
-            leaderboard = discord.File(self.comp.plots_path, filename='leaderboard.png')
-            embed = discord.Embed(title='Live Leaderboard', color=0xb8eefa)
-            embed.set_image(url='attachment://leaderboard.png')
-            await self.comp.res_channel.send(embed=embed, file=leaderboard)
-            os.remove(self.comp.plots_path)
+            await self.update_leaderboard()
 
             conn.close()
             await ctx.send("Use `!submit <question number>` to start next question.")
             return
         await ctx.send("Competition has Ended.")
 
+    @commands.command()
+    async def submit_batch(self, ctx) -> None:
+        """Grades an attached file of answers in one pass, for relay-style rounds.
+
+        The file is a `.csv` or `.txt` with one `question,answer` per line. Each line is one attempt at its
+        question; only the first answer to a question counts. Questions that were never opened are timed from the
+        start of the competition, open questions from when they were opened. Every result is written in one
+        transaction and reported in one summary.
+
+        Args:
+            ctx (commands.Context): The context (channel) in which the command is called.
+
+        Sends:
+            message: Status error messages.
+            embed: Batch summary to the team and the moderation channel.
+
+        Note:
+            Only available while the competition is active, from a competitor channel, to members of its team.
+            Questions being answered with `!submit` or past their time limit are skipped. Every graded line costs
+            one answer from the team's rate limit; once the limit runs out the remaining lines are skipped.
+        """
+        if not hasattr(self, 'comp') or self.comp is None or not self.comp.active:
+            await ctx.send("Competition has not started.")
+            return
+
+        tid = self.comp.competitor.get(ctx.channel.id)
+        if tid is None:
+            await ctx.send("This channel is not a competitor channel.")
+            return
+        if not self.comp.members.authorized(ctx.author, tid):
+            await ctx.send("You are not a member of this team.")
+            return
+        if ctx.channel.id in self.comp.submitting_channels or self.dispatcher.waiting(ctx.channel.id):
+            await ctx.send("The command is currently running in this channel! Please wait.")
+            return
+
+        attachments = ctx.message.attachments
+        if len(attachments) != 1 or not attachments[0].filename.lower().endswith(('.csv', '.txt')):
+            await ctx.send("Please attach one `.csv` or `.txt` file with a `question,answer` pair on each line.")
+            return
+
+        try:
+            text = (await attachments[0].read()).decode('utf-8')
+        except UnicodeDecodeError:
+            await ctx.send("The file must be UTF-8 text.")
+            return
+        pairs, unreadable, repeated = parse_batch(text, attachments[0].filename.lower().endswith('.csv'))
+        if not pairs:
+            await ctx.send("No answers found. Put one `question,answer` pair on each line.")
+            return
+        if len(pairs) > MAX_BATCH:
+            await ctx.send(f"A batch may hold at most {MAX_BATCH} answers.")
+            return
+
+        conn = sqlite3.connect(self.comp.db_path)
+        c = conn.cursor()
+        questions = dict(c.execute("SELECT id, base_score FROM questions"))
+        opened = {qid: attempts for qid, attempts in c.execute("SELECT qid, attempts FROM progress WHERE tid = ?", (tid,))}
+
+        now = datetime.now().timestamp()
+        matrix = self.comp.progress
+        results = [] # (question, outcome, score)
+        inserts, updates, events = [], [], []
+        gained = 0
+        wait = 0 # seconds until the team may answer again, once the rate limit runs out mid-batch
+        for line, (qid, response) in enumerate(pairs):
+            if qid not in questions:
+                results.append((qid, "does not exist", None))
+                continue
+            key = (tid, qid)
+            new = qid not in opened
+            if not new and opened[qid]:
+                results.append((qid, "already completed" if opened[qid] > 0 else "forfeited", None))
+                continue
+            channel_id = self.comp.answering.get(key)
+            if channel_id is not None and self.dispatcher.waiting(channel_id):
+                results.append((qid, f"being answered in <#{channel_id}>", None))
+                continue
+            if self.question_timers.expired(key):
+                results.append((qid, "time is up", None))
+                continue
+            # each graded line is one attempt, same as a `!submit` answer
+            wait = self.guess_limiter.acquire(tid)
+            if wait > 0:
+                results.extend((qid, "not graded (rate limit)", None) for qid, _ in pairs[line:])
+                break
+
+            position = matrix.locate(tid, qid)
+            cell = matrix.cell(*position) if position is not None else None
+            made = cell.attempts if cell is not None and not new else 0 # incorrect answers so far
+            if new:
+                inserts.append((qid, tid))
+                self.comp.qstats.opened(qid)
+                self.comp.status.opened(tid, qid)
+                if cell is not None:
+                    cell.open(self.comp.started_at or now)
+
+            is_correct = self.comp.matchers.get(qid) or compile_matcher('exact', str(c.execute("SELECT answer FROM questions WHERE id = ?", (qid,)).fetchone()[0]))
+            if not is_correct(response):
+                if cell is not None:
+                    cell.attempts = made + 1
+                results.append((qid, "incorrect", None))
+                continue
+
+            attempts = made + 1
+            if key in self.question_timers:
+                time = int(self.question_timers.stop(key))
+            elif cell is not None and cell.started:
+                time = int(now - cell.started)
+            else:
+                time = int(now - (self.comp.started_at or now))
+            score = scoring(attempts, questions[qid], time, verbose=False)
+            gained += score
+            updates.append((attempts, time, qid, tid))
+            events.append((tid, qid, score, now))
+            self.comp.answering.pop(key, None)
+            self.comp.qstats.solved(qid, attempts, time)
+            if cell is not None:
+                cell.solve(attempts, time, score)
+            results.append((qid, "correct", score))
+
+        # one transaction for the whole batch
+        solved = [qid for qid, outcome, _ in results if outcome == "correct"]
+        completed_q, team_score = c.execute("SELECT completed_qid, score FROM teams WHERE id = ?", (tid,)).fetchone() or ("", 0)
+        new_score = (team_score or 0) + gained
+        with conn:
+            c.executemany("INSERT INTO progress (qid, tid, attempts) VALUES (?, ?, 0)", inserts)
+            c.executemany("UPDATE progress SET attempts = ?, time = ? WHERE qid = ? AND tid = ?", updates)
+            c.executemany("INSERT INTO score_events (tid, qid, delta, ts) VALUES (?, ?, ?, ?)", events)
+            if solved:
+                c.execute("UPDATE teams SET completed_qid = ?, score = ? WHERE id = ?", ((completed_q or "") + "".join(f"{qid}, " for qid in solved), new_score, tid))
+        conn.close()
+
+        for qid in solved:
+            self.comp.status.closed(tid, qid, solved=True)
+        if solved:
+            self.comp.ranks.update(tid, new_score)
+            self.comp.status.scored(tid, new_score)
+            if self.dashboard is not None:
+                self.dashboard.publish(tid, new_score, self.comp.ranks.names.get(tid))
+
+        # one summary for the team and a copy for the moderators
+        counts = {outcome: sum(1 for _, result, _ in results if result == outcome) for outcome in ("correct", "incorrect")}
+        skipped = len(results) - counts["correct"] - counts["incorrect"]
+        lines = [f"Q{qid}: {outcome}" + (f" (+{score})" if score is not None else "") for qid, outcome, score in results]
+        if unreadable:
+            lines.append(f"{len(unreadable)} unreadable line(s) ignored")
+        if repeated:
+            lines.append(f"Repeated answers ignored for: {', '.join(f'Q{qid}' for qid in sorted(set(repeated)))}")
+        if wait > 0:
+            # first, so truncating a long summary never hides it
+            lines.insert(0, f"Too many answers. You can submit the lines that were not graded again in {ceil(wait)} seconds.")
+        description = "\n".join(lines)
+        if len(description) > MAX_DESCRIPTION:
+            description = description[:MAX_DESCRIPTION - 2] + "\n…"
+        color = 0x00ff00 if counts["correct"] else 0xff0000
+        embed = discord.Embed(title="Batch Results", description=description, color=color)
+        embed.add_field(name="Correct", value=str(counts["correct"]), inline=True)
+        embed.add_field(name="Incorrect", value=str(counts["incorrect"]), inline=True)
+        embed.add_field(name="Skipped", value=str(skipped), inline=True)
+        embed.add_field(name="Score", value=f"+{gained}", inline=True)
+        embed.add_field(name="Total Score", value=str(new_score), inline=True)
+        await ctx.send(embed=embed)
+        embed.title = f"Team {tid} Batch Results"
+        await self.comp.mod_channel.send(embed=embed)
+
+        if solved:
+            await self.update_leaderboard()
+
+    @commands.command()
+    async def rank(self, ctx, view=None, n: int = 10) -> None:
+        """Shows the calling team's rank and nearby teams, or the top of the leaderboard.
+
+        Args:
+            ctx (commands.Context): The context (channel) in which the command is called.
+            view (str): `top` to show the top of the leaderboard. Default is None.
+            n (int): Number of teams to show with `top`. Default is 10.
+
+        Sends:
+            message: Status error messages.
+            message: Leaderboard excerpt as a text table.
+
+        Note:
+            Answered from the in-memory rank index; never queries the database or renders a graph.
+        """
+        if not hasattr(self, 'comp') or self.comp is None:
+            await ctx.send(NOCOMP)
+            return
+
+        ranks = self.comp.ranks
+        if len(ranks) == 0:
+            await ctx.send("No teams have been set.")
+            return
+
+        if view == 'top':
+            n = max(1, min(n, 50))
+            await ctx.send(f"**Top {n}**\n{ranks.format(ranks.top(n))}")
+            return
+
+        tid = self.comp.competitor.get(ctx.channel.id)
+        if tid is None or tid not in ranks:
+            await ctx.send("Use `!rank` in your team channel, or `!rank top [n]` to view the top teams.")
+            return
+
+        await ctx.send(f"**{ranks.names[tid]}** is ranked **{ranks.rank(tid)}** of {len(ranks)} with {ranks.score(tid)} points.\n{ranks.format(ranks.around(tid), highlight=tid)}")
+
+    @commands.command()
+    @commands.has_role('Invigilator')
+    async def leaderboard_mode(self, ctx, mode=None) -> None:
+        """Switches how the live leaderboard is shown in the results channel.
+
+        Args:
+            ctx (commands.Context): The context (channel) in which the command is called.
+            mode (str): 'image' for the matplotlib graph, 'fast' for the Pillow graph, 'text' for a monospace table,
+                'embed' for paginated embeds.
+
+        Sends:
+            message: Status error message.
+            message: Confirmation message.
+
+        Note:
+            Only available when competition is set. The leaderboard is refreshed immediately if the competition is active.
+        """
+        if not hasattr(self, 'comp') or self.comp is None:
+            await ctx.send(NOCOMP)
+            return
+        if mode not in LEADERBOARD_MODES:
+            await ctx.send(f"Usage: `!leaderboard_mode <{'|'.join(LEADERBOARD_MODES)}>`")
+            return
+
+        self.comp.leaderboard_mode = mode
+        self.comp.leaderboard_messages = []
+        self.comp.leaderboard_pages = []
+
+        if self.comp.active:
+            await self.update_leaderboard()
+        await ctx.send(f"Leaderboard mode set to {mode}.")
+
+    @commands.command(name='dashboard')
+    @commands.has_role('Invigilator')
+    async def dashboard_command(self, ctx, state: str = None, port: int = DASHBOARD_PORT) -> None:
+        """Turns the local live leaderboard page on or off, or shows its status.
+
+        The page is served from this machine only and receives score changes as they happen.
+
+        Args:
+            ctx (commands.Context): The context (channel) in which the command is called.
+            state (str): `on` or `off`. Default shows the status.
+            port (int): Port to serve on when turning it on. Default is 8080.
+
+        Sends:
+            message: Usage, status or confirmation message.
+        """
+        if state == 'on':
+            if self.dashboard is not None:
+                await ctx.send(f"Dashboard is already running at {self.dashboard.url}")
+                return
+            dashboard = Dashboard(port=port)
+            try:
+                await dashboard.start()
+            except OSError as e:
+                await ctx.send(f"Could not start the dashboard on port {port}: {e.strerror or e}")
+                return
+            self.dashboard = dashboard
+            self.publish_standings()
+            await ctx.send(f"Dashboard running at {dashboard.url}")
+        elif state == 'off':
+            if self.dashboard is None:
+                await ctx.send("Dashboard is not running.")
+                return
+            await self.dashboard.stop()
+            self.dashboard = None
+            await ctx.send("Dashboard stopped.")
+        elif state is None and self.dashboard is not None:
+            stats = self.dashboard.stats()
+            await ctx.send(f"Dashboard running at {self.dashboard.url} · {stats['viewers']} viewers · {stats['sent']} events sent · {stats['dropped']} slow viewers dropped")
+        else:
+            await ctx.send("Usage: `!dashboard <on|off> [port]`")
+
+    @commands.command()
+    @commands.has_role('Invigilator')
+    async def profile(self, ctx, action: str = None) -> None:
+        """Profiles this module's commands and listeners while switched on, and dumps the statistics for offline
+        analysis.
+
+        Args:
+            ctx (commands.Context): The context (channel) in which the command is called.
+            action (str): `on` to start a new session, `off` to stop it, `dump` to write the statistics collected so
+                far to a pstats file. Default shows the status.
+
+        Sends:
+            message: Usage, status or confirmation message.
+            file: The pstats dump (`dump`).
+        """
+        profiler = self.profiler
+        if action == 'on':
+            if profiler.enabled:
+                await ctx.send("Profiling is already on.")
+                return
+            profiler.start(self.bot, [(event, getattr(self, method)) for event, method in self.__cog_listeners__])
+            await ctx.send("Profiling on. Statistics from the previous session were discarded.")
+            return
+        if action == 'off':
+            profiler.stop()
+            await ctx.send("Profiling off. Use `!profile dump` to save the statistics.")
+            return
+        if action == 'dump':
+            path = profiler.default_path()
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                profiler.dump(path) # on the loop thread: the profiler is active for this command
+            except ValueError:
+                await ctx.send("Nothing has been profiled yet. Use `!profile on` first.")
+                return
+            lines = [f"{calls:>6} calls {total * 1000:>10.1f} ms total {longest * 1000:>9.1f} ms max  {name}" for name, (calls, total, longest) in sorted(profiler.timings.items(), key=lambda item: -item[1][1])]
+            lines += ["", "cumulative    calls  function"]
+            lines += [f"{cumulative * 1000:>8.1f} ms {calls:>8}  {function}" for cumulative, calls, function in profiler.top(10)]
+            report = "\n".join(lines)
+            if len(report) > 1900:
+                report = report[:1900] + "\n…"
+            await ctx.send(f"Profile saved to `{path}`.\n```\n{report}\n```", file=discord.File(path))
+            return
+
+        state = f"on since {profiler.started:%H:%M:%S}" if profiler.enabled else "off"
+        await ctx.send(f"Profiling is {state}. Usage: `!profile <on|off|dump>`")
+
+    @commands.command()
+    @commands.has_role('Invigilator')
+    async def render_stats(self, ctx) -> None:
+        """Shows leaderboard image cache statistics.
+
+        Args:
+            ctx (commands.Context): The context (channel) in which the command is called.
+
+        Sends:
+            embed: Cache hits, misses, hit rate, evictions and memory use.
+        """
+        stats = self.render_cache.stats()
+        embed = discord.Embed(title="Leaderboard Render Cache", color=0xb8eefa)
+        embed.add_field(name="Hits", value=str(stats['hits']), inline=True)
+        embed.add_field(name="Misses", value=str(stats['misses']), inline=True)
+        embed.add_field(name="Hit Rate", value=f"{stats['hit_rate']:.0%}", inline=True)
+        embed.add_field(name="Entries", value=str(stats['entries']), inline=True)
+        embed.add_field(name="Evictions", value=str(stats['evictions']), inline=True)
+        embed.add_field(name="Memory", value=f"{stats['bytes'] / 1024:.0f} / {stats['max_bytes'] / 1024:.0f} KiB", inline=True)
+        await ctx.send(embed=embed)
+
+    @commands.command(name='export')
+    @commands.has_role('Invigilator')
+    async def export_results(self, ctx, fmt: str = 'parquet', comp_name: str = None) -> None:
+        """Exports a competition's teams, progress and per-question breakdown as columnar files.
+
+        Args:
+            ctx (commands.Context): The context (channel) in which the command is called.
+            fmt (str): 'parquet', 'arrow' or 'csv'. Default is 'parquet'; CSV is used if pyarrow is unavailable.
+            comp_name (str): Full name of a past competition, as listed by `!history`. Default is the current one.
+
+        Sends:
+            message: Status error message.
+            file: One exported file per table.
+
+        Note:
+            The export runs in a worker thread with chunked reads. Archived competitions are read from their bundle.
+        """
+        if fmt not in FORMATS:
+            await ctx.send(f"Usage: `!export [{'|'.join(FORMATS)}] [competition]`")
+            return
+        if comp_name is None:
+            if not hasattr(self, 'comp') or self.comp is None:
+                await ctx.send(NOCOMP)
+                return
+            comp_name, source = self.comp.comp_name, self.comp.db_path
+        else:
+            if not self.catalog.exists(comp_name):
+                await ctx.send(f"No competition named {comp_name}. Use `!history` to find one.")
+                return
+            bundle = join(ARCHIVE_DIR, comp_name + BUNDLE_SUFFIX)
+            source = bundle if os.path.exists(bundle) else str(join(dirname(dirname(abspath(__file__))), f'mathletics/comp_dbs/{comp_name}.db'))
+            if not os.path.exists(source):
+                await ctx.send(f"The database of {comp_name} is no longer on disk.")
+                return
+
+        with tempfile.TemporaryDirectory() as out_dir:
+            paths = await asyncio.to_thread(export, source, out_dir, fmt)
+            files = [discord.File(path, filename=os.path.basename(path)) for path in paths]
+            await ctx.send(f"Results for {comp_name}:", files=files)
+
+    @commands.command()
+    @commands.has_role('Invigilator')
+    async def timeline(self, ctx, view: str = 'line') -> None:
+        """Shows how the competition unfolded, as a score-over-time chart or an animated bar race.
+
+        Args:
+            ctx (commands.Context): The context (channel) in which the command is called.
+            view (str): 'line' for a step chart of every team, 'race' for an animated GIF. Default is 'line'.
+
+        Sends:
+            message: Status error message.
+            image: Timeline chart or bar-race animation.
+
+        Note:
+            Only available when competition is set. Rendering runs in a worker thread.
+        """
+        if not hasattr(self, 'comp') or self.comp is None:
+            await ctx.send(NOCOMP)
+            return
+        if view not in ('line', 'race'):
+            await ctx.send("Usage: `!timeline [line|race]`")
+            return
+
+        conn = await asyncio.to_thread(self.comp.reads.connection)
+        history = load_timeline(conn)
+        if not history.events:
+            await ctx.send("No scores have been recorded yet.")
+            return
+
+        buffer = io.BytesIO()
+        if view == 'race':
+            await asyncio.to_thread(race, history, buffer)
+            filename = 'timeline.gif'
+        else:
+            await asyncio.to_thread(line_chart, history, buffer)
+            filename = 'timeline.png'
+        buffer.seek(0)
+        await ctx.send(file=discord.File(buffer, filename=filename))
+
+    @commands.command()
+    @commands.has_role('Invigilator')
+    async def qstats(self, ctx, qid: Optional[int] = None) -> None:
+        """Shows solve rate, forfeit rate, average attempts and median solve time per question.
+
+        Args:
+            ctx (commands.Context): The context (channel) in which the command is called.
+            qid (int): Question number. Default shows every question.
+
+        Sends:
+            message: Status error message.
+            embed: Statistics for one question, or a table of every question.
+
+        Note:
+            Only available when competition is set. Reads running counters; never queries the database.
+        """
+        if not hasattr(self, 'comp') or self.comp is None:
+            await ctx.send(NOCOMP)
+            return
+
+        book = self.comp.qstats
+        if qid is not None:
+            if qid not in book.questions:
+                await ctx.send("**Chosen question does not exist!**")
+                return
+            stats = book.questions[qid]
+            embed = discord.Embed(title=f"Question {qid} Statistics", color=0xb8eefa)
+            embed.add_field(name="Opened", value=str(stats.opened), inline=True)
+            embed.add_field(name="Solved", value=str(stats.solved), inline=True)
+            embed.add_field(name="Forfeited", value=str(stats.forfeited), inline=True)
+            embed.add_field(name="Solve Rate", value=f"{stats.solve_rate:.0%}" if stats.solve_rate is not None else "-", inline=True)
+            embed.add_field(name="Average Attempts", value=f"{stats.avg_attempts:.1f}" if stats.avg_attempts is not None else "-", inline=True)
+            embed.add_field(name="Median Time", value=f"{stats.median_time:.0f} seconds" if stats.median_time is not None else "-", inline=True)
+            await ctx.send(embed=embed)
+            return
+
+        lines = book.format()
+        if len(lines) == 1:
+            await ctx.send("No questions have been set.")
+            return
+
+        # header plus up to 60 questions per embed
+        header, rows = lines[0], lines[1:]
+        embeds = [discord.Embed(title="Question Statistics", description="```\n" + "\n".join([header] + rows[i:i + 60]) + "\n```", color=0xb8eefa) for i in range(0, len(rows), 60)]
+        for batch in batch_embeds(embeds):
+            await ctx.send(embeds=batch)
+
+    @commands.command()
+    @commands.has_role('Invigilator')
+    async def set_guess_limit(self, ctx, per_minute: float = None, burst: int = None) -> None:
+        """Sets how many answers each team may submit.
+
+        Args:
+            ctx (commands.Context): The context (channel) in which the command is called.
+            per_minute (float): Sustained answers allowed per minute.
+            burst (int): Answers allowed back to back before the limit applies.
+
+        Sends:
+            message: Usage or confirmation message.
+        """
+        if per_minute is None or burst is None or per_minute <= 0 or burst < 1:
+            await ctx.send(f"Usage: `!set_guess_limit <answers per minute> <burst>` (currently {self.guess_limiter.per_minute:g} per minute, burst {self.guess_limiter.burst})")
+            return
+
+        self.guess_limiter.configure(per_minute, burst)
+        await ctx.send(f"Teams may now answer {per_minute:g} times per minute, with bursts of up to {burst}.")
+
+    @commands.command()
+    @commands.has_role('Invigilator')
+    async def set_time_limit(self, ctx, minutes: str = None, *warnings: float) -> None:
+        """Sets the time limit for each question; questions still open at the limit are forfeited.
+
+        Args:
+            ctx (commands.Context): The context (channel) in which the command is called.
+            minutes (str): Time limit in minutes, or `off` for no limit.
+            warnings (float): Remaining minutes at which teams are warned. Default is 5 and 1.
+
+        Sends:
+            message: Usage or confirmation message.
+
+        Note:
+            Applies to questions started after the command; questions already open keep their limit.
+        """
+        timers = self.question_timers
+        current = format_duration(timers.limit) if timers.limit is not None else "off"
+        usage = f"Usage: `!set_time_limit <minutes|off> [warning minutes...]` (currently {current})"
+        if minutes is None:
+            await ctx.send(usage)
+            return
+
+        if minutes.lower() == 'off':
+            timers.configure(None, timers.warnings)
+            await ctx.send("Questions no longer have a time limit.")
+            return
+
+        try:
+            limit = float(minutes) * 60
+            timers.configure(limit, tuple(warning * 60 for warning in warnings) if warnings else (300, 60))
+        except ValueError:
+            await ctx.send(usage)
+            return
+
+        notices = [format_duration(warning) for warning in timers.warnings if warning < limit]
+        await ctx.send(f"Questions now have a time limit of {format_duration(limit)}." + (f" Teams are warned with {', '.join(notices)} left." if notices else ""))
+
+    @commands.command()
+    @commands.has_role('Invigilator')
+    async def set_read_age(self, ctx, seconds: float = None) -> None:
+        """Sets how stale report and timeline queries may be; older snapshots are retaken on the next query.
+
+        Args:
+            ctx (commands.Context): The context (channel) in which the command is called.
+            seconds (float): Staleness allowed, in seconds. 0 reads the live database state on every query.
+
+        Sends:
+            message: Usage or confirmation message.
+
+        Note:
+            Only available when competition is set. Final results are always read from a fresh snapshot.
+        """
+        if not hasattr(self, 'comp') or self.comp is None:
+            await ctx.send(NOCOMP)
+            return
+
+        reads = self.comp.reads
+        if seconds is None or seconds < 0:
+            await ctx.send(f"Usage: `!set_read_age <seconds>` (currently {reads.max_age:g}s, {reads.refreshes} snapshots taken, last in {reads.last_duration * 1000:.1f} ms)")
+            return
+
+        reads.max_age = seconds
+        await ctx.send(f"Report and timeline queries may now be up to {seconds:g} seconds stale.")
+
+    @commands.command()
+    @commands.has_role('Invigilator')
+    async def add_route(self, ctx, destination: Optional[discord.TextChannel] = None, source: Optional[discord.TextChannel] = None, role: Optional[discord.Role] = None, prefix: str = '') -> None:
+        """Relays competitor chatter to an extra channel, in addition to the moderation channel.
+
+        Args:
+            ctx (commands.Context): The context (channel) in which the command is called.
+            destination (discord.TextChannel): Channel that receives relayed messages.
+            source (discord.TextChannel): Competitor channel to relay from. Default is every competitor channel.
+            role (discord.Role): Only relay messages from members with this role. Default relays every author.
+            prefix (str): Only relay messages starting with this text. Default relays every message.
+
+        Sends:
+            message: Status error or usage message.
+            message: Confirmation message.
+
+        Note:
+            Only available when competition is set. Routes take effect immediately if the competition is active.
+        """
+        if not hasattr(self, 'comp') or self.comp is None:
+            await ctx.send(NOCOMP)
+            return
+        if destination is None:
+            await ctx.send("Usage: `!add_route <#destination> [#competitor-channel] [@role] [prefix]`")
+            return
+        if source is not None and source.id not in self.comp.competitor:
+            await ctx.send(f"{source.mention} is not a competitor channel.")
+            return
+
+        key = source.id if source is not None else None
+        route = Route(destination.id, prefix, role.id if role is not None else None)
+        self.comp.relay_routes[key] = tuple(r for r in self.comp.relay_routes.get(key, ()) if r.destination != destination.id) + (route,)
+        self.apply_routes()
+
+        await ctx.send(f"Messages from {source.mention if source is not None else 'every competitor channel'} will also be relayed to {destination.mention}.")
+
+    @commands.command()
+    @commands.has_role('Invigilator')
+    async def remove_route(self, ctx, destination: Optional[discord.TextChannel] = None, source: Optional[discord.TextChannel] = None) -> None:
+        """Stops relaying competitor chatter to an extra channel.
+
+        Args:
+            ctx (commands.Context): The context (channel) in which the command is called.
+            destination (discord.TextChannel): Channel to stop relaying to.
+            source (discord.TextChannel): Competitor channel the route was added for. Default is the route shared
+                by every competitor channel.
+
+        Sends:
+            message: Status error or usage message.
+            message: Confirmation message.
+        """
+        if not hasattr(self, 'comp') or self.comp is None:
+            await ctx.send(NOCOMP)
+            return
+        if destination is None:
+            await ctx.send("Usage: `!remove_route <#destination> [#competitor-channel]`")
+            return
+
+        key = source.id if source is not None else None
+        routes = self.comp.relay_routes.get(key, ())
+        remaining = tuple(r for r in routes if r.destination != destination.id)
+        if len(remaining) == len(routes):
+            await ctx.send("No such route.")
+            return
+
+        if remaining:
+            self.comp.relay_routes[key] = remaining
+        else:
+            del self.comp.relay_routes[key]
+        self.apply_routes()
+
+        await ctx.send(f"Route to {destination.mention} removed.")
+
+    @commands.command()
+    @commands.has_role('Invigilator')
+    async def routes(self, ctx) -> None:
+        """Lists the relay routes of every competitor channel.
+
+        Args:
+            ctx (commands.Context): The context (channel) in which the command is called.
+
+        Sends:
+            message: Status error message.
+            message: One line per competitor channel with its destinations and filters.
+        """
+        if not hasattr(self, 'comp') or self.comp is None:
+            await ctx.send(NOCOMP)
+            return
+        if not self.comp.competitor:
+            await ctx.send("No competitor channels have been added.")
+            return
+
+        def describe(route):
+            filters = []
+            if route.role is not None:
+                filters.append(f"<@&{route.role}>")
+            if route.prefix:
+                filters.append(f"`{route.prefix}`…")
+            return f"<#{route.destination}>" + (f" ({', '.join(filters)})" if filters else "")
+
+        lines = [f"<#{source}> → {', '.join(describe(route) for route in targets)}" for source, targets in self.comp.route_table().items()]
+        status = "active" if self.comp.active else "applied when the competition starts"
+        await ctx.send(f"**Relay routes** ({status})\n" + "\n".join(lines))
+
+    @commands.command()
+    @commands.has_role('Invigilator')
+    async def reaction_relay(self, ctx, destination: Optional[discord.TextChannel] = None) -> None:
+        """Relays messages from this channel to another channel once someone reacts to them with ✅, or turns the
+        reaction relay in this channel off.
+
+        Args:
+            ctx (commands.Context): The context (channel) in which the command is called.
+            destination (discord.TextChannel): Channel that receives relayed messages. Default turns the reaction
+                relay off.
+
+        Sends:
+            message: Usage or confirmation message.
+        """
+        if destination is None:
+            if ctx.channel.id not in self.reaction_relayer.enabled_channels:
+                await ctx.send("Usage: `!reaction_relay <#destination>`, or `!reaction_relay` alone to turn it off.")
+                return
+            await self.reaction_relayer.disable__reaction_relay(ctx)
+        else:
+            await self.reaction_relayer.enable_reaction_relay(ctx, destination)
+        self.refresh_channels()
+
+    @commands.command()
+    @commands.has_role('Invigilator')
+    async def relay_stats(self, ctx) -> None:
+        """Shows reaction relay message cache statistics.
+
+        Args:
+            ctx (commands.Context): The context (channel) in which the command is called.
+
+        Sends:
+            embed: Cache hits, misses, hit rate, evictions and memory use.
+        """
+        stats = self.reaction_relayer.stats()
+        embed = discord.Embed(title="Reaction Relay Cache", color=0xb8eefa)
+        embed.add_field(name="Hits", value=str(stats['hits']), inline=True)
+        embed.add_field(name="Misses", value=str(stats['misses']), inline=True)
+        embed.add_field(name="Hit Rate", value=f"{stats['hit_rate']:.0%}", inline=True)
+        embed.add_field(name="Entries", value=f"{stats['entries']} / {stats['max_entries']}", inline=True)
+        embed.add_field(name="Evictions", value=str(stats['evictions']), inline=True)
+        embed.add_field(name="Memory", value=f"{stats['bytes'] / 1024:.0f} KiB", inline=True)
+        embed.add_field(name="Channels", value=str(len(self.reaction_relayer.enabled_channels)), inline=True)
+        await ctx.send(embed=embed)
+
     @commands.command()
     @commands.has_role('Invigilator')
     async def update_mod_channel(self, ctx, mod_c: discord.TextChannel) -> None:
@@ -530,6 +1548,7 @@ class Competition(commands.Cog):
             return
         
         self.comp.mod_channel = mod_c
+        self.apply_routes()
         await ctx.send(f"moderation channel updated to {mod_c.mention}.")
 
     @commands.command()
@@ -557,14 +1576,16 @@ class Competition(commands.Cog):
 
     @commands.command()
     @commands.has_role('Invigilator')
-    async def set_questions(self, ctx) -> None:
-        """Populates the competition database with uploaded questions and answers in CSV format per the following structure.
+    async def set_questions(self, ctx, set_id: Optional[int] = None) -> None:
+        """Populates the competition database with uploaded questions and answers in CSV format per the following structure,
+        or with a set from the question bank.
         
         | Question No. | Answer | Base Score |
         |--------------|--------|------------|
 
         Args:
             ctx (commands.Context): The context (channel) in which the command is called.
+            set_id (int): Question bank set to use instead of an attachment. Default is None.
 
         Sends:
             message: Status error message.
@@ -579,6 +1600,19 @@ class Competition(commands.Cog):
         if not hasattr(self, 'comp') or self.comp is None:
             await ctx.send(NOCOMP)
             return
+
+        if set_id is not None and not ctx.message.attachments:
+            # one INSERT ... SELECT from the attached bank; nothing to parse
+            conn = sqlite3.connect(self.comp.db_path)
+            count = load_set(conn, set_id, self.bank.path)
+            if count:
+                self.questions_changed(conn)
+            conn.close()
+            if not count:
+                await ctx.send(f"Question set {set_id} does not exist. Use `!bank` to list sets.")
+                return
+            await ctx.send(f"Questions set from bank set {set_id} ({count} questions).")
+            return
         
         if len(ctx.message.attachments) == 1:
             attachment = ctx.message.attachments[0]
@@ -597,6 +1631,7 @@ class Competition(commands.Cog):
                         c.execute("INSERT INTO questions (id, answer, base_score) VALUES (?, ?, ?)", question)
 
                     conn.commit()
+                    self.questions_changed(conn)
                     conn.close()
 
                     await ctx.send("Questions set.")
@@ -608,6 +1643,55 @@ class Competition(commands.Cog):
         else:
             await ctx.send("Please attach a valid `.csv` file.")
 
+    @commands.command()
+    @commands.has_role('Invigilator')
+    async def bank_add(self, ctx, *, name: str = None) -> None:
+        """Adds an uploaded CSV question set to the question bank for reuse with `!set_questions <set ID>`.
+
+        | Question No. | Answer | Base Score | Matcher (optional) | Prompt (optional) |
+        |--------------|--------|------------|--------------------|-------------------|
+
+        Matcher is `exact` (default), `text`, `number` or `regex`. Files in the CLI's format, with the question
+        prompt in the first column, are numbered in order.
+
+        Args:
+            ctx (commands.Context): The context (channel) in which the command is called.
+            name (str): Name of the set, unique in the bank.
+
+        Sends:
+            message: Usage, error or confirmation message.
+        """
+        if name is None or len(ctx.message.attachments) != 1 or not ctx.message.attachments[0].filename.endswith('.csv'):
+            await ctx.send("Usage: `!bank_add <set name>` with a `.csv` file attached.")
+            return
+
+        file = await ctx.message.attachments[0].read()
+        rows = [row for row in csv.reader(file.decode('utf-8').strip().split('\n')) if row]
+        try:
+            set_id, count, added = self.bank.add_set(name, rows)
+        except ValueError as e:
+            await ctx.send(f"Could not add the set: {e}.")
+            return
+        await ctx.send(f"Added set {set_id} `{name}` with {count} questions ({added} new to the bank, {count - added} already stored). Use `!set_questions {set_id}` to use it.")
+
+    @commands.command(name='bank')
+    @commands.has_role('Invigilator')
+    async def bank_sets(self, ctx) -> None:
+        """Lists the question sets in the bank.
+
+        Args:
+            ctx (commands.Context): The context (channel) in which the command is called.
+
+        Sends:
+            embed: Set IDs, names and question counts.
+        """
+        sets = self.bank.sets()
+        if not sets:
+            await ctx.send("The question bank is empty. Use `!bank_add <set name>` with a `.csv` file attached to add a set.")
+            return
+        lines = [f"`{set_id}` **{name}** · {count} questions · added {added[:10]}" for set_id, name, count, added in sets]
+        await ctx.send(embed=discord.Embed(title="Question Bank", description="\n".join(lines)[:MAX_DESCRIPTION], color=0xb8eefa))
+
     @commands.command()
     @commands.has_role('Invigilator')
     async def set_teams(self, ctx) -> None:
@@ -650,6 +1734,11 @@ class Competition(commands.Cog):
                         c.execute("INSERT INTO teams (id, team_name, members, completed_qid, score) VALUES (?, ?, ?, ?, ?)", team)
 
                     conn.commit()
+                    self.comp.ranks = RankIndex.from_rows(c.execute("SELECT id, team_name, score FROM teams"))
+                    self.publish_standings()
+                    self.comp.status.load(conn)
+                    self.comp.progress = ProgressMatrix.from_conn(conn)
+                    self.comp.members = MemberIndex(c.execute("SELECT id, team_name, members FROM teams"), ctx.guild.roles if ctx.guild else (), cache=self.bot.intents.members)
                     conn.close()
 
                     await ctx.send("Teams set.")
@@ -671,10 +1760,12 @@ class Competition(commands.Cog):
 
         Sends:
             message: Status error message.
-            message: Confirmation message.
+            message: Confirmation message with archive sizes.
         
         Note:
-            Only available when competition is set and has been stopped.
+            Only available when competition is set and has been stopped. The database is checkpointed, vacuumed,
+            compressed into a read-only bundle in comp_dbs/archive/ and added to the archive index; the live
+            database file is removed.
         """
         if not hasattr(self, 'comp') or self.comp is None:
             await ctx.send(NOCOMP)
@@ -689,7 +1780,7 @@ class Competition(commands.Cog):
             return sender.author == ctx.author and sender.channel == ctx.channel
 
         try: # waiting for message
-            response = await self.bot.wait_for('message', check=verify, timeout=30.0) 
+            response = await self.dispatcher.wait_for(ctx.channel.id, verify, timeout=30.0)
         except asyncio.TimeoutError: # time out
             await ctx.send("Command timed out.")
             return
@@ -698,8 +1789,44 @@ class Competition(commands.Cog):
             await ctx.send("Command cancelled.")
             return
 
+        try:
+            entry = await asyncio.to_thread(archive, self.comp.db_path)
+        except FileExistsError:
+            await ctx.send(f"An archive of {self.comp.comp_name} already exists; the competition was not ended. Move the old bundle out of the archive first.")
+            return
+        self.catalog.record(self.comp.comp_name, 'archived', entry['counts'].get('teams'), entry['counts'].get('questions'), location=entry['bundle'])
+
         del self.comp
-        await ctx.send("Competition ended.")
+        self.apply_routes()
+        await ctx.send(f"Competition ended. Archived as `{entry['bundle']}` ({entry['size'] // 1024} KiB → {entry['compressed_size'] // 1024} KiB).")
+
+    @commands.command()
+    async def history(self, ctx, *, search: str = None) -> None:
+        """Lists past and current competitions from the catalog, newest first.
+
+        Args:
+            ctx (commands.Context): The context (channel) in which the command is called.
+            search (str): Text to match against competition names, dates and podiums. Default lists the latest.
+
+        Sends:
+            embed: Matching competitions with their status, counts and podium.
+        """
+        rows = self.catalog.search(search, limit=15)
+        if not rows:
+            await ctx.send(f"No competitions match `{search}`." if search else "No competitions recorded yet.")
+            return
+
+        lines = []
+        for name, date, status, teams, questions, podium, digest in rows:
+            counts = ' · '.join(f"{count} {label}" for count, label in ((teams, 'teams'), (questions, 'questions')) if count is not None)
+            line = f"**{name}** · {status}" + (f" · {counts}" if counts else "")
+            if podium:
+                line += f"\n  {podium} (`{digest}`)"
+            if sum(len(existing) + 1 for existing in lines) + len(line) > MAX_DESCRIPTION:
+                break
+            lines.append(line)
+        title = f"Competitions matching \"{search}\"" if search else "Competitions"
+        await ctx.send(embed=discord.Embed(title=title, description="\n".join(lines), color=0xb8eefa))
 
     @commands.command()
     @commands.has_role('Invigilator')
@@ -722,6 +1849,8 @@ class Competition(commands.Cog):
             return
         
         self.comp.competitor[ctx.channel.id] = int(tid)
+        self.comp.status.map_channel(ctx.channel.id, int(tid))
+        self.apply_routes()
         await ctx.send("Competitor channel added")
         return
     
@@ -744,26 +1873,85 @@ class Competition(commands.Cog):
             await ctx.send(NOCOMP)
             return
         
-        if not ctx.channel in self.comp.competitor:
+        if not ctx.channel.id in self.comp.competitor:
             await ctx.send("Current channel is not a competitor")
             return
 
-        del(self.comp.competitor[ctx.channel])
+        del(self.comp.competitor[ctx.channel.id])
+        self.comp.status.unmap_channel(ctx.channel.id)
+        self.apply_routes()
         await ctx.send("Channel removed from competitors")
         return
     
     @commands.Cog.listener()
     async def on_message(self, message) -> None:
-        """Relays message when relayer is active.
+        """Passes every message through the dispatcher, which drops messages from irrelevant channels
+        before resolving pending waits and relaying.
 
         Args:
-            ctx (commands.Context): The context (channel) in which the command is called.
             message: Message to be relayed.
 
         Sends:
             message: Relays message to the destination channel.
         """
-        await self.relayer.on_message(message)
+        await self.dispatcher.dispatch(message)
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_add(self, payload) -> None:
+        """Relays a message marked with the relay reaction in a reaction relay channel.
+
+        Args:
+            payload (discord.RawReactionActionEvent): The raw reaction event, sent whether or not the message is cached.
+
+        Sends:
+            message: Relays message to the destination channel.
+        """
+        if payload.channel_id in self.reaction_relayer.enabled_channels: # reactions elsewhere cost one lookup
+            await self.reaction_relayer.on_raw_reaction_add(payload)
+
+    @commands.Cog.listener()
+    async def on_raw_message_edit(self, payload) -> None:
+        """Drops an edited message from the reaction relay cache, so the relay sends its new content.
+
+        Args:
+            payload (discord.RawMessageUpdateEvent): The raw edit event.
+        """
+        if payload.channel_id in self.reaction_relayer.enabled_channels:
+            await self.reaction_relayer.on_raw_message_edit(payload)
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload) -> None:
+        """Drops a deleted message from the reaction relay cache.
+
+        Args:
+            payload (discord.RawMessageDeleteEvent): The raw delete event.
+        """
+        if payload.channel_id in self.reaction_relayer.enabled_channels:
+            await self.reaction_relayer.on_raw_message_delete(payload)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before, after) -> None:
+        """Keeps the member-to-team index current when a member's roles change.
+
+        Args:
+            before (discord.Member): Member before the update.
+            after (discord.Member): Member after the update.
+
+        Note:
+            Requires the members intent.
+        """
+        if getattr(self, 'comp', None) is not None:
+            self.comp.members.on_member_update(before, after)
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role) -> None:
+        """Registers roles named after a team as soon as they are created.
+
+        Args:
+            role (discord.Role): The new role.
+        """
+        if getattr(self, 'comp', None) is not None:
+            self.comp.members.add_role(role)
 
     @commands.Cog.listener()
     async def on_command_error(self, ctx, error) -> None:
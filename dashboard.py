@@ -0,0 +1,247 @@
+"""
+Module to serve a live leaderboard page over a local HTTP server.
+
+The page opens one Server-Sent Events stream and keeps the standings itself: it receives the full standings once
+on connect and afterwards one small score event per change, so an update costs a few dozen bytes per viewer
+instead of a rendered image upload. Each event is encoded once and queued to every viewer; a viewer too slow to
+keep up is disconnected, and the browser reconnects and starts again from a fresh snapshot.
+
+Routes:
+    /: The leaderboard page.
+    /events: The event stream.
+    /standings: The current standings as JSON.
+
+Classes:
+    Dashboard: Local live leaderboard server.
+
+Dependencies:
+    json: Used for encoding events.
+    asyncio: Used for the per-viewer queues and heartbeats.
+    aiohttp: Used for the HTTP server (installed with discord.py).
+
+Example:
+    To use the Dashboard class, import it into your bot's file:
+
+    ```python
+    from dashboard import Dashboard
+    ```
+"""
+
+import json
+import asyncio
+from aiohttp import web
+
+DASHBOARD_PORT = 8080
+QUEUE_SIZE = 256 # events buffered per viewer before it is dropped as too slow
+HEARTBEAT = 15.0 # seconds between keep-alive comments on an idle stream
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Live Leaderboard</title>
+<style>
+body { background: #1e1f22; color: #b8eefa; font-family: sans-serif; margin: 2em; }
+h1 { font-size: 1.6em; }
+table { border-collapse: collapse; min-width: 24em; }
+td { padding: 0.3em 0.8em; border-bottom: 1px solid #2b2d31; }
+td.score { color: #89cadf; text-align: right; font-weight: bold; }
+tr.changed td { background: #2b3a40; }
+#state { color: #80848e; font-size: 0.8em; }
+</style>
+</head>
+<body>
+<h1>Live Leaderboard</h1>
+<table><tbody id="board"></tbody></table>
+<p id="state">connecting</p>
+<script>
+const teams = new Map();
+const board = document.getElementById("board");
+const state = document.getElementById("state");
+
+function render(changed) {
+    const rows = [...teams.values()].sort((a, b) => b.score - a.score || a.tid - b.tid);
+    let rank = 0, previous = null;
+    board.innerHTML = "";
+    rows.forEach((team, i) => {
+        if (team.score !== previous) { rank = i + 1; previous = team.score; }
+        const row = board.insertRow();
+        if (team.tid === changed) row.className = "changed";
+        row.insertCell().textContent = rank;
+        row.insertCell().textContent = team.name;
+        const score = row.insertCell();
+        score.className = "score";
+        score.textContent = team.score;
+    });
+}
+
+const events = new EventSource("events");
+events.addEventListener("snapshot", (event) => {
+    teams.clear();
+    for (const [tid, name, score] of JSON.parse(event.data)) teams.set(tid, {tid, name, score});
+    render(null);
+});
+events.addEventListener("score", (event) => {
+    const [tid, score, name] = JSON.parse(event.data);
+    const team = teams.get(tid) || {tid, name: name || "Team " + tid, score: 0};
+    team.score = score;
+    if (name) team.name = name;
+    teams.set(tid, team);
+    render(tid);
+});
+events.onopen = () => { state.textContent = "live"; };
+events.onerror = () => { state.textContent = "reconnecting"; };
+</script>
+</body>
+</html>
+"""
+
+
+class Dashboard:
+    """
+    Local live leaderboard server pushing score changes to every open page.
+
+    Attributes:
+        host (str): Interface the server listens on. Default is localhost only.
+        port (int): Port the server listens on.
+        teams (dict): Maps team IDs to [name, score].
+        viewers (set): Queues of the connected event streams.
+        sent (int): Events queued to viewers since the server started.
+        dropped (int): Viewers disconnected for falling behind.
+
+    Args:
+        host (str): Interface to listen on. Default is '127.0.0.1'.
+        port (int): Port to listen on. Default is 8080.
+    """
+    def __init__(self, host: str = '127.0.0.1', port: int = DASHBOARD_PORT) -> None:
+        self.host = host
+        self.port = port
+        self.teams = {}
+        self.viewers = set()
+        self.sent = 0
+        self.dropped = 0
+        self._runner = None
+
+        self.app = web.Application()
+        self.app.router.add_get('/', self.page)
+        self.app.router.add_get('/events', self.events)
+        self.app.router.add_get('/standings', self.standings)
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/"
+
+    async def start(self) -> None:
+        """Starts listening.
+
+        Raises:
+            OSError: The port is already in use.
+        """
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        try:
+            await site.start()
+        except OSError:
+            await self._runner.cleanup()
+            self._runner = None
+            raise
+
+    async def stop(self) -> None:
+        """Disconnects every viewer and stops the server."""
+        for queue in list(self.viewers):
+            self._close(queue)
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def load(self, rows) -> None:
+        """Replaces the standings and sends them to every viewer.
+
+        Args:
+            rows (iterable): (team ID, team name, score) rows.
+        """
+        self.teams = {tid: [name, score] for tid, name, score in rows}
+        self._broadcast(self._snapshot())
+
+    def publish(self, tid: int, score: int, name: str = None) -> None:
+        """Records a team's new total and pushes it to every viewer.
+
+        Args:
+            tid (int): Team ID.
+            score (int): New team total.
+            name (str): Team name, sent only when it is new or changed.
+        """
+        team = self.teams.get(tid)
+        if team is not None and (name is None or name == team[0]):
+            if team[1] == score:
+                return
+            team[1] = score
+            payload = [tid, score]
+        else:
+            name = name if name is not None else f"Team {tid}"
+            self.teams[tid] = [name, score]
+            payload = [tid, score, name]
+        self._broadcast(b"event: score\ndata: " + json.dumps(payload, separators=(',', ':')).encode() + b"\n\n")
+
+    def _snapshot(self) -> bytes:
+        rows = [[tid, name, score] for tid, (name, score) in self.teams.items()]
+        return b"event: snapshot\ndata: " + json.dumps(rows, separators=(',', ':')).encode() + b"\n\n"
+
+    def _broadcast(self, event: bytes) -> None:
+        # the event is encoded once; a viewer whose queue is full is cut off rather than slowing everyone down
+        for queue in list(self.viewers):
+            try:
+                queue.put_nowait(event)
+                self.sent += 1
+            except asyncio.QueueFull:
+                self.dropped += 1
+                self._close(queue)
+
+    def _close(self, queue: asyncio.Queue) -> None:
+        # discard what the viewer has not read yet and end its stream
+        self.viewers.discard(queue)
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    async def page(self, request: web.Request) -> web.Response:
+        return web.Response(text=PAGE, content_type='text/html')
+
+    async def standings(self, request: web.Request) -> web.Response:
+        rows = sorted(([tid, name, score] for tid, (name, score) in self.teams.items()), key=lambda row: (-row[2], row[0]))
+        return web.json_response(rows)
+
+    async def events(self, request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(headers={'Content-Type': 'text/event-stream', 'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+        await response.prepare(request)
+
+        queue = asyncio.Queue(QUEUE_SIZE)
+        queue.put_nowait(b"retry: 2000\n\n" + self._snapshot())
+        self.viewers.add(queue)
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), HEARTBEAT)
+                except asyncio.TimeoutError:
+                    event = b": keep-alive\n\n"
+                # everything queued while the last write was in flight goes out in one write
+                events = [event]
+                while event is not None and not queue.empty():
+                    event = queue.get_nowait()
+                    events.append(event)
+                if event is None:
+                    events.pop()
+                if events:
+                    await response.write(b"".join(events))
+                if event is None:
+                    break
+        except ConnectionResetError: # viewer closed the page
+            pass
+        finally:
+            self.viewers.discard(queue)
+        return response
+
+    def stats(self) -> dict:
+        """Returns the number of viewers, events sent and viewers dropped."""
+        return {'viewers': len(self.viewers), 'sent': self.sent, 'dropped': self.dropped}
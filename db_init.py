@@ -26,12 +26,16 @@ def create_db(name: str):
     conn = sqlite3.connect(db_path)
     c = conn.cursor()
 
+    # write-ahead logging so snapshot and report readers never block score writes; the mode persists in the file
+    c.execute("PRAGMA journal_mode=WAL")
+
     # Questions table
     c.execute('''
         CREATE TABLE IF NOT EXISTS questions (
             id INTEGER PRIMARY KEY,
             answer TEXT,
-            base_score INTEGER
+            base_score INTEGER,
+            matcher TEXT DEFAULT 'exact'
         )
     ''')
 
@@ -46,6 +50,16 @@ def create_db(name: str):
         )
     ''')
 
+    # Score events table (timestamped score deltas for timelines)
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS score_events (
+            tid INTEGER,
+            qid INTEGER,
+            delta INTEGER,
+            ts REAL
+        )
+    ''')
+
     # Teams table
     c.execute('''
         CREATE TABLE IF NOT EXISTS teams (
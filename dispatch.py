@@ -0,0 +1,134 @@
+"""
+Module to gate incoming message traffic by channel before any further work is done.
+
+Classes:
+    Dispatcher: Drops messages from channels the competition does not care about and routes the rest to message
+        handlers and pending waits.
+
+Dependencies:
+    asyncio: Used for waiting on messages with futures.
+
+Example:
+    To use the Dispatcher class, import it into your bot's file:
+
+    ```python
+    from dispatch import Dispatcher
+    ```
+"""
+
+import asyncio
+from typing import Callable, Optional
+
+class Dispatcher:
+    """
+    Central gate for message events.
+
+    Every message first has its channel ID checked against one precomputed frozenset: the competition's channels
+    plus any channel with a pending wait. Anything else is dropped after that single lookup. Relevant messages
+    resolve matching waits for their channel, then go to each registered handler.
+
+    Attributes:
+        bot (discord.ext.commands.Bot): Current instance of the Discord bot.
+        channels (frozenset): Channel IDs whose messages are processed.
+        handlers (list): Coroutine functions called with each relevant message.
+
+    Args:
+        bot (discord.ext.commands.Bot): Current instance of the Discord bot.
+    """
+    def __init__(self, bot) -> None:
+        self.bot = bot
+        self.channels = frozenset()
+        self.handlers = []
+        self._static = frozenset() # channels set by the competition
+        self._waiters = {} # channel ID -> list of (check, future, tag)
+
+    def set_channels(self, channel_ids) -> None:
+        """Replaces the competition's channel set.
+
+        Args:
+            channel_ids (iterable): Channel IDs whose messages should be processed.
+        """
+        self._static = frozenset(channel_ids)
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        # rebuilt only when channels or waits change, never per message
+        self.channels = self._static | frozenset(self._waiters)
+
+    async def wait_for(self, channel_id: int, check: Optional[Callable] = None, timeout: Optional[float] = None, tag=None):
+        """Waits for the next message in a channel that passes a check.
+
+        Args:
+            channel_id (int): Channel to listen in.
+            check (callable): Predicate on the message. Default accepts any message.
+            timeout (float): Seconds to wait. Default waits forever.
+            tag: Label that lets interrupt target this wait, e.g. the open question's key. Default is None.
+
+        Returns:
+            discord.Message: The first matching message.
+
+        Raises:
+            asyncio.TimeoutError: No matching message arrived in time.
+        """
+        future = asyncio.get_running_loop().create_future()
+        entry = (check, future, tag)
+        self._waiters.setdefault(channel_id, []).append(entry)
+        self._rebuild()
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            waiters = self._waiters.get(channel_id)
+            if waiters is not None:
+                if entry in waiters:
+                    waiters.remove(entry)
+                if not waiters:
+                    del self._waiters[channel_id]
+                    self._rebuild()
+
+    def waiting(self, channel_id: int) -> bool:
+        """Returns True if anything is waiting for a message in a channel."""
+        return channel_id in self._waiters
+
+    def interrupt(self, channel_id: int, error: BaseException, tag=None) -> None:
+        """Fails pending waits in a channel with an exception. Nothing is recorded if no wait is pending.
+
+        Args:
+            channel_id (int): Channel whose waits are interrupted.
+            error (BaseException): Exception raised from each interrupted wait_for.
+            tag: Only interrupt waits registered with this tag. Default interrupts every wait in the channel.
+        """
+        for _, future, wait_tag in self._waiters.get(channel_id, ()):
+            if tag is not None and wait_tag != tag:
+                continue
+            if not future.done():
+                future.set_exception(error)
+
+    async def dispatch(self, message) -> bool:
+        """Processes one message if it belongs to a relevant channel.
+
+        Args:
+            message (discord.Message): Incoming message.
+
+        Returns:
+            bool: False if the message was dropped by the channel gate.
+        """
+        channel_id = message.channel.id
+        if channel_id not in self.channels:
+            return False # fast path for irrelevant traffic
+        if message.author == self.bot.user:
+            return True # never react to our own prompts
+
+        waiters = self._waiters.get(channel_id)
+        if waiters:
+            for check, future, _ in list(waiters):
+                if future.done():
+                    continue
+                try:
+                    if check is None or check(message):
+                        future.set_result(message)
+                except Exception as e:
+                    future.set_exception(e)
+
+        for handler in self.handlers:
+            await handler(message)
+        return True
@@ -0,0 +1,183 @@
+"""
+Module to export competition results to columnar files.
+
+Streams the teams and progress tables and a per-question breakdown out of a competition database in fixed-size
+chunks, so memory stays bounded regardless of archive size. Writes Parquet or Arrow IPC files when pyarrow is
+installed and falls back to CSV otherwise. Archived competitions are read straight from their `.db.xz` bundles.
+
+Dependencies:
+    os: Used for output paths.
+    csv: Implements classes to write tabular data in CSV format.
+    sqlite3: Used for reading the competition database.
+    argparse: Used for the command line interface.
+    pathlib: Used for building read-only database URIs.
+    pyarrow (optional): Used for writing Parquet and Arrow IPC files.
+    scoring: A custom module for calculating scores.
+    archive: A custom module for opening archived competitions.
+
+Example:
+    To export from your bot's file:
+
+    ```python
+    from export import export
+    paths = export(db_path, out_dir, fmt='parquet')
+    ```
+
+    Or from the command line:
+
+    ```
+    python export.py comp_dbs/2023-10-02_competition.db --out exports --format parquet
+    ```
+"""
+
+import os
+import csv
+import sqlite3
+import argparse
+from pathlib import Path
+from scoring import scoring
+from archive import BUNDLE_SUFFIX, open_archive
+from report import question_status
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+except ImportError: # pyarrow is optional; CSV export still works without it
+    pa = None
+
+FORMATS = ('parquet', 'arrow', 'csv')
+EXTENSIONS = {'parquet': 'parquet', 'arrow': 'arrow', 'csv': 'csv'}
+CHUNK_SIZE = 10000
+
+# per-question breakdown: one row per opened question with the team and question it belongs to
+BREAKDOWN_QUERY = '''
+    SELECT p.tid, t.team_name, p.qid, p.attempts, p.time, q.base_score
+    FROM progress p
+    LEFT JOIN teams t ON t.id = p.tid
+    LEFT JOIN questions q ON q.id = p.qid
+    ORDER BY p.tid, p.qid
+'''
+
+# table name -> (query, [(column, arrow type name)])
+TABLES = {
+    'teams': (
+        "SELECT id, team_name, members, completed_qid, score FROM teams ORDER BY id",
+        [('id', 'int64'), ('team_name', 'string'), ('members', 'string'), ('completed_qid', 'string'), ('score', 'int64')],
+    ),
+    'progress': (
+        "SELECT qid, tid, attempts, time, completed FROM progress ORDER BY tid, qid",
+        [('qid', 'int64'), ('tid', 'int64'), ('attempts', 'int64'), ('time', 'int64'), ('completed', 'int64')],
+    ),
+    'breakdown': (
+        BREAKDOWN_QUERY,
+        [('tid', 'int64'), ('team_name', 'string'), ('qid', 'int64'), ('attempts', 'int64'), ('time', 'int64'),
+         ('base_score', 'int64'), ('score', 'int64'), ('status', 'string')],
+    ),
+}
+
+
+def _breakdown_row(row: tuple) -> tuple:
+    """Adds the question score and status to a breakdown row."""
+    tid, team_name, qid, attempts, time, base_score = row
+    status = question_status(attempts)
+    score = 0
+    if status == "Correct" and base_score is not None:
+        score = scoring(attempts, base_score, time or 0, verbose=False)
+    return (tid, team_name, qid, attempts, time, base_score, score, status)
+
+
+def _chunks(conn: sqlite3.Connection, query: str, chunk_size: int):
+    """Yields lists of at most chunk_size rows from a query."""
+    cursor = conn.execute(query)
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            return
+        yield rows
+
+
+def _write_table(conn, table: str, path: str, fmt: str, chunk_size: int) -> None:
+    """Streams one table into one output file."""
+    query, columns = TABLES[table]
+    names = [name for name, _ in columns]
+
+    if fmt == 'csv':
+        with open(path, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(names)
+            for rows in _chunks(conn, query, chunk_size):
+                if table == 'breakdown':
+                    rows = [_breakdown_row(row) for row in rows]
+                writer.writerows(rows)
+        return
+
+    schema = pa.schema([(name, getattr(pa, type_name)()) for name, type_name in columns])
+    writer = pq.ParquetWriter(path, schema) if fmt == 'parquet' else ipc.new_file(path, schema)
+    try:
+        for rows in _chunks(conn, query, chunk_size):
+            if table == 'breakdown':
+                rows = [_breakdown_row(row) for row in rows]
+            arrays = [pa.array(column, type=field.type) for column, field in zip(zip(*rows), schema)]
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+    finally:
+        writer.close()
+
+
+def export(db_path: str, out_dir: str, fmt: str = 'parquet', chunk_size: int = CHUNK_SIZE) -> list:
+    """Exports teams, progress and the per-question breakdown of a competition database.
+
+    Args:
+        db_path (str): Path to the competition database or to its archive bundle (`.db.xz`).
+        out_dir (str): Directory the files are written to. Created if missing.
+        fmt (str): 'parquet', 'arrow' or 'csv'. Falls back to 'csv' when pyarrow is not installed.
+        chunk_size (int): Rows read from SQLite per chunk. Default is 10000.
+
+    Returns:
+        list: Paths of the written files.
+
+    Raises:
+        ValueError: Unknown format.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown export format {fmt!r}; expected one of {', '.join(FORMATS)}")
+    if fmt != 'csv' and pa is None:
+        fmt = 'csv'
+
+    os.makedirs(out_dir, exist_ok=True)
+    name = os.path.basename(db_path)
+    if db_path.endswith(BUNDLE_SUFFIX):
+        name = name[:-len(BUNDLE_SUFFIX)]
+        conn = open_archive(db_path)
+    else:
+        name = os.path.splitext(name)[0]
+        # read-only so exporting never interferes with a competition still writing to the file
+        conn = sqlite3.connect(Path(db_path).resolve().as_uri() + "?mode=ro", uri=True)
+    paths = []
+    try:
+        for table in TABLES:
+            path = os.path.join(out_dir, f"{name}_{table}.{EXTENSIONS[fmt]}")
+            _write_table(conn, table, path, fmt, chunk_size)
+            paths.append(path)
+    finally:
+        conn.close()
+    return paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export competition results to Parquet, Arrow IPC or CSV.")
+    parser.add_argument('db', nargs='+', help="competition database file(s) or archive bundle(s)")
+    parser.add_argument('--out', default='exports', help="output directory (default: exports)")
+    parser.add_argument('--format', choices=FORMATS, default='parquet', help="output format (default: parquet)")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="rows read per chunk")
+    args = parser.parse_args()
+
+    if args.format != 'csv' and pa is None:
+        print("pyarrow is not installed; exporting CSV instead.")
+    for db_path in args.db:
+        for path in export(db_path, args.out, args.format, args.chunk_size):
+            print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Module to generate live leaderboard graphs with Pillow instead of matplotlib.
+
+Draws the same leaderboard as graph.graph (horizontal #89CADF bars, #B8EEFA labels in ggsans Bold, transparent
+background, 800x600 canvas) directly onto a raster image. The font is loaded once per size and every rendered
+label is cached, so redrawing a leaderboard only composites cached labels and fills rectangles.
+
+Dependencies:
+    sqlite3: Used for querying competitor scores
+    os.path: Standard Python library functions for file and directory path manipulations.
+    functools: Used to cache loaded fonts and rendered labels.
+    PIL: Pillow, used for drawing and saving the leaderboard image.
+
+Example:
+    To use the graph function, import it into your file:
+
+    ```python
+    from fast_graph import graph
+    ```
+"""
+
+import sqlite3
+from functools import lru_cache
+from os.path import join, dirname, abspath
+from PIL import Image, ImageDraw, ImageFont
+
+# font file path setup
+font_path = str(join(dirname(dirname(abspath(__file__))), 'mathletics/assets/ggsans-Bold.ttf'))
+
+# canvas geometry, matching matplotlib's figsize=(8, 6) at 100 dpi with subplots_adjust(left=0.3, top=0.8)
+WIDTH, HEIGHT = 800, 600
+AXES_LEFT, AXES_RIGHT = 0.3 * WIDTH, 0.9 * WIDTH
+AXES_TOP, AXES_BOTTOM = (1 - 0.8) * HEIGHT, (1 - 0.11) * HEIGHT
+FONT_SIZE = round(20 * 100 / 72) # 20pt at 100 dpi
+LABEL_PAD = round((10 + 3.5) * 100 / 72) # 10pt tick padding plus the (hidden) 3.5pt tick length
+BAR_HEIGHT = 0.8
+
+BAR_COLOR = '#89CADF'
+TEXT_COLOR = '#B8EEFA'
+
+
+@lru_cache(maxsize=None)
+def _font(size: int) -> ImageFont.FreeTypeFont:
+    """Loads the leaderboard font once per size."""
+    return ImageFont.truetype(font_path, size)
+
+
+@lru_cache(maxsize=1024)
+def _label(text: str, size: int = FONT_SIZE, color: str = TEXT_COLOR) -> Image.Image:
+    """Renders a text label onto a transparent image cropped to its width and the font's line height.
+
+    Args:
+        text (str): Label text.
+        size (int): Font size in pixels.
+        color (str): Text color.
+
+    Returns:
+        Image.Image: RGBA image of the label, reused across frames.
+    """
+    font = _font(size)
+    ascent, descent = font.getmetrics()
+    left, _, right, _ = font.getbbox(text, anchor='la')
+    label = Image.new('RGBA', (max(right - left, 1), ascent + descent), (0, 0, 0, 0))
+    ImageDraw.Draw(label).text((-left, 0), text, font=font, fill=color, anchor='la')
+    return label
+
+
+def _paste(canvas: Image.Image, label: Image.Image, x: float, y: float, align: str) -> None:
+    """Composites a cached label onto the canvas, vertically centred on y.
+
+    Args:
+        canvas (Image.Image): Target image.
+        label (Image.Image): Label from _label.
+        x (float): Anchor x position.
+        y (float): Vertical centre of the label.
+        align (str): 'left', 'center' or 'right' alignment relative to x.
+    """
+    if align == 'right':
+        x -= label.width
+    elif align == 'center':
+        x -= label.width / 2
+    canvas.alpha_composite(label, (round(x), round(y - label.height / 2)))
+
+
+def render(teams: list, scores: list, save_path) -> None:
+    """Draws a leaderboard from parallel team and score lists.
+
+    Args:
+        teams (list): Team names.
+        scores (list): Team totals, in the same order as teams.
+        save_path (str or file): Path or binary file object the PNG is written to.
+    """
+    # sort ascending so the leader ends up on top, as in graph.graph
+    sorted_results = sorted(zip(teams, scores), key=lambda pair: pair[1])
+
+    canvas = Image.new('RGBA', (WIDTH, HEIGHT), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(canvas)
+
+    if sorted_results:
+        sorted_teams, sorted_scores = zip(*sorted_results)
+        n = len(sorted_teams)
+        x_max = max(sorted_scores) * 1.2 or 1
+
+        # matplotlib's default 5% y margins around the bars
+        span = (n - 1) + BAR_HEIGHT
+        y_low = -BAR_HEIGHT / 2 - 0.05 * span
+        y_high = (n - 1) + BAR_HEIGHT / 2 + 0.05 * span
+
+        def to_x(value):
+            return AXES_LEFT + (value / x_max) * (AXES_RIGHT - AXES_LEFT)
+
+        def to_y(value):
+            return AXES_BOTTOM - (value - y_low) / (y_high - y_low) * (AXES_BOTTOM - AXES_TOP)
+
+        for index, (team, score) in enumerate(zip(sorted_teams, sorted_scores)):
+            top = to_y(index + BAR_HEIGHT / 2)
+            bottom = to_y(index - BAR_HEIGHT / 2)
+            centre = to_y(index)
+
+            if score > 0:
+                draw.rectangle((AXES_LEFT, round(top), round(to_x(score)), round(bottom)), fill=BAR_COLOR)
+
+            # team name left of the axes, score just past the end of the bar
+            _paste(canvas, _label(str(team)), AXES_LEFT - LABEL_PAD, centre, 'right')
+            _paste(canvas, _label(str(score)), to_x(score + 0.05 * max(sorted_scores)), centre, 'left')
+
+    # title centred on the left edge of the axes, slightly above it
+    _paste(canvas, _label("LEADERBOARD"), AXES_LEFT, AXES_TOP - 0.05 * (AXES_BOTTOM - AXES_TOP), 'center')
+
+    canvas.save(save_path, format='PNG')
+
+
+def graph(path, save_path) -> None:
+    """Generates leaderboard bar graph.
+
+    Args:
+        path (str or sqlite3.Connection): Path to competition database used for accesing points, or an open
+            connection such as a read snapshot, which is left open.
+        save_path (str or file): Path to graph folder used for saving leaderboards.
+    """
+    conn = sqlite3.connect(path) if isinstance(path, str) else path
+    c = conn.cursor()
+    rows = c.execute("SELECT team_name, score FROM teams").fetchall()
+    if conn is not path:
+        conn.close()
+
+    teams = [row[0] for row in rows]
+    scores = [row[1] for row in rows]
+    render(teams, scores, save_path)
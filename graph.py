@@ -13,6 +13,12 @@ Example:
     ```python
     from graph import graph
     ```
+
+    To draw from scores already in memory, use plot instead:
+
+    ```python
+    from graph import plot
+    ```
 """
 
 import sqlite3
@@ -25,22 +31,35 @@ font_path = str(join(dirname(dirname(abspath(__file__))), 'mathletics/assets/ggs
 font = font_manager.FontProperties(fname=font_path)
 
 
-def graph(path: str, save_path: str) -> None:
+def graph(path, save_path: str) -> None:
     """Generates leaderboard bar graph.
 
     Args:
-        path (str): Path to competition database used for accesing points.
+        path (str or sqlite3.Connection): Path to competition database used for accesing points, or an open
+            connection such as a read snapshot, which is left open.
         save_path (str): Path to graph folder used for saving leaderboards.
     """
-    conn = sqlite3.connect(path)
-    conn.row_factory = lambda cursor, row: row[0]
+    conn = sqlite3.connect(path) if isinstance(path, str) else path
     c = conn.cursor()
+    c.row_factory = lambda cursor, row: row[0]
 
     teams = c.execute("SELECT team_name FROM teams").fetchall()
     scores = c.execute("SELECT score FROM teams").fetchall()
 
-    conn.close()
-    
+    if conn is not path:
+        conn.close()
+
+    plot(teams, scores, save_path)
+
+
+def plot(teams: list, scores: list, save_path) -> None:
+    """Draws the leaderboard bar graph from parallel team and score lists.
+
+    Args:
+        teams (list): Team names.
+        scores (list): Team scores, in the same order as teams.
+        save_path (str or file): Path or binary file object the graph is saved to.
+    """
     # turn parallel lists into dict and sort by scores
     sorted_results = sorted(zip(teams, scores), key=lambda pair: pair[1])
 
@@ -0,0 +1,71 @@
+"""
+Module to build text and embed leaderboards without rendering an image.
+
+Dependencies:
+    discord.py: Used to build leaderboard embeds.
+    ranking: A custom module providing the in-memory rank index.
+
+Example:
+    To use the page builders, import them into your bot's file:
+
+    ```python
+    from leaderboard import LEADERBOARD_MODES, text_pages, embed_pages
+    ```
+"""
+
+import discord
+from ranking import RankIndex
+
+# supported leaderboard output modes; 'image' is the matplotlib graph, 'fast' the same graph drawn with Pillow
+LEADERBOARD_MODES = ('image', 'fast', 'text', 'embed')
+IMAGE_MODES = ('image', 'fast')
+
+PAGE_SIZE = 20 # teams per page; keeps each page well under Discord's 2000 character message limit
+
+
+def _page_rows(ranks: RankIndex, page_size: int) -> list:
+    """Splits the standings into pages of (rank, tid, score) rows."""
+    n = len(ranks)
+    return [ranks.slice(start, start + page_size - 1) for start in range(1, n + 1, page_size)]
+
+
+def text_pages(ranks: RankIndex, page_size: int = PAGE_SIZE) -> list:
+    """Builds the leaderboard as monospace text messages.
+
+    Args:
+        ranks (RankIndex): Rank index of the current competition.
+        page_size (int): Teams per message. Default is 20.
+
+    Returns:
+        list: Message contents, one per page.
+    """
+    pages = _page_rows(ranks, page_size)
+    if not pages:
+        return ["**LEADERBOARD**\nNo teams yet."]
+
+    contents = []
+    for number, rows in enumerate(pages, start=1):
+        header = "**LEADERBOARD**" if len(pages) == 1 else f"**LEADERBOARD** ({number}/{len(pages)})"
+        contents.append(f"{header}\n{ranks.format(rows)}")
+    return contents
+
+
+def embed_pages(ranks: RankIndex, page_size: int = PAGE_SIZE) -> list:
+    """Builds the leaderboard as Discord embeds.
+
+    Args:
+        ranks (RankIndex): Rank index of the current competition.
+        page_size (int): Teams per embed. Default is 20.
+
+    Returns:
+        list: discord.Embed objects, one per page.
+    """
+    pages = _page_rows(ranks, page_size)
+    if not pages:
+        return [discord.Embed(title='Live Leaderboard', description="No teams yet.", color=0xb8eefa)]
+
+    embeds = []
+    for number, rows in enumerate(pages, start=1):
+        title = 'Live Leaderboard' if len(pages) == 1 else f'Live Leaderboard ({number}/{len(pages)})'
+        embeds.append(discord.Embed(title=title, description=ranks.format(rows), color=0xb8eefa))
+    return embeds
@@ -3,6 +3,7 @@ Main module for the Mathletics Steward Discord bot.
 
 Environment Variables:
     DISCORD_TOKEN (str): Used to authenticate the bot with Discord's API.
+    MEMBERS_INTENT (str): Set to 0 to run without the privileged members intent. Default is on.
 
 Dependencies:
     discord.py: Used to interact with Discord's API.
@@ -28,6 +29,10 @@ DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
 intents = discord.Intents.default()
 intents.messages = True
 intents.message_content = True
+# role changes keep the member-to-team index current. Members is a privileged intent: it must also be enabled for
+# the bot in the Discord developer portal, or startup fails with PrivilegedIntentsRequired. Without it, answers are
+# authorized from the roles sent with each message instead of a cache.
+intents.members = os.getenv("MEMBERS_INTENT", "1") != "0"
 
 bot = commands.Bot(command_prefix="!", intents=intents)
 
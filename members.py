@@ -0,0 +1,175 @@
+"""
+Module to map Discord members to competition teams.
+
+Membership comes from two places: the `members` column of the teams table, which may list user IDs, mentions or
+usernames, and guild roles named after a team. Display names and global names are never used, since any member can
+set theirs to a listed member's name. Members are resolved the first time they are seen
+and cached by user ID, so authorizing a message is a single dictionary lookup. The cache relies on member update
+events (the privileged members intent); without them every message is resolved from its author's roles instead.
+
+Classes:
+    MemberIndex: Cached member-to-team index.
+
+Functions:
+    parse_members: Splits a `members` cell into user IDs and names.
+
+Dependencies:
+    re: Used for parsing member lists.
+    json: Used for member lists stored as JSON arrays.
+
+Example:
+    To use the MemberIndex class, import it into your bot's file:
+
+    ```python
+    from members import MemberIndex
+    ```
+"""
+
+import re
+import json
+from typing import Optional
+
+MENTION = re.compile(r'^<@!?(\d+)>$')
+UNKNOWN = object() # cached "belongs to no team"
+
+
+def _name_key(name: str) -> str:
+    return ' '.join(str(name).lstrip('@').split()).lower()
+
+
+def parse_members(cell) -> tuple:
+    """Splits a `members` cell into user IDs and names.
+
+    Accepts a JSON array (e.g. `[]` or `["ada", 1234]`) or names separated by commas, semicolons or line breaks, so
+    names containing spaces stay whole. Numbers and mentions are read as user IDs; anything else as a username,
+    compared case-insensitively with runs of spaces collapsed.
+
+    Args:
+        cell (str): Contents of the members column.
+
+    Returns:
+        tuple: (set of user IDs, set of normalized names).
+    """
+    if cell is None:
+        return set(), set()
+    try:
+        tokens = json.loads(cell)
+        if not isinstance(tokens, list):
+            tokens = [tokens]
+    except (TypeError, ValueError):
+        tokens = re.split(r'[,;\r\n]+', str(cell).strip('[] '))
+
+    ids, names = set(), set()
+    for token in tokens:
+        token = str(token).strip().strip('"\'')
+        if not token:
+            continue
+        mention = MENTION.match(token)
+        if mention:
+            ids.add(int(mention.group(1)))
+        elif token.isdigit():
+            ids.add(int(token))
+        else:
+            names.add(_name_key(token))
+    return ids, names
+
+
+class MemberIndex:
+    """
+    Member-to-team index built from the teams table and team roles, learned lazily and kept current on role changes.
+
+    A team with no listed members and no role has no membership information; anyone may answer for it, as before
+    this index existed.
+
+    Attributes:
+        restricted (set): Team IDs with known membership, whose answers are checked.
+
+    Args:
+        rows (iterable): (team ID, team name, members) rows from the teams table.
+        roles (iterable): Guild roles; roles named after a team (case-insensitive) grant membership. Default is none.
+        cache (bool): Cache each member's team. Pass False when member update events are not received (the members
+            intent is off), so role changes are never missed. Default is True.
+    """
+    def __init__(self, rows=(), roles=(), cache: bool = True) -> None:
+        self.restricted = set()
+        self.cache = cache
+        self._listed = {} # user ID -> team ID, from the members column
+        self._names = {} # normalized username -> team ID, from the members column
+        self._team_names = {} # lowercase team name -> team ID
+        self._roles = {} # role ID -> team ID
+        self._cache = {} # user ID -> team ID or UNKNOWN
+
+        for tid, team_name, members in rows:
+            tid = int(tid)
+            self._team_names[str(team_name).strip().lower()] = tid
+            ids, names = parse_members(members)
+            for user_id in ids:
+                self._listed[user_id] = tid
+            for name in names:
+                self._names[name] = tid
+            if ids or names:
+                self.restricted.add(tid)
+
+        for role in roles:
+            self.add_role(role)
+
+    def add_role(self, role) -> None:
+        """Registers a guild role if it is named after a team."""
+        tid = self._team_names.get(role.name.strip().lower())
+        if tid is not None:
+            self._roles[role.id] = tid
+            self.restricted.add(tid)
+            self._cache.clear() # members with this role may have been cached as unknown
+
+    def _resolve(self, member) -> Optional[int]:
+        tid = self._listed.get(member.id)
+        if tid is not None:
+            return tid
+        for role in getattr(member, 'roles', ()):
+            tid = self._roles.get(role.id)
+            if tid is None and role.name.strip().lower() in self._team_names:
+                self.add_role(role) # team role created after the index was built
+                tid = self._roles[role.id]
+            if tid is not None:
+                return tid
+        return self._names.get(_name_key(member.name)) # usernames are unique; nicknames are not
+
+    def team_of(self, member) -> Optional[int]:
+        """Returns the team ID of a member, or None if they belong to no team.
+
+        Args:
+            member (discord.Member): Message author.
+        """
+        if not self.cache:
+            return self._resolve(member)
+        tid = self._cache.get(member.id)
+        if tid is None:
+            tid = self._resolve(member)
+            self._cache[member.id] = UNKNOWN if tid is None else tid
+            return tid
+        return None if tid is UNKNOWN else tid
+
+    def authorized(self, member, tid: int) -> bool:
+        """Returns True if a member may answer for a team.
+
+        Args:
+            member (discord.Member): Message author.
+            tid (int): Team ID the answer is for.
+        """
+        if tid not in self.restricted:
+            return True
+        return self.team_of(member) == tid
+
+    def on_member_update(self, before, after) -> None:
+        """Forgets a member's cached team when their roles change, so it is resolved again on their next message.
+
+        Args:
+            before (discord.Member): Member before the update.
+            after (discord.Member): Member after the update.
+        """
+        if before.roles != after.roles or before.name != after.name:
+            self._cache.pop(after.id, None)
+
+    def forget(self, user_id: int) -> None:
+        """Forgets a member's cached team, e.g. when they leave the guild."""
+        self._cache.pop(user_id, None)
@@ -0,0 +1,184 @@
+"""
+Module to profile live commands and listeners on demand.
+
+While switched on, cProfile runs whenever at least one profiled command or listener is in flight, and statistics
+accumulate across calls until they are dumped as a pstats file (readable with `python -m pstats`, snakeviz,
+gprof2dot or flameprof). Each command and listener name also gets a call count and wall-clock totals. Because the
+event loop interleaves coroutines, work from other tasks that runs while a profiled call is suspended is included.
+
+Listeners are swapped for profiling wrappers on the bot only while profiling is on, so when it is off they run
+exactly as registered, and a command costs one attribute check in the cog's invoke hooks.
+
+Classes:
+    Profiler: Reference-counted cProfile session shared by commands and listeners.
+
+Dependencies:
+    io: Used for formatting statistics.
+    time: Used for wall-clock timings.
+    pstats: Used for reading profile statistics.
+    cProfile: The deterministic profiler.
+    os.path: Standard Python library functions for file and directory path manipulations.
+    datetime: Used for naming dump files.
+
+Example:
+    To use the Profiler class, import it into your bot's file:
+
+    ```python
+    from profiler import Profiler
+    ```
+"""
+
+import io
+import time
+import pstats
+import cProfile
+from os.path import join, dirname, abspath
+from datetime import datetime
+
+PROFILE_DIR = str(join(dirname(dirname(abspath(__file__))), 'mathletics/profiles'))
+
+
+class Profiler:
+    """
+    Reference-counted cProfile session: the profiler is enabled while any tracked call is in flight.
+
+    Attributes:
+        enabled (bool): Whether calls are being profiled.
+        started (datetime): When profiling was last switched on.
+        timings (dict): Maps command and listener names to (calls, total seconds, longest seconds).
+    """
+    def __init__(self) -> None:
+        self.enabled = False
+        self.started = None
+        self.timings = {}
+        self._profile = None
+        self._active = 0 # tracked calls in flight
+        self._open = {} # id of call key -> (name, start time)
+        self._wrapped = [] # (bot, event, listener, wrapper) swapped in while on
+
+    def start(self, bot=None, listeners=()) -> None:
+        """Starts a new profiling session, discarding the previous one's statistics.
+
+        Args:
+            bot (discord.ext.commands.Bot): Bot the listeners are registered on. Default is None.
+            listeners (iterable): (event name, registered listener) pairs to profile. Default is none.
+        """
+        if self.enabled:
+            return
+        self._profile = cProfile.Profile()
+        self.timings = {}
+        self.started = datetime.now()
+        self.enabled = True
+        for event, listener in listeners:
+            wrapper = self._wrap(listener)
+            bot.remove_listener(listener, event)
+            bot.add_listener(wrapper, event)
+            self._wrapped.append((bot, event, listener, wrapper))
+
+    def stop(self, restore: bool = True) -> None:
+        """Stops profiling, keeping the statistics collected so far for dumping.
+
+        Args:
+            restore (bool): Register the original listeners again in place of the wrappers. Pass False when the
+                cog is being removed and its listeners are already gone. Default is True.
+        """
+        for bot, event, listener, wrapper in self._wrapped:
+            bot.remove_listener(wrapper, event)
+            if restore:
+                bot.add_listener(listener, event)
+        self._wrapped = []
+        if not self.enabled:
+            return
+        self.enabled = False
+        if self._active:
+            self._profile.disable()
+        self._active = 0
+        self._open.clear()
+
+    def _wrap(self, listener):
+        name = listener.__name__
+
+        async def wrapper(*args, **kwargs):
+            key = object()
+            self.enter(key, name)
+            try:
+                return await listener(*args, **kwargs)
+            finally:
+                self.exit(key)
+        return wrapper
+
+    def enter(self, key, name: str) -> None:
+        """Marks the start of a tracked call.
+
+        Args:
+            key: Object identifying the call, e.g. the command context.
+            name (str): Command or listener name.
+        """
+        if not self.enabled:
+            return
+        self._open[id(key)] = (name, time.perf_counter())
+        if self._active == 0:
+            self._profile.enable()
+        self._active += 1
+
+    def exit(self, key) -> None:
+        """Marks the end of a tracked call started with enter; calls started before profiling was switched on are
+        ignored.
+        """
+        entry = self._open.pop(id(key), None)
+        if entry is None:
+            return
+        name, start = entry
+        elapsed = time.perf_counter() - start
+        calls, total, longest = self.timings.get(name, (0, 0.0, 0.0))
+        self.timings[name] = (calls + 1, total + elapsed, max(longest, elapsed))
+        self._active -= 1
+        if self._active == 0:
+            self._profile.disable()
+
+    def has_stats(self) -> bool:
+        return self._profile is not None and bool(self.timings)
+
+    def _stats(self) -> pstats.Stats:
+        # creating stats disables the profiler, so switch it back on if calls are in flight
+        stats = pstats.Stats(self._profile, stream=io.StringIO())
+        if self._active:
+            self._profile.enable()
+        return stats
+
+    def dump(self, path: str) -> str:
+        """Writes the statistics collected so far as a pstats file.
+
+        Args:
+            path (str): File to write.
+
+        Returns:
+            str: The path written.
+
+        Raises:
+            ValueError: Nothing has been profiled yet.
+        """
+        if not self.has_stats():
+            raise ValueError("nothing has been profiled yet")
+        self._stats().dump_stats(path)
+        return path
+
+    def top(self, limit: int = 10) -> list:
+        """Returns the functions with the most cumulative time.
+
+        Args:
+            limit (int): Functions returned. Default is 10.
+
+        Returns:
+            list: (cumulative seconds, calls, 'file:line(function)') tuples, most expensive first.
+        """
+        if not self.has_stats():
+            return []
+        rows = [(cumulative, calls, pstats.func_std_string(func)) for func, (_, calls, _, cumulative, _) in self._stats().stats.items()]
+        rows.sort(reverse=True)
+        return rows[:limit]
+
+    def default_path(self) -> str:
+        """Returns a timestamped dump path under profiles/."""
+        return join(PROFILE_DIR, datetime.now().strftime('profile_%Y-%m-%d_%H%M%S.pstats'))
+
@@ -0,0 +1,297 @@
+"""
+Module to hold competition progress as a dense teams x questions matrix.
+
+Attempts, start time, elapsed time, score and status are each one typed array with a cell per [team, question],
+stored row by row. A cell costs 21 bytes whatever its contents, so a thousand teams by a hundred questions fit in
+about 2 MiB, and whole-board operations (team totals, ranks, per-question statistics) are slices over contiguous
+or strided memory rather than walks over per-team dicts. Cells and team rows are exposed through small `__slots__`
+views that read and write the arrays in place.
+
+Classes:
+    ProgressMatrix: Dense per-team, per-question progress.
+    Cell: View of one [team, question] cell.
+    TeamRow: View of one team's row.
+
+Dependencies:
+    array: Provides the typed arrays.
+    base64: Used for serializing the arrays into JSON-friendly state.
+    sqlite3: Used for loading progress from a competition database.
+    scoring: A custom module for calculating scores.
+
+Example:
+    To use the ProgressMatrix class, import it into your bot's file:
+
+    ```python
+    from progress import ProgressMatrix, OPEN, SOLVED, FORFEITED
+    ```
+"""
+
+import base64
+import sqlite3
+from array import array
+from scoring import scoring
+
+# cell status codes
+UNTOUCHED = 0
+OPEN = 1
+SOLVED = 2
+FORFEITED = 3
+
+# array name -> typecode; elapsed time needs no more than float precision, start times are epoch seconds
+FIELDS = (('attempts', 'i'), ('started', 'd'), ('elapsed', 'f'), ('score', 'i'), ('status', 'b'))
+
+class Cell:
+    """
+    View of one [team, question] cell; attribute reads and writes go straight to the matrix arrays.
+
+    Attributes:
+        attempts (int): Answers submitted so far. An open cell counts only incorrect answers (0 when just taken),
+            a solved cell counts every answer including the correct one, matching `progress.attempts` in the
+            competition database.
+        started (float): Time the question was started.
+        elapsed (float): Seconds taken, once closed.
+        score (int): Points awarded.
+        status (int): UNTOUCHED, OPEN, SOLVED or FORFEITED.
+    """
+    __slots__ = ('_matrix', '_i')
+
+    def __init__(self, matrix: "ProgressMatrix", i: int) -> None:
+        self._matrix = matrix
+        self._i = i
+
+    def _get(name):
+        return property(lambda self: getattr(self._matrix, name)[self._i], lambda self, value: getattr(self._matrix, name).__setitem__(self._i, value))
+
+    attempts = _get('attempts')
+    started = _get('started')
+    elapsed = _get('elapsed')
+    score = _get('score')
+    status = _get('status')
+    del _get
+
+    def open(self, started: float, attempts: int = 0) -> None:
+        """Marks the question started at a time with `attempts` incorrect answers already submitted."""
+        self.status = OPEN
+        self.started = started
+        self.attempts = attempts
+        self.elapsed = 0
+        self.score = 0
+
+    def solve(self, attempts: int, elapsed: float, score: int) -> None:
+        """Marks the question answered correctly after `attempts` answers, the correct one included."""
+        self.status = SOLVED
+        self.attempts = attempts
+        self.elapsed = elapsed
+        self.score = score
+
+    def forfeit(self, elapsed: float) -> None:
+        """Marks the question forfeited."""
+        self.status = FORFEITED
+        self.elapsed = elapsed
+
+class TeamRow:
+    """
+    View of one team's row of the matrix.
+
+    Attributes:
+        matrix (ProgressMatrix): Matrix the row belongs to.
+        team (int): Row index of the team.
+    """
+    __slots__ = ('matrix', 'team')
+
+    def __init__(self, matrix: "ProgressMatrix", team: int) -> None:
+        self.matrix = matrix
+        self.team = team
+
+    def cell(self, question: int) -> Cell:
+        """Returns the view of one question of this team."""
+        return self.matrix.cell(self.team, question)
+
+    def total(self) -> int:
+        """Returns the team's total score."""
+        return sum(self.matrix.row_slice('score', self.team))
+
+    def with_status(self, status: int) -> list:
+        """Returns the question indices of this team's cells with a status, in order."""
+        return [q for q, value in enumerate(self.matrix.row_slice('status', self.team)) if value == status]
+
+    def open(self) -> list:
+        """Returns the question indices this team has open."""
+        return self.with_status(OPEN)
+
+    def solved(self) -> list:
+        """Returns the question indices this team has solved."""
+        return self.with_status(SOLVED)
+
+class ProgressMatrix:
+    """
+    Dense per-team, per-question progress, stored row by row in typed arrays.
+
+    Teams and questions are addressed by row and column index. Matrices built from a database also map team IDs
+    and question numbers to indices through `team_index` and `question_index`.
+
+    Attributes:
+        teams (int): Number of rows.
+        questions (int): Number of columns.
+        attempts (array): int32 attempts per cell.
+        started (array): float64 start time per cell.
+        elapsed (array): float32 elapsed seconds per cell.
+        score (array): int32 score per cell.
+        status (array): int8 status per cell.
+        team_ids (list): Team ID of each row, if built from IDs.
+        question_ids (list): Question number of each column, if built from IDs.
+
+    Args:
+        teams (int): Number of rows.
+        questions (int): Number of columns.
+    """
+    __slots__ = ('teams', 'questions', 'attempts', 'started', 'elapsed', 'score', 'status', 'team_ids', 'question_ids', 'team_index', 'question_index')
+
+    def __init__(self, teams: int, questions: int) -> None:
+        self.teams = teams
+        self.questions = questions
+        for name, typecode in FIELDS:
+            setattr(self, name, array(typecode, bytes(array(typecode).itemsize * teams * questions)))
+        self.team_ids = list(range(teams))
+        self.question_ids = list(range(questions))
+        self.team_index = {tid: i for i, tid in enumerate(self.team_ids)}
+        self.question_index = {qid: j for j, qid in enumerate(self.question_ids)}
+
+    @classmethod
+    def from_ids(cls, team_ids: list, question_ids: list) -> "ProgressMatrix":
+        """Creates an empty matrix with one row per team ID and one column per question number."""
+        matrix = cls(len(team_ids), len(question_ids))
+        matrix.team_ids = list(team_ids)
+        matrix.question_ids = list(question_ids)
+        matrix.team_index = {tid: i for i, tid in enumerate(matrix.team_ids)}
+        matrix.question_index = {qid: j for j, qid in enumerate(matrix.question_ids)}
+        return matrix
+
+    @classmethod
+    def from_conn(cls, conn: sqlite3.Connection) -> "ProgressMatrix":
+        """Builds the matrix of a competition database from its teams, questions and progress tables.
+
+        Args:
+            conn (sqlite3.Connection): Connection to the competition database.
+
+        Returns:
+            ProgressMatrix: One row per team and one column per question, filled from progress.
+        """
+        team_ids = [tid for (tid,) in conn.execute("SELECT id FROM teams ORDER BY id")]
+        questions = conn.execute("SELECT id, base_score FROM questions ORDER BY id").fetchall()
+        matrix = cls.from_ids(team_ids, [qid for qid, _ in questions])
+        base_scores = dict(questions)
+
+        for tid, qid, attempts, time in conn.execute("SELECT tid, qid, attempts, time FROM progress"):
+            if tid not in matrix.team_index or qid not in matrix.question_index:
+                continue
+            i = matrix.index(matrix.team_index[tid], matrix.question_index[qid])
+            if attempts is None or attempts == 0:
+                matrix.status[i] = OPEN
+            elif attempts < 0:
+                matrix.status[i] = FORFEITED
+                matrix.elapsed[i] = time or 0
+            else:
+                matrix.status[i] = SOLVED
+                matrix.attempts[i] = attempts
+                matrix.elapsed[i] = time or 0
+                matrix.score[i] = scoring(attempts, base_scores[qid], time or 0, verbose=False)
+        return matrix
+
+    def index(self, team: int, question: int) -> int:
+        """Returns the flat array index of a cell."""
+        return team * self.questions + question
+
+    def locate(self, tid, qid):
+        """Returns the (row, column) of a team ID and question number, or None if either is unknown."""
+        team = self.team_index.get(tid)
+        question = self.question_index.get(qid)
+        if team is None or question is None:
+            return None
+        return team, question
+
+    def cell(self, team: int, question: int) -> Cell:
+        """Returns the view of one cell by row and column index.
+
+        Raises:
+            IndexError: The row or column is outside the matrix; flat indexing would otherwise reach into another
+                team's row.
+        """
+        if not (0 <= team < self.teams and 0 <= question < self.questions):
+            raise IndexError(f"cell ({team}, {question}) is outside a {self.teams} x {self.questions} matrix")
+        return Cell(self, self.index(team, question))
+
+    def row(self, team: int) -> TeamRow:
+        """Returns the view of one team's row."""
+        return TeamRow(self, team)
+
+    def copy_row(self, source: "ProgressMatrix", source_team: int, team: int) -> None:
+        """Copies one team's row from another matrix, over the questions both have in common."""
+        width = min(self.questions, source.questions)
+        start, source_start = team * self.questions, source_team * source.questions
+        for name, _ in FIELDS:
+            getattr(self, name)[start:start + width] = getattr(source, name)[source_start:source_start + width]
+
+    def row_slice(self, name: str, team: int) -> array:
+        """Returns a copy of one team's values of a field."""
+        start = team * self.questions
+        return getattr(self, name)[start:start + self.questions]
+
+    def column_slice(self, name: str, question: int) -> array:
+        """Returns a copy of one question's values of a field, one per team."""
+        return getattr(self, name)[question::self.questions]
+
+    def totals(self) -> list:
+        """Returns every team's total score, in row order."""
+        score, width = self.score, self.questions
+        return [sum(score[start:start + width]) for start in range(0, len(score), width)] if width else [0] * self.teams
+
+    def ranks(self) -> list:
+        """Returns every team's competition rank (ties share a rank), in row order."""
+        totals = self.totals()
+        order = sorted(range(self.teams), key=lambda team: -totals[team])
+        ranks = [0] * self.teams
+        for position, team in enumerate(order):
+            previous = order[position - 1] if position else None
+            ranks[team] = ranks[previous] if previous is not None and totals[previous] == totals[team] else position + 1
+        return ranks
+
+    def question_stats(self, question: int) -> dict:
+        """Summarises one question over every team.
+
+        Returns:
+            dict: opened, solved and forfeited counts, and the average attempts and time of solves (None without
+                solves).
+        """
+        status = self.column_slice('status', question)
+        attempts = self.column_slice('attempts', question)
+        elapsed = self.column_slice('elapsed', question)
+        solved = [team for team, value in enumerate(status) if value == SOLVED]
+        return {
+            'opened': len(status) - status.count(UNTOUCHED),
+            'solved': len(solved),
+            'forfeited': status.count(FORFEITED),
+            'avg_attempts': sum(attempts[team] for team in solved) / len(solved) if solved else None,
+            'avg_time': sum(elapsed[team] for team in solved) / len(solved) if solved else None,
+        }
+
+    def nbytes(self) -> int:
+        """Returns the memory held by the arrays."""
+        return sum(len(getattr(self, name)) * getattr(self, name).itemsize for name, _ in FIELDS)
+
+    def state(self) -> dict:
+        """Returns a JSON-friendly copy of the matrix, with each array base64 encoded."""
+        state = {'teams': self.teams, 'questions': self.questions, 'team_ids': self.team_ids, 'question_ids': self.question_ids}
+        for name, _ in FIELDS:
+            state[name] = base64.b64encode(getattr(self, name).tobytes()).decode('ascii')
+        return state
+
+    @classmethod
+    def from_state(cls, state: dict) -> "ProgressMatrix":
+        """Rebuilds a matrix from ProgressMatrix.state."""
+        matrix = cls.from_ids(state['team_ids'], state['question_ids'])
+        for name, typecode in FIELDS:
+            values = array(typecode)
+            values.frombytes(base64.b64decode(state[name]))
+            setattr(matrix, name, values)
+        return matrix
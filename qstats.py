@@ -0,0 +1,240 @@
+"""
+Module to keep running per-question statistics for a competition.
+
+Classes:
+    P2Quantile: Bounded-memory streaming quantile estimator (the P-square algorithm of Jain and Chlamtac).
+    QuestionStats: Counters and a solve-time quantile sketch for one question.
+    StatsBook: Per-question statistics for a whole competition.
+
+Dependencies:
+    bisect: Used to keep the first few observations sorted.
+    sqlite3: Used for rebuilding statistics from the progress table.
+
+Example:
+    To use the StatsBook class, import it into your bot's file:
+
+    ```python
+    from qstats import StatsBook
+    ```
+"""
+
+import sqlite3
+from bisect import insort
+from typing import Optional
+
+class P2Quantile:
+    """
+    Streaming estimate of one quantile, updated in O(1) time and memory per observation.
+
+    The first `exact` observations are kept and the quantile is computed exactly from them. After that the
+    five P-square markers are seeded from the sample and the buffer is dropped.
+
+    Args:
+        p (float): Quantile to track, strictly between 0 and 1. Default is 0.5 (the median).
+        exact (int): Observations kept exactly before switching to the sketch. Default is 64.
+    """
+    __slots__ = ('p', 'exact', 'count', 'sample', 'heights', 'positions', 'desired', 'increments')
+
+    def __init__(self, p: float = 0.5, exact: int = 64) -> None:
+        self.p = p
+        self.exact = max(exact, 5)
+        self.count = 0
+        self.sample = [] # sorted observations while count <= exact
+        self.heights = None # marker heights q0..q4
+        self.positions = None # marker positions n0..n4
+        self.desired = None # desired marker positions
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def _seed(self) -> None:
+        """Places the five markers on the exact sample."""
+        last = len(self.sample) - 1
+        self.desired = [last * increment for increment in self.increments]
+        # markers must sit on distinct observations, which rounding alone does not give for extreme p
+        positions = [0] * 5
+        for i in range(1, 5):
+            positions[i] = max(round(self.desired[i]), positions[i - 1] + 1)
+        positions[4] = last
+        for i in (3, 2, 1):
+            positions[i] = min(positions[i], positions[i + 1] - 1)
+        self.positions = positions
+        self.heights = [self.sample[i] for i in self.positions]
+        self.sample = None
+
+    def add(self, x: float) -> None:
+        """Adds one observation.
+
+        Args:
+            x (float): Observed value.
+        """
+        self.count += 1
+        if self.sample is not None:
+            if self.count <= self.exact:
+                insort(self.sample, x)
+                return
+            self._seed()
+
+        # find the cell containing x, stretching the extreme markers if needed
+        q = self.heights
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        n = self.positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        # nudge the three middle markers towards their desired positions
+        for i in (1, 2, 3):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                parabolic = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if q[i - 1] < parabolic < q[i + 1]:
+                    q[i] = parabolic
+                else:
+                    q[i] = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                n[i] += d
+
+    def value(self) -> Optional[float]:
+        """Returns the current quantile, or None before the first observation."""
+        if self.count == 0:
+            return None
+        if self.sample is not None:
+            # exact, interpolating between the two nearest observations
+            pos = self.p * (self.count - 1)
+            low = int(pos)
+            high = min(low + 1, self.count - 1)
+            return self.sample[low] + (pos - low) * (self.sample[high] - self.sample[low])
+        return self.heights[2]
+
+class QuestionStats:
+    """
+    Running statistics for one question.
+
+    Attributes:
+        qid (int): Question number.
+        opened (int): Teams that started the question.
+        solved (int): Teams that answered correctly.
+        forfeited (int): Teams that skipped the question.
+        attempts (int): Total attempts over solved questions.
+        time (int): Total solve time in seconds over solved questions.
+        median (P2Quantile): Streaming median of solve times.
+    """
+    __slots__ = ('qid', 'opened', 'solved', 'forfeited', 'attempts', 'time', 'median')
+
+    def __init__(self, qid: int) -> None:
+        self.qid = qid
+        self.opened = 0
+        self.solved = 0
+        self.forfeited = 0
+        self.attempts = 0
+        self.time = 0
+        self.median = P2Quantile(0.5)
+
+    @property
+    def solve_rate(self) -> Optional[float]:
+        return self.solved / self.opened if self.opened else None
+
+    @property
+    def forfeit_rate(self) -> Optional[float]:
+        return self.forfeited / self.opened if self.opened else None
+
+    @property
+    def avg_attempts(self) -> Optional[float]:
+        return self.attempts / self.solved if self.solved else None
+
+    @property
+    def median_time(self) -> Optional[float]:
+        return self.median.value()
+
+class StatsBook:
+    """
+    Per-question statistics for a competition, updated on every verdict.
+
+    Attributes:
+        questions (dict): Maps question numbers to QuestionStats.
+    """
+    def __init__(self) -> None:
+        self.questions = {}
+
+    def get(self, qid: int) -> QuestionStats:
+        """Returns the statistics of a question, creating them if needed."""
+        stats = self.questions.get(qid)
+        if stats is None:
+            stats = self.questions[qid] = QuestionStats(qid)
+        return stats
+
+    def opened(self, qid: int) -> None:
+        """Records a team starting a question."""
+        self.get(qid).opened += 1
+
+    def solved(self, qid: int, attempts: int, time: int) -> None:
+        """Records a correct answer.
+
+        Args:
+            qid (int): Question number.
+            attempts (int): Attempts taken, including the correct one.
+            time (int): Solve time in seconds.
+        """
+        stats = self.get(qid)
+        stats.solved += 1
+        stats.attempts += attempts
+        stats.time += time
+        stats.median.add(time)
+
+    def forfeited(self, qid: int) -> None:
+        """Records a team forfeiting a question."""
+        self.get(qid).forfeited += 1
+
+    @classmethod
+    def from_conn(cls, conn: sqlite3.Connection) -> "StatsBook":
+        """Rebuilds statistics from the questions and progress tables in one pass.
+
+        Args:
+            conn (sqlite3.Connection): Connection to the competition database.
+
+        Returns:
+            StatsBook: Statistics for every question, including those nobody has opened.
+        """
+        book = cls()
+        for (qid,) in conn.execute("SELECT id FROM questions ORDER BY id"):
+            book.get(qid)
+        for qid, attempts, time in conn.execute("SELECT qid, attempts, time FROM progress"):
+            book.opened(qid)
+            if attempts is None or attempts == 0:
+                continue # still open
+            if attempts < 0:
+                book.forfeited(qid)
+            else:
+                book.solved(qid, attempts, time or 0)
+        return book
+
+    def format(self) -> list:
+        """Formats every question as a row of a monospace table.
+
+        Returns:
+            list: Header line followed by one line per question, sorted by question number.
+        """
+        def pct(value):
+            return f"{value:.0%}" if value is not None else "-"
+
+        def num(value, suffix=''):
+            return f"{value:.1f}{suffix}" if value is not None else "-"
+
+        lines = [f"{'Q':>3} {'Open':>5} {'Solve':>6} {'Forf':>5} {'Att':>5} {'Median':>8}"]
+        for qid in sorted(self.questions):
+            stats = self.questions[qid]
+            lines.append(f"{qid:>3} {stats.opened:>5} {pct(stats.solve_rate):>6} {pct(stats.forfeit_rate):>5} {num(stats.avg_attempts):>5} {num(stats.median_time, 's'):>8}")
+        return lines
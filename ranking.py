@@ -0,0 +1,244 @@
+"""
+Module to answer leaderboard rank queries without touching the database.
+
+Classes:
+    RankIndex: Order-statistic index over team totals.
+
+Dependencies:
+    bisect: Used for keeping tied teams in name order.
+
+Example:
+    To use the RankIndex class, import it into your bot's file:
+
+    ```python
+    from ranking import RankIndex
+    ```
+"""
+
+from bisect import bisect_left, insort
+from typing import Optional
+
+class RankIndex:
+    """
+    Order-statistic index over team totals, backed by a Fenwick tree of score counts.
+
+    Teams with equal totals share a rank (standard competition ranking, e.g. 1, 2, 2, 4) and are listed by
+    team name within a tie. Rank and k-th place lookups run in O(log S), where S is the highest score seen so far;
+    each tie is kept as a sorted list, so finding a team within it is a binary search and an update moves one
+    entry.
+
+    Attributes:
+        names (dict): Maps team IDs to team names.
+    """
+    def __init__(self, capacity: int = 256) -> None:
+        self.names = {}
+        self._scores = {} # team ID -> total score
+        self._buckets = {} # total score -> sorted list of (team name, team ID) holding it
+        self._capacity = 1
+        while self._capacity < capacity:
+            self._capacity *= 2
+        self._tree = [0] * (self._capacity + 1)
+
+    @classmethod
+    def from_rows(cls, rows) -> "RankIndex":
+        """Builds an index from (team ID, team name, score) rows, e.g. the result of a query on the teams table.
+
+        Args:
+            rows (iterable): (tid, team_name, score) tuples.
+
+        Returns:
+            RankIndex: Populated index.
+        """
+        index = cls()
+        for tid, name, score in rows:
+            index.update(int(tid), int(score or 0), name)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __contains__(self, tid: int) -> bool:
+        return tid in self._scores
+
+    def _add(self, score: int, delta: int) -> None:
+        i = score + 1
+        while i <= self._capacity:
+            self._tree[i] += delta
+            i += i & -i
+
+    def _count_at_most(self, score: int) -> int:
+        """Number of teams whose total is less than or equal to score."""
+        i = min(score + 1, self._capacity)
+        count = 0
+        while i > 0:
+            count += self._tree[i]
+            i -= i & -i
+        return count
+
+    def _kth_smallest(self, k: int) -> int:
+        """Score held by the k-th lowest team (1-based)."""
+        pos = 0
+        step = self._capacity
+        while step:
+            if pos + step <= self._capacity and self._tree[pos + step] < k:
+                pos += step
+                k -= self._tree[pos]
+            step //= 2
+        return pos # tree index pos + 1 stores score pos
+
+    def _grow(self, score: int) -> None:
+        while self._capacity <= score:
+            self._capacity *= 2
+        self._tree = [0] * (self._capacity + 1)
+        for bucket_score, tids in self._buckets.items():
+            self._add(bucket_score, len(tids))
+
+    def update(self, tid: int, score: int, name: Optional[str] = None) -> None:
+        """Sets a team's total score, inserting the team if it is new.
+
+        Args:
+            tid (int): Team ID.
+            score (int): New total score.
+            name (str): Team name. Default keeps the current name.
+
+        Raises:
+            ValueError: The score is negative.
+        """
+        if score < 0:
+            raise ValueError("team totals cannot be negative")
+        old = self._scores.get(tid)
+        old_key = (self.names[tid], tid) if old is not None else None # a rename moves the team within its tie
+        if name is not None:
+            self.names[tid] = name
+        else:
+            self.names.setdefault(tid, f"Team {tid}")
+
+        key = (self.names[tid], tid)
+        if old == score and key == old_key:
+            return
+        if old is not None:
+            self._remove_from_bucket(old_key, old)
+
+        if score >= self._capacity:
+            self._grow(score)
+        self._scores[tid] = score
+        insort(self._buckets.setdefault(score, []), key)
+        self._add(score, 1)
+
+    def add(self, tid: int, delta: int) -> int:
+        """Adds points to a team's total.
+
+        Args:
+            tid (int): Team ID.
+            delta (int): Points to add.
+
+        Returns:
+            int: The team's new total.
+        """
+        score = self._scores.get(tid, 0) + delta
+        self.update(tid, score)
+        return score
+
+    def remove(self, tid: int) -> None:
+        """Removes a team from the index.
+
+        Args:
+            tid (int): Team ID.
+        """
+        old = self._scores.pop(tid, None)
+        if old is not None:
+            self._remove_from_bucket((self.names[tid], tid), old)
+        self.names.pop(tid, None)
+
+    def _remove_from_bucket(self, key: tuple, score: int) -> None:
+        bucket = self._buckets[score]
+        del bucket[bisect_left(bucket, key)]
+        if not bucket:
+            del self._buckets[score]
+        self._add(score, -1)
+
+    def score(self, tid: int) -> Optional[int]:
+        """Returns a team's total, or None if the team is not indexed."""
+        return self._scores.get(tid)
+
+    def rank(self, tid: int) -> Optional[int]:
+        """Returns a team's rank (1 is first, ties share a rank), or None if the team is not indexed.
+
+        Args:
+            tid (int): Team ID.
+        """
+        score = self._scores.get(tid)
+        if score is None:
+            return None
+        return len(self._scores) - self._count_at_most(score) + 1
+
+    def position(self, tid: int) -> Optional[int]:
+        """Returns a team's row on the leaderboard (1-based, ties broken by team name)."""
+        score = self._scores.get(tid)
+        if score is None:
+            return None
+        return self.rank(tid) + bisect_left(self._buckets[score], (self.names[tid], tid))
+
+    def slice(self, start: int, stop: int) -> list:
+        """Returns leaderboard rows between two positions.
+
+        Args:
+            start (int): First position to include (1-based).
+            stop (int): Last position to include.
+
+        Returns:
+            list: (rank, tid, score) tuples in leaderboard order.
+        """
+        n = len(self._scores)
+        start = max(start, 1)
+        stop = min(stop, n)
+        rows = []
+        pos = start
+        while pos <= stop:
+            score = self._kth_smallest(n - pos + 1)
+            rank = n - self._count_at_most(score) + 1
+            tied = self._buckets[score]
+            for _, tid in tied[pos - rank:stop - rank + 1]:
+                rows.append((rank, tid, score))
+            pos = rank + len(tied)
+        return rows
+
+    def top(self, n: int) -> list:
+        """Returns the first n leaderboard rows as (rank, tid, score) tuples."""
+        return self.slice(1, n)
+
+    def around(self, tid: int, k: int = 2) -> list:
+        """Returns up to k leaderboard rows on each side of a team, including the team itself.
+
+        Args:
+            tid (int): Team ID.
+            k (int): Rows to show above and below. Default is 2.
+
+        Returns:
+            list: (rank, tid, score) tuples in leaderboard order, empty if the team is not indexed.
+        """
+        pos = self.position(tid)
+        if pos is None:
+            return []
+        return self.slice(pos - k, pos + k)
+
+    def standings(self) -> list:
+        """Returns every team as (rank, tid, score) tuples in leaderboard order."""
+        return self.slice(1, len(self._scores))
+
+    def format(self, rows: list, highlight: Optional[int] = None) -> str:
+        """Formats leaderboard rows as a monospace text table.
+
+        Args:
+            rows (list): (rank, tid, score) tuples.
+            highlight (int): Team ID to mark with an arrow. Default is None.
+
+        Returns:
+            str: Table wrapped in a code block.
+        """
+        width = max([len(self.names[tid]) for _, tid, _ in rows] + [4])
+        lines = [f"  {'#':>3}  {'Team':<{width}}  Score"]
+        for rank, tid, score in rows:
+            marker = '>' if tid == highlight else ' '
+            lines.append(f"{marker} {rank:>3}  {self.names[tid]:<{width}}  {score:>5}")
+        return "```\n" + "\n".join(lines) + "\n```"
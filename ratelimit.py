@@ -0,0 +1,112 @@
+"""
+Module to rate limit answer attempts per team.
+
+Classes:
+    TokenBucket: Token bucket on the monotonic clock.
+    GuessLimiter: One token bucket per team, with cooldown notice throttling.
+
+Dependencies:
+    time: Provides the monotonic clock.
+
+Example:
+    To use the GuessLimiter class, import it into your bot's file:
+
+    ```python
+    from ratelimit import GuessLimiter
+    ```
+"""
+
+import time
+from typing import Optional
+
+class TokenBucket:
+    """
+    Token bucket: holds up to `capacity` tokens and refills at `rate` tokens per second.
+
+    Args:
+        rate (float): Tokens added per second.
+        capacity (float): Maximum tokens held, i.e. the allowed burst.
+    """
+    __slots__ = ('rate', 'capacity', 'tokens', 'updated')
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def take(self, now: Optional[float] = None) -> float:
+        """Takes one token if available.
+
+        Args:
+            now (float): Current monotonic time. Default reads the clock.
+
+        Returns:
+            float: 0.0 if a token was taken, otherwise seconds until one is available.
+        """
+        if now is None:
+            now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + max(now - self.updated, 0.0) * self.rate)
+        self.updated = max(now, self.updated)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+class GuessLimiter:
+    """
+    Per-team limit on answer attempts, kept entirely in memory.
+
+    Attributes:
+        per_minute (float): Sustained answers allowed per minute.
+        burst (int): Answers allowed back to back before the limit applies.
+
+    Args:
+        per_minute (float): Sustained answers allowed per minute. Default is 10.
+        burst (int): Answers allowed back to back. Default is 5.
+    """
+    def __init__(self, per_minute: float = 10, burst: int = 5) -> None:
+        self.per_minute = per_minute
+        self.burst = burst
+        self._buckets = {} # team ID -> TokenBucket
+        self._notified_until = {} # team ID -> monotonic time until which the cooldown notice was already sent
+
+    def configure(self, per_minute: float, burst: int) -> None:
+        """Changes the limit for every team and resets their buckets.
+
+        Raises:
+            ValueError: Rate or burst is not positive.
+        """
+        if per_minute <= 0 or burst < 1:
+            raise ValueError("rate and burst must be positive")
+        self.per_minute = per_minute
+        self.burst = burst
+        self._buckets.clear()
+        self._notified_until.clear()
+
+    def acquire(self, tid: int) -> float:
+        """Spends one answer attempt for a team.
+
+        Args:
+            tid (int): Team ID.
+
+        Returns:
+            float: 0.0 if the answer may be checked, otherwise seconds until the team may answer again.
+        """
+        bucket = self._buckets.get(tid)
+        if bucket is None:
+            bucket = self._buckets[tid] = TokenBucket(self.per_minute / 60, self.burst)
+        return bucket.take()
+
+    def should_notify(self, tid: int, wait: float) -> bool:
+        """Returns True once per cooldown, so a spamming team gets one notice rather than one per message.
+
+        Args:
+            tid (int): Team ID.
+            wait (float): Seconds until the team may answer again, as returned by acquire.
+        """
+        now = time.monotonic()
+        if now < self._notified_until.get(tid, 0.0):
+            return False
+        self._notified_until[tid] = now + wait
+        return True
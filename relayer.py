@@ -2,10 +2,15 @@
 Module to handle message relaying in Discord.
 
 Classes:
+    MessageCache: Bounded LRU cache of relayable message content.
     ReactionRelayer: Manages the relaying of messages between channels in a Discord server upon the addition of specific reactions.
+    Route: One filtered destination of a relayed channel.
     Relayer: Manages the relaying of messages between channels in a Discord server once enabled.
 
 Dependencies:
+    asyncio: Used for sending relayed messages to several destinations concurrently.
+    sys: Used for measuring cached message sizes.
+    collections: Provides the OrderedDict used for LRU ordering.
     discord.py: Python library for interacting with the Discord API.
 
 Example:
@@ -19,58 +24,191 @@ Note:
     This module requires the discord.ext.commands framework for proper integration into a Discord bot.
 """
 
+import sys
+import asyncio
+from collections import OrderedDict
+from typing import NamedTuple, Optional
 import discord
 
+class MessageCache:
+    """
+    Entry-bounded LRU cache of (channel ID, author name, content) per message ID.
+
+    Only messages from reaction relay channels are stored, so the cache stays small no matter how busy the rest
+    of the server is.
+
+    Attributes:
+        max_entries (int): Messages kept. Least recently used messages are evicted beyond it.
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that required a fetch.
+        evictions (int): Messages dropped to stay within max_entries.
+
+    Args:
+        max_entries (int): Messages kept. Default is 2048.
+    """
+    def __init__(self, max_entries: int = 2048) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._messages = OrderedDict() # message ID -> (channel ID, author name, content), least recently used first
+        self._bytes = 0
+
+    @staticmethod
+    def _size(entry: tuple) -> int:
+        return sys.getsizeof(entry) + sys.getsizeof(entry[1]) + sys.getsizeof(entry[2])
+
+    def get(self, message_id: int) -> Optional[tuple]:
+        """Returns (channel ID, author name, content) for a message, or None on a miss."""
+        entry = self._messages.get(message_id)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._messages.move_to_end(message_id)
+        self.hits += 1
+        return entry
+
+    def put(self, message) -> tuple:
+        """Stores a message, evicting the least recently used message beyond max_entries.
+
+        Args:
+            message (discord.Message): Message to store.
+
+        Returns:
+            tuple: The stored (channel ID, author name, content) entry.
+        """
+        entry = (message.channel.id, message.author.name, message.content)
+        self.discard(message.id)
+        self._messages[message.id] = entry
+        self._bytes += self._size(entry)
+
+        while len(self._messages) > self.max_entries:
+            _, evicted = self._messages.popitem(last=False)
+            self._bytes -= self._size(evicted)
+            self.evictions += 1
+        return entry
+
+    def discard(self, message_id: int) -> None:
+        """Forgets a message, e.g. after it was edited or deleted."""
+        entry = self._messages.pop(message_id, None)
+        if entry is not None:
+            self._bytes -= self._size(entry)
+
+    def discard_channel(self, channel_id: int) -> None:
+        """Forgets every message from a channel."""
+        for message_id in [message_id for message_id, entry in self._messages.items() if entry[0] == channel_id]:
+            self.discard(message_id)
+
+    def stats(self) -> dict:
+        """Returns cache statistics.
+
+        Returns:
+            dict: hits, misses, hit_rate, evictions, entries, max_entries and bytes (approximate memory use).
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self._messages),
+            'max_entries': self.max_entries,
+            'bytes': self._bytes,
+        }
+
 class ReactionRelayer:
     """
     Provides togglable relaying between channels on reaction add. 
 
+    Reactions are handled from raw gateway events, so reactions on messages that have left discord.py's message
+    cache are still relayed. Message content comes from the relayer's own MessageCache, which only holds messages
+    from enabled channels, with a fetch from the API on a miss.
+
     Attributes:
         CHECK_MARK_EMOJI (str): A constant containing the reaction to be used for relaying.
         bot (discord.ext.commands.Bot): Current instance of the Discord bot.
         enabled_channels (set): A set of channel IDs where the relay feature is enabled.
         relay_channels (dict): A dictionary mapping source channel IDs to their corresponding destination channel IDs. 
+        messages (MessageCache): Content of recent messages in enabled channels.
+
+    Args:
+        bot (discord.ext.commands.Bot): Current instance of the Discord bot.
+        cache_size (int): Messages kept in the message cache. Default is 2048.
     """
-    def __init__(self, bot) -> None:
+    def __init__(self, bot, cache_size: int = 2048) -> None:
         self.CHECK_MARK_EMOJI = '✅'
         self.bot = bot
         self.enabled_channels = set()
         self.relay_channels = {}
+        self.messages = MessageCache(cache_size)
 
     async def on_message(self, message) -> None:
         """Listens for messages in channels and adds a reaction to messages in enabled channels.
 
         Args:
             message: The message object that triggers the event.
+
+        Note:
+            Commands are processed by the bot itself; calling process_commands here as well would run every
+            command twice.
         """
         if message.author == self.bot.user:
             return # Prevent the bot from reacting to its own messages
 
         # Check if the message is in an enabled source channel
         if message.channel.id in self.enabled_channels:
+            self.messages.put(message)
             await message.add_reaction(self.CHECK_MARK_EMOJI)
 
-        await self.bot.process_commands(message)
-
-    async def on_reaction_add(self, reaction, user) -> None:
+    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent) -> None:
         """Handles added reactions and relays messages if conditions are met.
 
         Args:
-            reaction: The reaction object added to the message.
-            user: The user who added the reaction.
+            payload (discord.RawReactionActionEvent): The raw reaction event, sent whether or not the message is cached.
         """
-        if user == self.bot.user:
+        if payload.user_id == self.bot.user.id:
             return # Avoid processing reactions made by the bot
 
-        if reaction.emoji == self.CHECK_MARK_EMOJI and reaction.message.channel.id in self.enabled_channels:
-            source_channel = reaction.message.channel
-            relay_channel = self.bot.get_channel(self.relay_channels.get(source_channel.id))
-            
-            if relay_channel:
-                author_name = reaction.message.author.name
-                content = f"{author_name}: {reaction.message.content}"
+        if payload.channel_id not in self.enabled_channels or str(payload.emoji) != self.CHECK_MARK_EMOJI:
+            return
+
+        relay_channel = self.bot.get_channel(self.relay_channels.get(payload.channel_id))
+        if not relay_channel:
+            return
+
+        entry = self.messages.get(payload.message_id)
+        if entry is None:
+            source_channel = self.bot.get_channel(payload.channel_id)
+            if source_channel is None:
+                return
+            try:
+                message = await source_channel.fetch_message(payload.message_id)
+            except discord.NotFound:
+                return
+            entry = self.messages.put(message)
+
+        _, author_name, content = entry
+        await relay_channel.send(f"{author_name}: {content}")
 
-                await relay_channel.send(content)
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent) -> None:
+        """Drops edited messages from the message cache so the next relay fetches the new content.
+
+        Args:
+            payload (discord.RawMessageUpdateEvent): The raw edit event.
+        """
+        self.messages.discard(payload.message_id)
+
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        """Drops deleted messages from the message cache.
+
+        Args:
+            payload (discord.RawMessageDeleteEvent): The raw delete event.
+        """
+        self.messages.discard(payload.message_id)
+
+    def stats(self) -> dict:
+        """Returns message cache statistics, as returned by MessageCache.stats."""
+        return self.messages.stats()
 
     async def enable_reaction_relay(self, ctx, destination_channel: discord.TextChannel) -> None:
         """Enables reaction relay from the current channel to a specified destination channel.
@@ -91,23 +229,61 @@ class ReactionRelayer:
             ctx: The context in which the command is invoked.
         """
         self.enabled_channels.discard(ctx.channel.id)
+        self.messages.discard_channel(ctx.channel.id)
         await ctx.send(f"Relay disabled in this channel: {ctx.channel.name}")
 
+class Route(NamedTuple):
+    """
+    One destination of a relayed channel, with optional filters.
+
+    Attributes:
+        destination (int): Destination channel ID.
+        prefix (str): Only relay messages starting with this text. Default relays every message.
+        role (int): Only relay messages from members with this role ID. Default relays every author.
+    """
+    destination: int
+    prefix: str = ''
+    role: Optional[int] = None
+
+    def matches(self, message) -> bool:
+        """Returns True if the message passes this route's filters."""
+        if self.prefix and not message.content.startswith(self.prefix):
+            return False
+        if self.role is not None and not any(role.id == self.role for role in getattr(message.author, 'roles', ())):
+            return False
+        return True
+
 class Relayer:
-    """Relays messages from a source channel to a destination channel.
+    """Relays messages from source channels to one or more destination channels.
+
+    The routing table maps each source channel ID to a tuple of Routes. It is never mutated in place: every change
+    builds a new table and swaps it in with one assignment, so a message is always relayed with either the old or
+    the new routes, never a mix.
 
     Attributes:
         bot (discord.ext.commands.Bot): Current instance of the Discord bot.
-        enabled_channels (set): A set of channel IDs where the relay feature is enabled.
-        relay_channels (dict): A dictionary mapping source channel IDs to their corresponding destination channel IDs. 
+        routes (dict): Maps source channel IDs to tuples of Routes.
+        enabled_channels (frozenset): Source channel IDs with at least one route.
     """
     def __init__(self, bot) -> None:
         self.bot = bot
-        self.enabled_channels = set()
-        self.relay_channels = {}
+        self.routes = {}
+        self.enabled_channels = frozenset()
+
+    def set_routes(self, routes: dict) -> None:
+        """Replaces the whole routing table at once.
+
+        Args:
+            routes (dict): Maps source channel IDs to iterables of Routes. Sources without routes are dropped.
+        """
+        table = {source: tuple(targets) for source, targets in routes.items() if targets}
+        self.routes, self.enabled_channels = table, frozenset(table)
 
     async def on_message(self, message) -> None:
-        """Listens for messages in channels and relays the message to enabled channels.
+        """Listens for messages in channels and relays the message to every matching route.
+
+        The relayed text is formatted once and sent to all destinations concurrently; a failing destination does
+        not stop the others.
 
         Args:
             message: The message object that triggers the event.
@@ -115,13 +291,20 @@ class Relayer:
         if message.author == self.bot.user:
             return  # Avoid processing messages made by the bot
 
-        if message.channel.id in self.enabled_channels:
-            source_channel = message.channel
-            relay_channel = self.bot.get_channel(self.relay_channels.get(source_channel.id))
-            
-            if relay_channel:
-                author_name = message.author.name
-                await relay_channel.send(f"{author_name}: {message.content}")
+        routes = self.routes.get(message.channel.id)
+        if not routes:
+            return
+
+        destinations = [self.bot.get_channel(route.destination) for route in routes if route.matches(message)]
+        destinations = [channel for channel in destinations if channel]
+        if not destinations:
+            return
+
+        content = f"{message.author.name}: {message.content}"
+        results = await asyncio.gather(*(channel.send(content) for channel in destinations), return_exceptions=True)
+        for channel, result in zip(destinations, results):
+            if isinstance(result, Exception):
+                print(f"relay to {channel} failed: {result}")
 
     async def enable_relay(self, source_channel_id: int, destination_channel: discord.TextChannel) -> None:
         """
@@ -133,8 +316,9 @@ class Relayer:
 
         """
         source_channel = self.bot.get_channel(source_channel_id)
-        self.enabled_channels.add(source_channel_id)
-        self.relay_channels[source_channel_id] = destination_channel.id
+        table = dict(self.routes)
+        table[source_channel_id] = tuple(r for r in table.get(source_channel_id, ()) if r.destination != destination_channel.id) + (Route(destination_channel.id),)
+        self.set_routes(table)
         await source_channel.send(f"Relaying enabled. Destination: {destination_channel.mention}.")
 
     async def disable_relay(self, source_channel_id: int) -> None:
@@ -144,5 +328,7 @@ class Relayer:
             source_channel_id (int): The Discord text channel id of the source channel.
         """
         source_channel = self.bot.get_channel(source_channel_id)
-        self.enabled_channels.discard(source_channel_id)
-        await source_channel.send("Relay disabled.")
\ No newline at end of file
+        table = dict(self.routes)
+        table.pop(source_channel_id, None)
+        self.set_routes(table)
+        await source_channel.send("Relay disabled.")
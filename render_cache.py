@@ -0,0 +1,120 @@
+"""
+Module to cache rendered leaderboard images by content.
+
+Classes:
+    RenderCache: Byte-bounded LRU cache of rendered images keyed by a hash of the standings and render settings.
+
+Dependencies:
+    hashlib: Used to hash standings into cache keys.
+    collections: Provides the OrderedDict used for LRU ordering.
+
+Example:
+    To use the RenderCache class, import it into your bot's file:
+
+    ```python
+    from render_cache import RenderCache
+    ```
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+
+class RenderCache:
+    """
+    Byte-bounded LRU cache of rendered leaderboard images.
+
+    Images are keyed by a SHA-256 digest of the (team, score) vector and the render settings, so two requests for
+    the same standings (e.g. `stop_comp` right after the last submission) share one render regardless of which
+    command asked for it.
+
+    Attributes:
+        max_bytes (int): Memory budget for cached images. Least recently used images are evicted beyond it.
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that required a render.
+        evictions (int): Images dropped to stay within the memory budget.
+
+    Args:
+        max_bytes (int): Memory budget in bytes. Default is 16 MiB.
+    """
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._images = OrderedDict() # key -> PNG bytes, least recently used first
+        self._bytes = 0
+
+    @staticmethod
+    def key(standings: list, settings: tuple = ()) -> str:
+        """Hashes standings and render settings into a cache key.
+
+        Args:
+            standings (list): (team name, score) pairs in display order.
+            settings (tuple): Anything else that changes the output, e.g. the renderer name.
+
+        Returns:
+            str: Hex digest identifying the rendered image.
+        """
+        digest = hashlib.sha256()
+        digest.update(repr(tuple(settings)).encode())
+        for team, score in standings:
+            digest.update(b"\x00" + str(team).encode() + b"\x01" + str(score).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the cached image for a key, or None on a miss.
+
+        Args:
+            key (str): Key from RenderCache.key.
+        """
+        image = self._images.get(key)
+        if image is None:
+            self.misses += 1
+            return None
+        self._images.move_to_end(key)
+        self.hits += 1
+        return image
+
+    def put(self, key: str, image: bytes) -> None:
+        """Stores a rendered image, evicting least recently used images beyond the memory budget.
+
+        Args:
+            key (str): Key from RenderCache.key.
+            image (bytes): Encoded image.
+        """
+        if len(image) > self.max_bytes:
+            return # would evict everything and still not fit
+
+        old = self._images.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old)
+        self._images[key] = image
+        self._bytes += len(image)
+
+        while self._bytes > self.max_bytes:
+            _, evicted = self._images.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drops every cached image. Statistics are kept."""
+        self._images.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict:
+        """Returns cache statistics.
+
+        Returns:
+            dict: hits, misses, hit_rate, evictions, entries, bytes and max_bytes.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self._images),
+            'bytes': self._bytes,
+            'max_bytes': self.max_bytes,
+        }
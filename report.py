@@ -0,0 +1,173 @@
+"""
+Module to generate end-of-competition reports for every team at once.
+
+Classes:
+    TeamReport: One team's per-question results.
+
+Dependencies:
+    io: Used to build the CSV report in memory.
+    csv: Implements classes to write tabular data in CSV format.
+    itertools: Used to group the joined query result by team.
+    sqlite3: Used for querying competition progress.
+    discord.py: Used to build report embeds.
+    scoring: A custom module for calculating scores.
+
+Example:
+    To build and send a report, import the module into your bot's file:
+
+    ```python
+    from report import fetch_report, report_embeds, batch_embeds, report_csv
+    ```
+"""
+
+import io
+import csv
+import sqlite3
+from itertools import groupby
+import discord
+from scoring import scoring
+
+# Discord limits per message and per embed
+MAX_EMBEDS = 10
+MAX_MESSAGE_CHARS = 6000
+MAX_DESCRIPTION = 4096
+
+# every team with every question it opened, in one pass over progress, questions and teams
+REPORT_QUERY = '''
+    SELECT t.id, t.team_name, t.score, p.qid, p.attempts, p.time, q.base_score
+    FROM teams t
+    LEFT JOIN progress p ON p.tid = t.id
+    LEFT JOIN questions q ON q.id = p.qid
+    ORDER BY t.id, p.qid
+'''
+
+class TeamReport:
+    """
+    One team's per-question results.
+
+    Attributes:
+        tid (int): Team ID.
+        name (str): Team name.
+        total (int): Team total score.
+        questions (list): (qid, attempts, time, score, status) tuples sorted by question number.
+    """
+    __slots__ = ('tid', 'name', 'total', 'questions')
+
+    def __init__(self, tid, name, total) -> None:
+        self.tid = tid
+        self.name = name
+        self.total = total
+        self.questions = []
+
+
+def question_status(attempts) -> str:
+    """Describes a progress row: forfeited (attempts < 0), in progress (0) or correct.
+
+    Args:
+        attempts (int): Attempts column of the progress table.
+    """
+    if attempts is None or attempts == 0:
+        return "In progress"
+    if attempts < 0:
+        return "Forfeited"
+    return "Correct"
+
+
+def fetch_report(conn: sqlite3.Connection) -> list:
+    """Builds every team's summary from a single joined, ordered query.
+
+    Args:
+        conn (sqlite3.Connection): Connection to the competition database.
+
+    Returns:
+        list: TeamReport objects ordered by team ID.
+    """
+    rows = conn.execute(REPORT_QUERY)
+
+    reports = []
+    for (tid, name, total), team_rows in groupby(rows, key=lambda row: row[:3]):
+        report = TeamReport(tid, name, total or 0)
+        for _, _, _, qid, attempts, time, base_score in team_rows:
+            if qid is None:
+                continue # team never opened a question
+            status = question_status(attempts)
+            score = 0
+            if status == "Correct" and base_score is not None:
+                score = scoring(attempts, base_score, time or 0, verbose=False)
+            report.questions.append((qid, attempts, time, score, status))
+        reports.append(report)
+    return reports
+
+
+def report_embeds(reports: list) -> list:
+    """Builds one summary embed per team.
+
+    Args:
+        reports (list): TeamReport objects.
+
+    Returns:
+        list: discord.Embed objects in the same order.
+    """
+    embeds = []
+    for report in reports:
+        lines = [f"{'Q':>3}  {'Attempts':>8}  {'Time':>6}  {'Score':>5}"]
+        for qid, attempts, time, score, status in report.questions:
+            if status == "Correct":
+                lines.append(f"{qid:>3}  {attempts:>8}  {time or 0:>5}s  {score:>5}")
+            else:
+                lines.append(f"{qid:>3}  {status:>22}")
+        if not report.questions:
+            lines.append("No questions attempted.")
+
+        table = "\n".join(lines)
+        if len(table) > MAX_DESCRIPTION - 16:
+            table = table[:MAX_DESCRIPTION - 20] + "\n..."
+        embed = discord.Embed(title=report.name, description=f"```\n{table}\n```", color=0xb8eefa)
+        embed.set_footer(text=f"Team {report.tid} · Total score: {report.total}")
+        embeds.append(embed)
+    return embeds
+
+
+def batch_embeds(embeds: list, max_embeds: int = MAX_EMBEDS, max_chars: int = MAX_MESSAGE_CHARS) -> list:
+    """Groups embeds into as few messages as Discord's limits allow.
+
+    Args:
+        embeds (list): discord.Embed objects.
+        max_embeds (int): Embeds per message. Default is 10.
+        max_chars (int): Total embed characters per message. Default is 6000.
+
+    Returns:
+        list: Lists of embeds, one list per message.
+    """
+    batches = []
+    batch, chars = [], 0
+    for embed in embeds:
+        size = len(embed)
+        if batch and (len(batch) == max_embeds or chars + size > max_chars):
+            batches.append(batch)
+            batch, chars = [], 0
+        batch.append(embed)
+        chars += size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def report_csv(reports: list) -> bytes:
+    """Writes the full report as CSV, one row per team and question.
+
+    Args:
+        reports (list): TeamReport objects.
+
+    Returns:
+        bytes: UTF-8 encoded CSV.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(['team_id', 'team_name', 'team_total', 'question', 'attempts', 'time', 'score', 'status'])
+    for report in reports:
+        for qid, attempts, time, score, status in report.questions:
+            writer.writerow([report.tid, report.name, report.total, qid, attempts, time, score, status])
+        if not report.questions:
+            writer.writerow([report.tid, report.name, report.total, '', '', '', '', ''])
+    return buffer.getvalue().encode('utf-8')
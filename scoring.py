@@ -1,8 +1,12 @@
 """
 Module to calculate score of answer submissions.
 
+Classes:
+    ScoringRule: Parameters of the scoring formula.
+
 Dependencies:
     math: Stanfard Python library for mathematical functions
+    typing: Provides NamedTuple for scoring rules.
 
 Example:
     To use the scoring function, import it into your bot's file:
@@ -13,32 +17,57 @@ Example:
 """
 
 from math import log
+from typing import NamedTuple
+
+class ScoringRule(NamedTuple):
+    """
+    Parameters of the scoring formula. The defaults are the live rule.
+
+    Attributes:
+        threshold_factor (float): Seconds per base score point before the time decay starts. Default is 24.
+        attempt_divisor (float): Each incorrect attempt costs base_score / attempt_divisor. Default is 5.
+        offset (float): Shift of the decay curve's log term, in seconds. Default is 20.
+        log_shift (float): Constant subtracted from the log term. Default is 8.
+        decay (float): Divisor of the decay curve. Default is 5.
+        minimum (int): Score awarded for any correct answer. Default is 1.
+    """
+    threshold_factor: float = 24
+    attempt_divisor: float = 5
+    offset: float = 20
+    log_shift: float = 8
+    decay: float = 5
+    minimum: int = 1
+
+DEFAULT_RULE = ScoringRule()
 
-def scoring(attempts: int, base_score: int, time: int) -> int:
+def scoring(attempts: int, base_score: int, time: int, verbose: bool = True, rule: ScoringRule = DEFAULT_RULE) -> int:
     """Calculates score received upon submitting a question.
 
     Args:
         attempts (int): Name of database to be used as the filename.
         base_score (int): Maximum achievable score of question.
         time (int): Time taken to complete questions in seconds.
+        verbose (bool): Print the inputs for debugging. Default is True; bulk callers turn it off.
+        rule (ScoringRule): Scoring parameters. Default is the live rule.
 
     Returns: 
         score (int): calculated score
     """
-    print(f"attempts: {attempts} \nbase: {base_score} \ntime: {time}s") # print input for debugging
-    threshold = base_score * 24 # assign dynamic scoring scale threshold
+    if verbose:
+        print(f"attempts: {attempts} \nbase: {base_score} \ntime: {time}s") # print input for debugging
+    threshold = base_score * rule.threshold_factor # assign dynamic scoring scale threshold
     
     # algorithm: subtract base_score/5 each time an incorrect attempt is made
-    score = base_score - ((attempts - 1) * (base_score / 5))
+    score = base_score - ((attempts - 1) * (base_score / rule.attempt_divisor))
     
     # if the time taken is above the scoring threshold
     if time > threshold:
 
         # the score is multiplied by a curve that accounts for time taken and starts at the specified threshold
-        score = score * ((-(log(time - (threshold - 20)) - 8) / 5))
+        score = score * ((-(log(time - (threshold - rule.offset)) - rule.log_shift) / rule.decay))
 
     # return a minimum score of 1 for a correct answer or a rounded score
-    if score < 1:
-        return 1
+    if score < rule.minimum:
+        return rule.minimum
     else: 
         return round(score)
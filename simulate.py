@@ -0,0 +1,258 @@
+"""
+Module to simulate how past competitions would have ranked under different scoring rules.
+
+Every competition database in comp_dbs/ and every bundle in comp_dbs/archive/ is re-scored from its progress table,
+once with the live rule as the baseline and once per candidate rule. Competitions are processed in parallel, one
+worker per competition, and each worker scores every candidate so a database is only read once per run. Databases
+without the competition tables, and competitions where nothing was solved, are skipped.
+
+For every candidate rule the report gives, averaged over competitions with at least two teams:
+    tau: Kendall tau-b between baseline and candidate team totals (1 means no rank changes).
+    churn: Fraction of the baseline top k that is no longer in the candidate top k.
+    moved: Fraction of teams whose rank changed.
+    mean, median, stdev: Distribution of candidate team totals, pooled over competitions.
+
+Functions:
+    grid: Builds every combination of candidate rule parameters.
+    kendall_tau_b: Rank correlation of two score vectors, with ties.
+    load_solves: Reads team IDs and solved questions from one competition.
+    simulate_one: Scores one competition under a baseline and candidate rules.
+    simulate: Scores every competition in parallel and summarises each rule.
+
+Dependencies:
+    sys: Used for exiting with an error message.
+    glob: Used for finding competition databases.
+    lzma: Used for recognising corrupt archive bundles.
+    sqlite3: Used for reading competition databases.
+    argparse: Used for parsing command line parameters.
+    itertools: Used for building the parameter grid.
+    pathlib: Used for building read-only database URIs.
+    statistics: Used for score distribution summaries.
+    concurrent.futures: Used for scoring competitions in parallel.
+    os.path: Standard Python library functions for file and directory path manipulations.
+    scoring: A custom module for calculating scores.
+    archive: A custom module for opening archived competitions.
+
+Example:
+    Sweep the time threshold and decay over every past competition:
+
+    ```
+    python simulate.py --threshold-factor 18 24 30 --decay 4 5 6 --top-k 3
+    ```
+"""
+
+import sys
+import glob
+import lzma
+import sqlite3
+import argparse
+import itertools
+import statistics
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from os.path import join, dirname, abspath, basename, splitext
+from scoring import ScoringRule, DEFAULT_RULE, scoring
+from archive import BUNDLE_SUFFIX, open_archive
+
+DB_DIR = str(join(dirname(dirname(abspath(__file__))), 'mathletics/comp_dbs'))
+REQUIRED_TABLES = {'questions', 'progress', 'teams'}
+
+
+def grid(**values) -> list:
+    """Builds every combination of rule parameters.
+
+    Args:
+        **values: ScoringRule field names mapped to lists of candidate values. Missing fields keep the live value.
+
+    Returns:
+        list: ScoringRules in grid order.
+    """
+    fields = ScoringRule._fields
+    axes = [values.get(field) or [getattr(DEFAULT_RULE, field)] for field in fields]
+    return [ScoringRule(*combination) for combination in itertools.product(*axes)]
+
+
+def kendall_tau_b(x: list, y: list) -> float:
+    """Computes Kendall's tau-b between two equally long score vectors.
+
+    Args:
+        x (list): Scores under one rule.
+        y (list): Scores of the same teams under another rule.
+
+    Returns:
+        float: Tau-b in [-1, 1]; 1.0 if either vector is constant (no ranking to disagree with).
+    """
+    concordant = discordant = ties_x = ties_y = 0
+    n = len(x)
+    for i in range(n):
+        for j in range(i + 1, n):
+            dx = x[i] - x[j]
+            dy = y[i] - y[j]
+            if dx == 0 and dy == 0:
+                continue
+            if dx == 0:
+                ties_x += 1
+            elif dy == 0:
+                ties_y += 1
+            elif (dx > 0) == (dy > 0):
+                concordant += 1
+            else:
+                discordant += 1
+    denominator = ((concordant + discordant + ties_x) * (concordant + discordant + ties_y)) ** 0.5
+    return (concordant - discordant) / denominator if denominator else 1.0
+
+
+def _ranks(totals: dict) -> dict:
+    # competition ranking, as on the live leaderboard
+    ordered = sorted(totals.items(), key=lambda pair: (-pair[1], pair[0]))
+    ranks = {}
+    for position, (tid, total) in enumerate(ordered):
+        ranks[tid] = ranks[ordered[position - 1][0]] if position and ordered[position - 1][1] == total else position + 1
+    return ranks
+
+
+def load_solves(source: str):
+    """Reads team IDs and solved questions from one competition.
+
+    Args:
+        source (str): Path to a competition database or archive bundle.
+
+    Returns:
+        tuple: (team IDs, list of (tid, attempts, base_score, time) per solved question), or None if the database
+            is not a competition database.
+    """
+    try:
+        conn = open_archive(source) if source.endswith(BUNDLE_SUFFIX) else sqlite3.connect(Path(source).resolve().as_uri() + "?mode=ro", uri=True)
+    except (OSError, EOFError, lzma.LZMAError, sqlite3.DatabaseError):
+        return None
+    try:
+        tables = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        if not REQUIRED_TABLES <= tables:
+            return None
+        teams = [tid for (tid,) in conn.execute("SELECT id FROM teams")]
+        solves = conn.execute("""
+            SELECT p.tid, p.attempts, q.base_score, COALESCE(p.time, 0)
+            FROM progress p JOIN questions q ON q.id = p.qid
+            WHERE p.attempts > 0
+        """).fetchall()
+        return teams, solves
+    except sqlite3.DatabaseError:
+        return None
+    finally:
+        conn.close()
+
+
+def simulate_one(source: str, rules: list, top_k: int = 3):
+    """Scores one competition under the live rule and every candidate rule.
+
+    Args:
+        source (str): Path to a competition database or archive bundle.
+        rules (list): Candidate ScoringRules.
+        top_k (int): Size of the top group used for churn. Default is 3.
+
+    Returns:
+        tuple: (competition name, list of per-rule result dicts), or None if the source is not a competition
+            database or has no solved questions.
+    """
+    loaded = load_solves(source)
+    if loaded is None:
+        return None
+    teams, solves = loaded
+    if not solves:
+        return None # nothing was scored, so no rule can change anything
+    name = basename(source)[:-len(BUNDLE_SUFFIX)] if source.endswith(BUNDLE_SUFFIX) else splitext(basename(source))[0]
+
+    def totals_for(rule):
+        totals = dict.fromkeys(teams, 0)
+        for tid, attempts, base_score, time in solves:
+            totals[tid] = totals.get(tid, 0) + scoring(attempts, base_score, time, verbose=False, rule=rule)
+        return totals
+
+    baseline = totals_for(DEFAULT_RULE)
+    order = sorted(baseline)
+    base_scores = [baseline[tid] for tid in order]
+    base_ranks = _ranks(baseline)
+    k = min(top_k, len(order))
+    base_top = {tid for tid, rank in base_ranks.items() if rank <= k}
+
+    results = []
+    for rule in rules:
+        totals = baseline if rule == DEFAULT_RULE else totals_for(rule)
+        ranks = _ranks(totals)
+        top = {tid for tid, rank in ranks.items() if rank <= k}
+        results.append({
+            'tau': kendall_tau_b(base_scores, [totals[tid] for tid in order]),
+            'churn': len(base_top - top) / len(base_top) if base_top else 0.0,
+            'moved': sum(ranks[tid] != base_ranks[tid] for tid in order) / len(order) if order else 0.0,
+            'totals': [totals[tid] for tid in order],
+        })
+    return name, results
+
+
+def simulate(rules: list, sources: list, top_k: int = 3, workers: int = None) -> tuple:
+    """Scores every competition in parallel and summarises each candidate rule.
+
+    Args:
+        rules (list): Candidate ScoringRules.
+        sources (list): Paths to competition databases and archive bundles.
+        top_k (int): Size of the top group used for churn. Default is 3.
+        workers (int): Worker processes. Default is one per CPU.
+
+    Returns:
+        tuple: (names of the competitions used, list of per-rule summary dicts in rule order).
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        outcomes = [outcome for outcome in pool.map(simulate_one, sources, itertools.repeat(rules), itertools.repeat(top_k)) if outcome is not None]
+
+    # competitions with fewer than two teams have no ranking to compare
+    ranked = [(name, results) for name, results in outcomes if len(results[0]['totals']) >= 2]
+    summaries = []
+    for i, rule in enumerate(rules):
+        per_comp = [results[i] for _, results in ranked]
+        pooled = [total for result in per_comp for total in result['totals']]
+        summaries.append({
+            'rule': rule,
+            'tau': statistics.fmean(r['tau'] for r in per_comp) if per_comp else None,
+            'churn': statistics.fmean(r['churn'] for r in per_comp) if per_comp else None,
+            'moved': statistics.fmean(r['moved'] for r in per_comp) if per_comp else None,
+            'mean': statistics.fmean(pooled) if pooled else None,
+            'median': statistics.median(pooled) if pooled else None,
+            'stdev': statistics.pstdev(pooled) if pooled else None,
+        })
+    return [name for name, _ in ranked], summaries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Re-score past competitions under candidate scoring rules.")
+    parser.add_argument('--db-dir', default=DB_DIR, help="directory holding competition databases and archive/")
+    parser.add_argument('--top-k', type=int, default=3, help="size of the top group used for churn")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per CPU)")
+    for field in ScoringRule._fields:
+        kind = int if field == 'minimum' else float
+        parser.add_argument(f"--{field.replace('_', '-')}", type=kind, nargs='+', help=f"candidate values (live: {getattr(DEFAULT_RULE, field):g})")
+    args = parser.parse_args()
+
+    rules = grid(**{field: getattr(args, field) for field in ScoringRule._fields})
+    if any(rule.offset <= 0 or rule.decay == 0 or rule.attempt_divisor == 0 for rule in rules):
+        sys.exit("offset must be positive, and decay and attempt divisor non-zero")
+    if DEFAULT_RULE not in rules:
+        rules.insert(0, DEFAULT_RULE) # baseline row for reference
+
+    sources = sorted(glob.glob(join(args.db_dir, '*.db')) + glob.glob(join(args.db_dir, 'archive', '*' + BUNDLE_SUFFIX)))
+    names, summaries = simulate(rules, sources, args.top_k, args.workers)
+    if not names:
+        sys.exit(f"No competitions with at least two teams found in {args.db_dir}")
+
+    print(f"{len(names)} competitions, {len(rules)} rules, top {args.top_k}")
+    varied = [field for field in ScoringRule._fields if len({getattr(rule, field) for rule in rules}) > 1] or ['threshold_factor']
+    header = ''.join(f"{field:>18}" for field in varied)
+    print(f"{header}{'tau':>8}{'churn':>8}{'moved':>8}{'mean':>9}{'median':>9}{'stdev':>9}")
+    for summary in summaries:
+        rule = summary['rule']
+        columns = ''.join(f"{getattr(rule, field):>18g}" for field in varied)
+        marker = '  (live)' if rule == DEFAULT_RULE else ''
+        print(f"{columns}{summary['tau']:>8.3f}{summary['churn']:>8.0%}{summary['moved']:>8.0%}{summary['mean']:>9.1f}{summary['median']:>9.1f}{summary['stdev']:>9.1f}{marker}")
+
+
+if __name__ == "__main__":
+    main()
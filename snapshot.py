@@ -0,0 +1,115 @@
+"""
+Module to serve read-only competition queries from an in-memory snapshot of the database.
+
+Reports, timelines and leaderboard graphs only need data that is a few seconds fresh, so instead of querying the
+file `submit` writes to, they read an in-memory copy taken with SQLite's online backup API. The copy is refreshed
+when it is older than `max_age`; a refresh holds a single read transaction for the length of the copy, and with the
+database in WAL mode (see db_init) readers never block writers, so read traffic adds no latency to score writes.
+
+Classes:
+    ReadSnapshot: Periodically refreshed in-memory copy of a competition database.
+
+Dependencies:
+    time: Used for timing snapshot age on the monotonic clock.
+    sqlite3: Used for copying the database with the backup API.
+    threading: Used for serializing refreshes from worker threads.
+    pathlib: Used for building read-only database URIs.
+
+Example:
+    To use the ReadSnapshot class, import it into your bot's file:
+
+    ```python
+    from snapshot import ReadSnapshot
+    ```
+"""
+
+import time
+import sqlite3
+import threading
+from pathlib import Path
+
+READ_MAX_AGE = 5.0 # default staleness of read queries, in seconds
+
+
+class ReadSnapshot:
+    """
+    In-memory copy of a competition database for read-only queries, refreshed when older than `max_age`.
+
+    Connections handed out may be used from worker threads. A refresh swaps in a new copy; queries still running on
+    the previous copy finish on it. The previous copy is never closed explicitly, since a worker may still be
+    reading it: CPython frees it, closing the connection, when the last reference to it is dropped. Callers that
+    need a refresh while one is in progress wait for it and share its copy instead of taking their own.
+
+    Attributes:
+        db_path (str): Path to the competition database.
+        max_age (float): Seconds a snapshot may be served before it is refreshed.
+        refreshes (int): Snapshots taken.
+        last_duration (float): Seconds the last copy took.
+
+    Args:
+        db_path (str): Path to the competition database.
+        max_age (float): Staleness allowed, in seconds. Default is 5.
+    """
+    def __init__(self, db_path: str, max_age: float = READ_MAX_AGE) -> None:
+        self.db_path = db_path
+        self.max_age = max_age
+        self.refreshes = 0
+        self.last_duration = 0.0
+        self._conn = None
+        self._taken = 0.0 # monotonic time the current copy was started
+        self._lock = threading.Lock()
+
+    def age(self) -> float:
+        """Returns the age of the current snapshot in seconds, or infinity if none has been taken."""
+        return time.monotonic() - self._taken if self._conn is not None else float('inf')
+
+    def refresh(self, newer_than: float = None) -> sqlite3.Connection:
+        """Takes a new snapshot of the database.
+
+        Args:
+            newer_than (float): Monotonic time; if a copy started at or after it is already in place once the lock
+                is held, e.g. taken by another thread while this one waited, that copy is returned instead. Default
+                always takes a new copy.
+
+        Returns:
+            sqlite3.Connection: Connection to the new in-memory copy.
+        """
+        with self._lock:
+            if newer_than is not None and self._conn is not None and self._taken >= newer_than:
+                return self._conn
+            start = time.monotonic()
+            source = sqlite3.connect(Path(self.db_path).resolve().as_uri() + "?mode=ro", uri=True)
+            try:
+                copy = sqlite3.connect(':memory:', check_same_thread=False)
+                source.backup(copy) # one step, so the copy is consistent
+            finally:
+                source.close()
+            self._conn = copy
+            self._taken = start # the copy reflects the database as of the start of the backup
+            self.last_duration = time.monotonic() - start
+            self.refreshes += 1
+            return copy
+
+    def connection(self, max_age: float = None) -> sqlite3.Connection:
+        """Returns a connection to a snapshot no older than the allowed staleness, refreshing it if needed.
+
+        Args:
+            max_age (float): Staleness allowed for this query, e.g. 0 for final results. Default is `max_age`.
+
+        Returns:
+            sqlite3.Connection: Connection to an in-memory copy; do not close it.
+        """
+        limit = self.max_age if max_age is None else max_age
+        conn = self._conn
+        oldest = time.monotonic() - limit
+        if conn is None or self._taken < oldest:
+            conn = self.refresh(newer_than=oldest)
+        return conn
+
+    def invalidate(self) -> None:
+        """Forces the next query to take a new snapshot, e.g. after bulk changes to the database."""
+        self._taken = float('-inf')
+
+    def close(self) -> None:
+        """Drops the current snapshot; it is freed once no query holds it."""
+        self._conn = None
@@ -0,0 +1,202 @@
+"""
+Module to keep a live status snapshot of every team for `!status`.
+
+The snapshot is updated as events happen (channel mapped, question opened or closed, score changed) and renders
+its team pages only when something changed since the last render, so `!status` costs a lookup in the common case.
+
+Classes:
+    TeamStatus: Live status of one team.
+    StatusSnapshot: Live status of every team, rendered as paginated embeds.
+
+Dependencies:
+    sqlite3: Used for rebuilding the snapshot from the competition database.
+    discord.py: Used to build status embeds.
+    report: A custom module providing Discord's embed limits.
+
+Example:
+    To use the StatusSnapshot class, import it into your bot's file:
+
+    ```python
+    from status import StatusSnapshot
+    ```
+"""
+
+import sqlite3
+import discord
+from report import MAX_DESCRIPTION
+
+PAGE_SIZE = 25 # teams per embed, fewer if their lines would pass Discord's description limit
+MAX_OPEN_SHOWN = 5 # open questions listed per team before eliding
+
+class TeamStatus:
+    """
+    Live status of one team.
+
+    Attributes:
+        tid (int): Team ID.
+        name (str): Team name.
+        channels (list): Competitor channel IDs mapped to the team.
+        open (set): Question numbers the team has started but not closed.
+        solved (int): Questions answered correctly.
+        forfeited (int): Questions forfeited.
+        score (int): Team total score.
+    """
+    __slots__ = ('tid', 'name', 'channels', 'open', 'solved', 'forfeited', 'score')
+
+    def __init__(self, tid: int, name: str = None) -> None:
+        self.tid = tid
+        self.name = name if name is not None else f"Team {tid}"
+        self.channels = []
+        self.open = set()
+        self.solved = 0
+        self.forfeited = 0
+        self.score = 0
+
+    def line(self) -> str:
+        """Formats the team as one line of a status page."""
+        channels = ' '.join(f"<#{channel}>" for channel in self.channels) or "no channel"
+        line = f"**{self.name}** (Team {self.tid}) · {self.score} pts · {self.solved} solved · {self.forfeited} forfeited · {channels}"
+        if self.open:
+            shown = ', '.join(f"Q{qid}" for qid in sorted(self.open)[:MAX_OPEN_SHOWN])
+            more = f" +{len(self.open) - MAX_OPEN_SHOWN}" if len(self.open) > MAX_OPEN_SHOWN else ""
+            line += f" · open: {shown}{more}"
+        return line
+
+class StatusSnapshot:
+    """
+    Live status of every team, kept up to date by competition events.
+
+    Attributes:
+        teams (dict): Maps team IDs to TeamStatus.
+        open (int): Questions currently open across all teams.
+        solved (int): Questions solved across all teams.
+        forfeited (int): Questions forfeited across all teams.
+    """
+    def __init__(self) -> None:
+        self.teams = {}
+        self.open = 0
+        self.solved = 0
+        self.forfeited = 0
+        self._channels = {} # channel ID -> team ID
+        self._version = 0 # bumped on every change
+        self._rendered = (-1, None) # (version, pages) of the last render
+
+    def _team(self, tid: int) -> TeamStatus:
+        team = self.teams.get(tid)
+        if team is None:
+            team = self.teams[tid] = TeamStatus(tid)
+        return team
+
+    def load(self, conn: sqlite3.Connection) -> None:
+        """Rebuilds team names, scores and question counts from the database, keeping channel mappings.
+
+        Args:
+            conn (sqlite3.Connection): Connection to the competition database.
+        """
+        teams = {}
+        for tid, name, score in conn.execute("SELECT id, team_name, score FROM teams"):
+            team = teams[tid] = TeamStatus(tid, name)
+            team.score = score or 0
+        for channel, tid in self._channels.items():
+            teams.setdefault(tid, TeamStatus(tid)).channels.append(channel)
+
+        self.open = self.solved = self.forfeited = 0
+        for tid, qid, attempts in conn.execute("SELECT tid, qid, attempts FROM progress"):
+            team = teams.setdefault(tid, TeamStatus(tid))
+            if attempts is None or attempts == 0:
+                team.open.add(qid)
+                self.open += 1
+            elif attempts < 0:
+                team.forfeited += 1
+                self.forfeited += 1
+            else:
+                team.solved += 1
+                self.solved += 1
+
+        self.teams = teams
+        self._version += 1
+
+    def map_channel(self, channel_id: int, tid: int) -> None:
+        """Records a competitor channel for a team, moving it from any previous team."""
+        self.unmap_channel(channel_id)
+        self._channels[channel_id] = tid
+        self._team(tid).channels.append(channel_id)
+        self._version += 1
+
+    def unmap_channel(self, channel_id: int) -> None:
+        """Forgets a competitor channel."""
+        tid = self._channels.pop(channel_id, None)
+        if tid is not None:
+            self.teams[tid].channels.remove(channel_id)
+            self._version += 1
+
+    def opened(self, tid: int, qid: int) -> None:
+        """Records a team starting a question."""
+        team = self._team(tid)
+        if qid not in team.open:
+            team.open.add(qid)
+            self.open += 1
+            self._version += 1
+
+    def closed(self, tid: int, qid: int, solved: bool, score: int = None) -> None:
+        """Records a question being solved or forfeited.
+
+        Args:
+            tid (int): Team ID.
+            qid (int): Question number.
+            solved (bool): True if answered correctly, False if forfeited.
+            score (int): New team total, if it changed.
+        """
+        team = self._team(tid)
+        if qid in team.open:
+            team.open.discard(qid)
+            self.open -= 1
+        if solved:
+            team.solved += 1
+            self.solved += 1
+        else:
+            team.forfeited += 1
+            self.forfeited += 1
+        if score is not None:
+            team.score = score
+        self._version += 1
+
+    def scored(self, tid: int, score: int) -> None:
+        """Records a new team total, e.g. from a manual adjustment."""
+        self._team(tid).score = score
+        self._version += 1
+
+    def pages(self, page_size: int = PAGE_SIZE) -> list:
+        """Returns the team pages, rendering them only if something changed since the last call.
+
+        Args:
+            page_size (int): Most teams per page. Default is 25.
+
+        Returns:
+            list: Page descriptions, teams ordered by team ID.
+        """
+        version, pages = self._rendered
+        if version == self._version and pages is not None:
+            return pages
+
+        pages, page, chars = [], [], 0
+        for tid in sorted(self.teams):
+            line = self.teams[tid].line()
+            if page and (len(page) == page_size or chars + len(line) + 1 > MAX_DESCRIPTION):
+                pages.append("\n".join(page))
+                page, chars = [], 0
+            page.append(line)
+            chars += len(line) + 1
+        if page:
+            pages.append("\n".join(page))
+        self._rendered = (self._version, pages)
+        return pages
+
+    def embeds(self) -> list:
+        """Builds one embed per team page.
+
+        Returns:
+            list: discord.Embed objects.
+        """
+        pages = self.pages()
+        return [discord.Embed(title=f"Teams ({i + 1}/{len(pages)})", description=page, color=0xb8eefa) for i, page in enumerate(pages)]
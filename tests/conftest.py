@@ -0,0 +1,7 @@
+import sys
+from os.path import dirname, abspath, join
+
+# the bot's modules live at the repository root and the offline CLI's in cli/, neither in a package
+ROOT = dirname(dirname(abspath(__file__)))
+sys.path.insert(0, join(ROOT, 'cli'))
+sys.path.insert(0, ROOT)
@@ -0,0 +1,92 @@
+import sqlite3
+import time
+
+from bank import QuestionBank, canonical, compile_matcher, compile_questions, load_set
+
+
+def competition_db(path) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(path))
+    conn.execute("CREATE TABLE questions (id INTEGER PRIMARY KEY, answer TEXT, base_score INTEGER, matcher TEXT DEFAULT 'exact')")
+    conn.execute("INSERT INTO questions VALUES (99, 'old', 1, 'exact')")
+    conn.commit()
+    return conn
+
+
+def test_matchers():
+    assert compile_matcher('exact', '42')('42') and not compile_matcher('exact', '42')(' 42')
+    assert compile_matcher(None, 'x')('x')
+    text = compile_matcher('text', 'New  York')
+    assert text('  new york ') and not text('newyork')
+    number = compile_matcher('number', '1/2')
+    assert all(number(answer) for answer in ('0.5', '.50', '1/2', '2/4', '5e-1'))
+    assert not number('0.51') and not number('half') and not number('1/0')
+    regex = compile_matcher('regex', r'\d+ cm')
+    assert regex(' 12 cm ') and not regex('12 cm!')
+
+
+def test_huge_exponents_are_rejected_quickly():
+    number = compile_matcher('number', '10')
+    start = time.perf_counter()
+    assert not number('1e100000000')
+    assert not number('9' * 100)
+    assert time.perf_counter() - start < 0.1
+
+
+def test_canonical_rejects_bad_answers():
+    for matcher, answer in (('number', 'ten'), ('regex', '('), ('fuzzy', 'x')):
+        try:
+            canonical(matcher, answer)
+        except ValueError:
+            continue
+        raise AssertionError(f"{matcher} accepted {answer!r}")
+
+
+def test_add_set_deduplicates_questions_across_sets(tmp_path):
+    bank = QuestionBank(str(tmp_path / "bank.sqlite"))
+    set_id, count, added = bank.add_set("round 1", [("1", "42", "10"), ("2", "1/2", "20", "number"), ("3", "Paris", "5", "text")])
+    assert (count, added) == (3, 3)
+    # same content, differently written: the number and text answers canonicalize to stored questions
+    _, count, added = bank.add_set("round 1 again", [("1", "42", "10"), ("2", "0.5", "20", "number"), ("3", "paris", "5", "text"), ("4", "7", "10")])
+    assert (count, added) == (4, 1)
+    assert [(name, questions) for _, name, questions, _ in bank.sets()] == [("round 1", 3), ("round 1 again", 4)]
+
+
+def test_add_set_rejects_bad_input(tmp_path):
+    bank = QuestionBank(str(tmp_path / "bank.sqlite"))
+    bank.add_set("taken", [("1", "1", "1")])
+    for name, rows in (("taken", [("1", "1", "1")]), ("short", [("1", "1")]), ("score", [("1", "1", "ten")]),
+                       ("dupes", [("1", "1", "1"), ("1", "2", "1")]), ("empty", []), ("nan", [("1", "x", "1", "number")])):
+        try:
+            bank.add_set(name, rows)
+        except ValueError:
+            continue
+        raise AssertionError(f"{name} accepted")
+    assert [name for _, name, _, _ in bank.sets()] == ["taken"]
+
+
+def test_add_set_numbers_prompt_rows_in_order(tmp_path):
+    bank = QuestionBank(str(tmp_path / "bank.sqlite"))
+    set_id, _, _ = bank.add_set("cli", [("What is 6 x 7?", "42", "10"), ("Half of one?", "1/2", "10", "number")])
+    bank.close()
+    conn = competition_db(tmp_path / "comp.db")
+    assert load_set(conn, set_id, str(tmp_path / "bank.sqlite")) == 2
+    assert conn.execute("SELECT id, answer, matcher FROM questions ORDER BY id").fetchall() == [(1, "42", "exact"), (2, "1/2", "number")]
+
+
+def test_load_set_replaces_questions_and_compiles_matchers(tmp_path):
+    path = str(tmp_path / "bank.sqlite")
+    bank = QuestionBank(path)
+    set_id, _, _ = bank.add_set("round", [("1", "42", "10"), ("3", "1/2", "20", "number")])
+    bank.close()
+
+    conn = competition_db(tmp_path / "comp.db")
+    assert load_set(conn, set_id, path) == 2
+    assert conn.execute("SELECT id, answer, base_score, matcher FROM questions ORDER BY id").fetchall() == [(1, "42", 10, "exact"), (3, "1/2", 20, "number")]
+    matchers = compile_questions(conn)
+    assert matchers[1]("42") and matchers[3]("0.5")
+    assert conn.execute("PRAGMA database_list").fetchall()[-1][1] == "main" # the bank was detached
+
+    # unknown sets and missing banks leave the questions alone
+    assert load_set(conn, set_id + 1, path) == 0
+    assert load_set(conn, set_id, str(tmp_path / "missing.sqlite")) == 0
+    assert conn.execute("SELECT COUNT(*) FROM questions").fetchone()[0] == 2
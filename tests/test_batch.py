@@ -0,0 +1,31 @@
+from batch import parse_batch
+
+
+def test_text_lines_with_any_separator():
+    text = "Q1: 42\nq2, 1/2\n3;x\n4\tNew York\n5 7\n"
+    pairs, unreadable, repeated = parse_batch(text)
+    assert pairs == [(1, "42"), (2, "1/2"), (3, "x"), (4, "New York"), (5, "7")]
+    assert unreadable == [] and repeated == []
+
+
+def test_unreadable_and_blank_lines():
+    pairs, unreadable, repeated = parse_batch("question,answer\n\n1,5\nQ2:\nfoo bar\n")
+    assert pairs == [(1, "5")]
+    assert unreadable == ["question,answer", "Q2:", "foo bar"]
+
+
+def test_only_the_first_answer_to_a_question_counts():
+    pairs, _, repeated = parse_batch("1: 5\n2: 6\n1: 7\n1: 8\n")
+    assert pairs == [(1, "5"), (2, "6")]
+    assert repeated == [1, 1]
+
+
+def test_csv_keeps_quoted_commas():
+    pairs, unreadable, _ = parse_batch('question,answer\nQ1,"1,000"\n2, 3 \n"3"\n', is_csv=True)
+    assert pairs == [(1, "1,000"), (2, "3")]
+    assert unreadable == ["question,answer", '"3"']
+
+
+def test_text_mode_splits_at_the_first_separator_only():
+    pairs, _, _ = parse_batch("1, 1,000\n")
+    assert pairs == [(1, "1,000")]
@@ -0,0 +1,42 @@
+import cli
+from cli import Team, Question, bind_progress, replay
+
+
+def make_teams(names, questions=2):
+    teams = [Team(name) for name in names]
+    bind_progress(teams, [Question(f"q{i}", str(i), 10) for i in range(questions)])
+    return teams
+
+
+def test_replay_skips_questions_removed_from_the_csv(capsys):
+    teams = make_teams(["a", "b"])
+    replay(teams, None, [
+        {"seq": 1, "team": "a", "action": "take", "question": 3, "time": 0.0},
+        {"seq": 2, "team": "a", "action": "mark", "question": 3, "correct": True, "time": 5.0, "points": 9},
+        {"seq": 3, "team": "b", "action": "take", "question": 1, "time": 0.0},
+    ])
+    assert [team.total_score() for team in teams] == [0, 0]
+    assert teams[0].progress.open() == [] and teams[1].progress.open() == [1]
+    assert "Skipped 2 journal record(s)" in capsys.readouterr().out
+
+
+def test_replay_matches_snapshot_rows_by_team_name():
+    before = make_teams(["a", "b"])
+    replay(before, None, [
+        {"seq": 1, "team": "b", "action": "take", "question": 0, "time": 0.0},
+        {"seq": 2, "team": "b", "action": "mark", "question": 0, "correct": True, "time": 30.0, "points": 10},
+    ])
+    after = make_teams(["b", "a"]) # teams.csv reordered between runs
+    replay(after, cli.teams_state(before), [])
+    assert [team.total_score() for team in after] == [10, 0]
+
+
+def test_attempts_count_answers_submitted():
+    team, = make_teams(["a"])
+    cli.apply_take(team, 0, 0.0)
+    assert team.progress.cell(0).attempts == 0 # same as a cell the bot opens or loads from the database
+    cli.apply_mark(team, 0, False, 10.0, 0)
+    assert team.progress.cell(0).attempts == 1
+    cli.apply_mark(team, 0, True, 20.0, 8)
+    cell = team.progress.cell(0)
+    assert (cell.attempts, cell.score, cell.elapsed) == (2, 8, 20.0)
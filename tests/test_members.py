@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+
+from members import MemberIndex, parse_members
+
+
+def member(user_id, name, display_name=None, global_name=None, roles=()):
+    return SimpleNamespace(id=user_id, name=name, display_name=display_name or name, global_name=global_name, roles=list(roles))
+
+
+def test_parse_members_keeps_names_with_spaces_whole():
+    assert parse_members("Jae Eun Kim, Bob  Smith; <@123>\n@ada") == ({123}, {"jae eun kim", "bob smith", "ada"})
+    assert parse_members('["ada", 55]') == ({55}, {"ada"})
+    assert parse_members(None) == (set(), set())
+
+
+def test_listed_ids_usernames_and_roles_authorize():
+    role = SimpleNamespace(id=900, name="Alpha")
+    index = MemberIndex([(1, "Alpha", "<@11>, ada"), (2, "Beta", "")], roles=[role])
+    assert index.authorized(member(11, "someone"), 1)
+    assert index.authorized(member(12, "Ada"), 1)
+    assert index.authorized(member(13, "carol", roles=[role]), 1)
+    assert not index.authorized(member(14, "dave"), 1)
+    assert index.authorized(member(14, "dave"), 2) # no membership information: anyone may answer
+
+
+def test_nickname_or_global_name_collision_is_rejected():
+    index = MemberIndex([(1, "Alpha", "ada")])
+    impostor = member(66, "mallory", display_name="ada", global_name="ada")
+    assert not index.authorized(impostor, 1)
+    assert index.team_of(impostor) is None
+
+
+def test_role_change_invalidates_cache():
+    role = SimpleNamespace(id=900, name="Alpha")
+    index = MemberIndex([(1, "Alpha", "")], roles=[role])
+    before = member(5, "eve")
+    assert not index.authorized(before, 1)
+    after = member(5, "eve", roles=[role])
+    index.on_member_update(before, after)
+    assert index.authorized(after, 1)
+
+
+def test_uncached_index_follows_roles_on_each_message():
+    role = SimpleNamespace(id=900, name="Alpha")
+    index = MemberIndex([(1, "Alpha", "")], roles=[role], cache=False)
+    assert index.authorized(member(5, "eve", roles=[role]), 1)
+    assert not index.authorized(member(5, "eve"), 1)
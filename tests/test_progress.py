@@ -0,0 +1,81 @@
+import json
+import sqlite3
+
+from progress import ProgressMatrix, UNTOUCHED, OPEN, SOLVED, FORFEITED
+
+
+def filled_matrix() -> ProgressMatrix:
+    matrix = ProgressMatrix.from_ids([10, 20, 30], [1, 2, 3, 4])
+    matrix.cell(0, 0).solve(2, 41.5, 90)
+    matrix.cell(0, 1).open(1700000000.25, attempts=3)
+    matrix.cell(1, 3).forfeit(12.0)
+    matrix.cell(2, 2).solve(1, 8.0, 100)
+    return matrix
+
+
+def test_state_round_trips_through_json():
+    matrix = filled_matrix()
+    restored = ProgressMatrix.from_state(json.loads(json.dumps(matrix.state())))
+    assert (restored.teams, restored.questions) == (3, 4)
+    assert restored.team_ids == [10, 20, 30] and restored.question_ids == [1, 2, 3, 4]
+    assert restored.locate(30, 3) == (2, 2) and restored.locate(40, 1) is None
+    for name in ('attempts', 'started', 'elapsed', 'score', 'status'):
+        assert getattr(restored, name) == getattr(matrix, name), name
+        assert getattr(restored, name).typecode == getattr(matrix, name).typecode
+    cell = restored.cell(0, 1)
+    assert (cell.status, cell.attempts, cell.started) == (OPEN, 3, 1700000000.25)
+
+
+def test_empty_matrix_round_trips():
+    restored = ProgressMatrix.from_state(ProgressMatrix.from_ids([], []).state())
+    assert (restored.teams, restored.questions, restored.nbytes()) == (0, 0, 0)
+    assert restored.totals() == [] and restored.ranks() == []
+
+
+def test_rows_columns_totals_and_ranks():
+    matrix = filled_matrix()
+    assert matrix.totals() == [90, 0, 100]
+    assert matrix.ranks() == [2, 3, 1]
+    assert matrix.row(0).solved() == [0] and matrix.row(0).open() == [1] and matrix.row(1).with_status(FORFEITED) == [3]
+    assert list(matrix.column_slice('status', 3)) == [UNTOUCHED, FORFEITED, UNTOUCHED]
+    assert matrix.question_stats(0) == {'opened': 1, 'solved': 1, 'forfeited': 0, 'avg_attempts': 2, 'avg_time': 41.5}
+    assert matrix.question_stats(3)['avg_time'] is None
+
+
+def test_copy_row_between_matrices_of_different_widths():
+    source = filled_matrix()
+    target = ProgressMatrix.from_ids([20, 10], [1, 2])
+    target.copy_row(source, 0, 1)
+    assert target.cell(1, 0).status == SOLVED and target.cell(1, 0).score == 90
+    assert target.cell(1, 1).status == OPEN
+    assert target.row(0).total() == 0
+
+
+def test_from_conn_reads_progress_statuses():
+    conn = sqlite3.connect(':memory:')
+    conn.execute("CREATE TABLE teams (id INTEGER PRIMARY KEY)")
+    conn.execute("CREATE TABLE questions (id INTEGER PRIMARY KEY, base_score INTEGER)")
+    conn.execute("CREATE TABLE progress (qid INTEGER, tid INTEGER, attempts INTEGER, time INTEGER)")
+    conn.executemany("INSERT INTO teams VALUES (?)", [(1,), (2,)])
+    conn.executemany("INSERT INTO questions VALUES (?, 10)", [(1,), (2,)])
+    conn.executemany("INSERT INTO progress VALUES (?, ?, ?, ?)", [(1, 1, 1, 20), (2, 1, 0, None), (1, 2, -1, 30), (1, 9, 1, 5)])
+    matrix = ProgressMatrix.from_conn(conn)
+    assert [matrix.cell(*matrix.locate(1, qid)).status for qid in (1, 2)] == [SOLVED, OPEN]
+    assert matrix.cell(*matrix.locate(2, 1)).status == FORFEITED
+    assert matrix.cell(*matrix.locate(1, 1)).score > 0
+
+
+def test_cells_outside_the_matrix_are_rejected():
+    matrix = ProgressMatrix.from_ids([1, 2], [1, 2])
+    for team, question in ((0, 2), (2, 0), (-1, 0), (0, -1)):
+        try:
+            matrix.cell(team, question)
+        except IndexError:
+            continue
+        raise AssertionError(f"cell ({team}, {question}) accepted")
+    try:
+        matrix.row(0).cell(2) # would be team 2's first question with flat indexing
+    except IndexError:
+        pass
+    else:
+        raise AssertionError("row cell past the row width accepted")
@@ -0,0 +1,70 @@
+import random
+import sqlite3
+import statistics
+
+from qstats import P2Quantile, StatsBook
+
+
+def test_exact_while_sample_is_small():
+    estimator = P2Quantile(0.5, exact=64)
+    assert estimator.value() is None
+    values = [5, 1, 9, 3]
+    for x in values:
+        estimator.add(x)
+    assert estimator.value() == statistics.median(values)
+
+
+def test_exact_quantile_interpolates():
+    estimator = P2Quantile(0.25, exact=64)
+    for x in range(1, 11):
+        estimator.add(x)
+    assert estimator.value() == 3.25 # numpy-style linear interpolation
+
+
+def test_sketch_tracks_quantiles_of_large_streams():
+    rng = random.Random(3)
+    for p in (0.1, 0.5, 0.9):
+        estimator = P2Quantile(p, exact=16)
+        values = [rng.expovariate(1 / 60) for _ in range(20000)]
+        for x in values:
+            estimator.add(x)
+        values.sort()
+        truth = values[int(p * (len(values) - 1))]
+        assert abs(estimator.value() - truth) / truth < 0.05
+        assert estimator.sample is None # the buffer is dropped once the markers are seeded
+
+
+def test_sketch_handles_sorted_and_constant_input():
+    rising = P2Quantile(0.5, exact=5)
+    for x in range(1001):
+        rising.add(x)
+    assert abs(rising.value() - 500) < 10
+
+    constant = P2Quantile(0.5, exact=5)
+    for _ in range(100):
+        constant.add(7)
+    assert constant.value() == 7
+
+
+def test_book_rebuilt_from_progress_matches_incremental_updates():
+    conn = sqlite3.connect(':memory:')
+    conn.execute("CREATE TABLE questions (id INTEGER PRIMARY KEY, answer TEXT, base_score INTEGER)")
+    conn.execute("CREATE TABLE progress (qid INTEGER, tid INTEGER, attempts INTEGER, time INTEGER, completed INTEGER)")
+    conn.executemany("INSERT INTO questions VALUES (?, '1', 10)", [(1,), (2,), (3,)])
+    # team 1 solved Q1 in 2 attempts, team 2 forfeited Q1, team 3 is still on Q1, team 1 solved Q2 first try
+    conn.executemany("INSERT INTO progress VALUES (?, ?, ?, ?, 0)", [(1, 1, 2, 30), (1, 2, -1, 50), (1, 3, 0, None), (2, 1, 1, 10)])
+
+    book = StatsBook.from_conn(conn)
+    q1, q2, q3 = (book.questions[qid] for qid in (1, 2, 3))
+    assert (q1.opened, q1.solved, q1.forfeited) == (3, 1, 1)
+    assert q1.solve_rate == 1 / 3 and q1.avg_attempts == 2 and q1.median_time == 30
+    assert (q2.opened, q2.solved, q2.median_time) == (1, 1, 10)
+    assert q3.opened == 0 and q3.solve_rate is None and q3.median_time is None
+
+    incremental = StatsBook()
+    for qid in (1, 1, 1, 2):
+        incremental.opened(qid)
+    incremental.solved(1, 2, 30)
+    incremental.forfeited(1)
+    incremental.solved(2, 1, 10)
+    assert incremental.format()[1:] == book.format()[1:3]
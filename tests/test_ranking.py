@@ -0,0 +1,81 @@
+import random
+
+from ranking import RankIndex
+
+
+def expected_standings(scores: dict, names: dict) -> list:
+    """Brute-force leaderboard: competition ranking, ties listed by team name."""
+    order = sorted(scores, key=lambda tid: (-scores[tid], names[tid], tid))
+    rows = []
+    for pos, tid in enumerate(order, start=1):
+        rank = pos if pos == 1 or scores[order[pos - 2]] != scores[tid] else rows[-1][0]
+        rows.append((rank, tid, scores[tid]))
+    return rows
+
+
+def test_ties_share_a_rank_and_are_ordered_by_name():
+    index = RankIndex.from_rows([(1, "Delta", 10), (2, "Alpha", 20), (3, "Charlie", 10), (4, "Bravo", 10)])
+    assert index.standings() == [(1, 2, 20), (2, 4, 10), (2, 3, 10), (2, 1, 10)]
+    assert [index.rank(tid) for tid in (1, 2, 3, 4)] == [2, 1, 2, 2]
+    assert [index.position(tid) for tid in (1, 2, 3, 4)] == [4, 1, 3, 2]
+    assert index.around(3, 1) == [(2, 4, 10), (2, 3, 10), (2, 1, 10)]
+
+
+def test_rename_moves_team_within_its_tie():
+    index = RankIndex.from_rows([(1, "Alpha", 5), (2, "Bravo", 5)])
+    index.update(1, 5, "Zulu")
+    assert index.standings() == [(1, 2, 5), (1, 1, 5)]
+    assert index.position(1) == 2
+
+
+def test_remove_and_unknown_teams():
+    index = RankIndex.from_rows([(1, "Alpha", 5), (2, "Bravo", 3)])
+    index.remove(1)
+    assert len(index) == 1 and 1 not in index
+    assert index.rank(1) is None and index.position(1) is None and index.around(1) == []
+    assert index.standings() == [(1, 2, 3)]
+
+
+def test_negative_totals_are_rejected():
+    index = RankIndex()
+    try:
+        index.update(1, -1)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("negative total accepted")
+
+
+def test_random_updates_match_brute_force():
+    rng = random.Random(7)
+    index = RankIndex(capacity=4) # small, so scores beyond it force the tree to grow
+    scores, names = {}, {}
+    for step in range(3000):
+        tid = rng.randrange(60)
+        action = rng.random()
+        if action < 0.05 and tid in scores:
+            index.remove(tid)
+            del scores[tid], names[tid]
+        elif action < 0.15:
+            names[tid] = f"team-{rng.randrange(20)}"
+            scores[tid] = scores.get(tid, 0)
+            index.update(tid, scores[tid], names[tid])
+        else:
+            names.setdefault(tid, f"Team {tid}")
+            scores[tid] = scores.get(tid, 0) + rng.randrange(0, 40)
+            index.update(tid, scores[tid])
+        if step % 50 == 0:
+            expected = expected_standings(scores, names)
+            assert index.standings() == expected
+            for pos, (rank, tid, score) in enumerate(expected, start=1):
+                assert index.rank(tid) == rank
+                assert index.position(tid) == pos
+            start = rng.randrange(1, len(expected) + 1)
+            assert index.slice(start, start + 5) == expected[start - 1:start + 5]
+
+
+def test_position_in_a_large_tie_does_not_sort_it():
+    # every team is tied at 0 when a competition starts
+    index = RankIndex.from_rows((tid, f"Team {tid:05}", 0) for tid in range(20000))
+    assert index.position(12345) == 12346
+    assert index.around(12345, 1) == [(1, 12344, 0), (1, 12345, 0), (1, 12346, 0)]
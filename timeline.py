@@ -0,0 +1,192 @@
+"""
+Module to show how a competition unfolded from its timestamped score events.
+
+Every awarded score is stored in the `score_events` table as a (team, question, delta, timestamp) row. This
+module replays those deltas into cumulative team totals and draws them as a line chart or an animated bar race.
+Frames are produced incrementally: each frame applies only the events since the previous frame to a running
+set of totals, so the event log is read once no matter how many frames are drawn.
+
+Dependencies:
+    sqlite3: Used for querying score events.
+    matplotlib: Used for drawing the line chart.
+    PIL: Pillow, used for drawing and encoding the bar-race animation.
+    graph: A custom module providing the leaderboard font.
+    fast_graph: A custom module providing the leaderboard geometry and cached labels.
+
+Example:
+    To use the timeline functions, import them into your bot's file:
+
+    ```python
+    from timeline import load_timeline, line_chart, race
+    ```
+"""
+
+import sqlite3
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image, ImageDraw
+from graph import font
+import fast_graph
+
+BAR_COLOR = '#89CADF'
+TEXT_COLOR = '#B8EEFA'
+BACKGROUND = '#313338' # Discord dark theme, since GIF frames cannot be semi-transparent
+
+class Timeline:
+    """
+    Score events of one competition, ordered by time.
+
+    Attributes:
+        names (dict): Maps team IDs to team names.
+        events (list): (timestamp, tid, delta) tuples in time order.
+    """
+    __slots__ = ('names', 'events')
+
+    def __init__(self, names: dict, events: list) -> None:
+        self.names = names
+        self.events = events
+
+    @property
+    def start(self) -> float:
+        return self.events[0][0] if self.events else 0.0
+
+    @property
+    def end(self) -> float:
+        return self.events[-1][0] if self.events else 0.0
+
+    def frames(self, count: int):
+        """Yields (elapsed seconds, totals) at count evenly spaced times from the first to the last event.
+
+        The same totals dict is updated in place and yielded every frame; copy it to keep a frame.
+
+        Args:
+            count (int): Number of frames, at least 2.
+        """
+        totals = dict.fromkeys(self.names, 0)
+        step = (self.end - self.start) / max(count - 1, 1)
+        i = 0
+        for frame in range(count):
+            t = self.start + frame * step
+            # apply only the deltas that happened since the previous frame
+            while i < len(self.events) and self.events[i][0] <= t:
+                _, tid, delta = self.events[i]
+                totals[tid] = totals.get(tid, 0) + delta
+                i += 1
+            yield t - self.start, totals
+
+
+def load_timeline(conn: sqlite3.Connection) -> Timeline:
+    """Reads team names and score events from a competition database.
+
+    Args:
+        conn (sqlite3.Connection): Connection to the competition database.
+
+    Returns:
+        Timeline: Events in time order; empty if the database predates the score_events table.
+    """
+    names = {tid: name for tid, name in conn.execute("SELECT id, team_name FROM teams")}
+    try:
+        events = conn.execute("SELECT ts, tid, delta FROM score_events ORDER BY ts").fetchall()
+    except sqlite3.OperationalError:
+        events = [] # database created before score events were recorded
+    for _, tid, _ in events:
+        names.setdefault(tid, f"Team {tid}")
+    return Timeline(names, events)
+
+
+def _style(fig: Figure, ax) -> None:
+    fig.patch.set_facecolor(BACKGROUND)
+    ax.set_facecolor(BACKGROUND)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+    ax.tick_params(colors=TEXT_COLOR, labelsize=12)
+
+
+def line_chart(timeline: Timeline, save_path) -> None:
+    """Draws each team's cumulative score over time as a step chart.
+
+    Args:
+        timeline (Timeline): Competition score events.
+        save_path (str or file): Path or binary file object the PNG is written to.
+    """
+    # one pass over the events builds every team's series
+    series = {tid: ([0.0], [0]) for tid in timeline.names}
+    for ts, tid, delta in timeline.events:
+        minutes, totals = series[tid]
+        minutes.append((ts - timeline.start) / 60)
+        totals.append(totals[-1] + delta)
+    end = (timeline.end - timeline.start) / 60
+
+    fig = Figure(figsize=(10, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    _style(fig, ax)
+
+    for tid, (minutes, totals) in series.items():
+        ax.step(minutes + [end], totals + [totals[-1]], where='post', label=timeline.names[tid], linewidth=2)
+
+    ax.set_xlabel("Minutes", fontproperties=font, color=TEXT_COLOR, fontsize=14)
+    ax.set_ylabel("Score", fontproperties=font, color=TEXT_COLOR, fontsize=14)
+    ax.set_title("SCORE TIMELINE", fontproperties=font, color=TEXT_COLOR, fontsize=20)
+    legend = ax.legend(loc='upper left', fontsize=9, frameon=False, ncol=2)
+    for text in legend.get_texts():
+        text.set_color(TEXT_COLOR)
+
+    fig.savefig(save_path, format='png', facecolor=BACKGROUND)
+
+
+def race(timeline: Timeline, save_path, frames: int = 120, top: int = 10, fps: int = 12) -> None:
+    """Renders an animated GIF bar race of the top teams over the competition.
+
+    Frames are drawn with Pillow in the style of the live leaderboard. The static background and title are drawn
+    once, team and score labels come from fast_graph's label cache, and totals come from Timeline.frames, which
+    applies only the events since the previous frame. Every frame is mapped onto one shared palette.
+
+    Args:
+        timeline (Timeline): Competition score events.
+        save_path (str or file): Path or binary file object the GIF is written to.
+        frames (int): Number of frames. Default is 120.
+        top (int): Number of teams shown. Default is 10.
+        fps (int): Frames per second. Default is 12.
+    """
+    top = max(min(top, len(timeline.names)), 1)
+    finals = dict.fromkeys(timeline.names, 0)
+    for _, tid, delta in timeline.events:
+        finals[tid] += delta
+    max_total = max(finals.values(), default=0) or 1
+
+    left, right = fast_graph.AXES_LEFT, fast_graph.AXES_RIGHT
+    upper, lower = fast_graph.AXES_TOP, fast_graph.AXES_BOTTOM
+    row_height = (lower - upper) / top
+    bar_height = row_height * fast_graph.BAR_HEIGHT
+    scale = (right - left) / (max_total * 1.2)
+
+    # static layer: background and title
+    base = Image.new('RGB', (fast_graph.WIDTH, fast_graph.HEIGHT), BACKGROUND)
+    title = fast_graph._label("LEADERBOARD")
+    base.paste(title, (round(left - title.width / 2), round(upper - 0.05 * (lower - upper) - title.height / 2)), title)
+
+    palette = None
+    images = []
+    for elapsed, totals in timeline.frames(max(frames, 2)):
+        frame = base.copy()
+        draw = ImageDraw.Draw(frame)
+        leaders = sorted(totals.items(), key=lambda pair: (-pair[1], timeline.names[pair[0]]))[:top]
+        for slot, (tid, total) in enumerate(leaders):
+            centre = upper + (slot + 0.5) * row_height
+            if total > 0:
+                draw.rectangle((left, round(centre - bar_height / 2), round(left + total * scale), round(centre + bar_height / 2)), fill=fast_graph.BAR_COLOR)
+            name = fast_graph._label(str(timeline.names[tid]))
+            value = fast_graph._label(str(total))
+            frame.paste(name, (round(left - fast_graph.LABEL_PAD - name.width), round(centre - name.height / 2)), name)
+            frame.paste(value, (round(left + (total + 0.05 * max_total) * scale), round(centre - value.height / 2)), value)
+
+        clock = fast_graph._label(f"{int(elapsed // 60)}:{int(elapsed % 60):02d}")
+        frame.paste(clock, (round(right - clock.width), round(lower + clock.height / 2)), clock)
+
+        # build the palette from the first frame and reuse it, which is far cheaper than quantizing each frame
+        if palette is None:
+            palette = frame.quantize(colors=64)
+        images.append(frame.quantize(palette=palette, dither=Image.Dither.NONE))
+
+    images[0].save(save_path, format='GIF', save_all=True, append_images=images[1:], duration=round(1000 / fps), loop=0)
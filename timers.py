@@ -0,0 +1,270 @@
+"""
+Module to time open questions on the monotonic clock.
+
+Every deadline (time limits and warnings) lives in one hashed timer wheel driven by a single background task, so
+thousands of open questions cost one coroutine rather than one sleeping coroutine each. Question times come from
+time.monotonic(), which cannot jump with the wall clock and does not wrap at one day like timedelta.seconds.
+
+Classes:
+    TimeExpired: Raised into a waiting submission when its question's time limit is reached.
+    Timer: Handle of one scheduled callback.
+    TimerWheel: Hashed timer wheel.
+    QuestionTimers: Start times, time limits and warnings of open questions.
+
+Functions:
+    format_duration: Formats seconds as minutes or seconds for messages.
+
+Dependencies:
+    time: Provides the monotonic clock.
+    asyncio: Used for the background task and for running coroutine callbacks.
+    inspect: Used to recognise coroutine callbacks.
+
+Example:
+    To use the timer classes, import them into your bot's file:
+
+    ```python
+    from timers import TimerWheel, QuestionTimers, TimeExpired, format_duration
+    ```
+"""
+
+import time
+import asyncio
+import inspect
+from math import ceil
+from typing import Callable, Optional
+
+def format_duration(seconds: float) -> str:
+    """Formats a duration for messages, e.g. '5 minutes', '1 minute' or '30 seconds'."""
+    if seconds >= 60:
+        minutes = round(seconds / 60, 1)
+        return f"{minutes:g} minute{'' if minutes == 1 else 's'}"
+    seconds = round(seconds)
+    return f"{seconds} second{'' if seconds == 1 else 's'}"
+
+class TimeExpired(Exception):
+    """Raised into a waiting submission when its question's time limit is reached."""
+
+class Timer:
+    """
+    Handle of one scheduled callback, used to cancel it.
+
+    Attributes:
+        deadline (float): Monotonic time the callback is due.
+        active (bool): False once the timer has fired or been cancelled.
+    """
+    __slots__ = ('deadline', 'callback', 'args', 'slot', 'active')
+
+    def __init__(self, deadline: float, callback: Callable, args: tuple) -> None:
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.slot = 0
+        self.active = True
+
+class TimerWheel:
+    """
+    Hashed timer wheel: a ring of slots, one per tick, each holding the timers due in that tick modulo the ring size.
+
+    Scheduling and cancelling are O(1). Each tick only the current slot is scanned; timers due in a later lap of the
+    ring stay where they are. Callbacks fire within two ticks of their deadline.
+
+    Attributes:
+        tick (float): Seconds per slot.
+
+    Args:
+        tick (float): Seconds per slot. Default is 1.
+        slots (int): Number of slots. Default is 512, about eight and a half minutes per lap.
+    """
+    def __init__(self, tick: float = 1.0, slots: int = 512) -> None:
+        self.tick = tick
+        self._slots = [set() for _ in range(slots)]
+        self._current = int(time.monotonic() / tick) # last tick processed
+        self._count = 0
+        self._task = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def schedule(self, delay: float, callback: Callable, *args) -> Timer:
+        """Schedules a callback.
+
+        Args:
+            delay (float): Seconds from now.
+            callback (callable): Called with args when due. Exceptions are printed and swallowed.
+
+        Returns:
+            Timer: Handle for cancel.
+        """
+        timer = Timer(time.monotonic() + max(delay, 0.0), callback, args)
+        due_tick = max(ceil(timer.deadline / self.tick), self._current + 1)
+        timer.slot = due_tick % len(self._slots)
+        self._slots[timer.slot].add(timer)
+        self._count += 1
+        return timer
+
+    def cancel(self, timer: Timer) -> None:
+        """Cancels a timer. Cancelling a fired or cancelled timer does nothing."""
+        if timer.active:
+            timer.active = False
+            self._slots[timer.slot].discard(timer)
+            self._count -= 1
+
+    def advance(self, now: Optional[float] = None) -> int:
+        """Fires every timer due by now, in deadline order.
+
+        Args:
+            now (float): Current monotonic time. Default reads the clock.
+
+        Returns:
+            int: Number of timers fired.
+        """
+        if now is None:
+            now = time.monotonic()
+        target = int(now / self.tick)
+        if target <= self._current:
+            return 0
+
+        # after a long stall every slot is visited once rather than once per missed tick
+        due = []
+        for step in range(1, min(target - self._current, len(self._slots)) + 1):
+            slot = self._slots[(self._current + step) % len(self._slots)]
+            fired = [timer for timer in slot if timer.deadline <= now]
+            slot.difference_update(fired)
+            due.extend(fired)
+        self._current = target
+
+        due.sort(key=lambda timer: timer.deadline)
+        for timer in due:
+            timer.active = False
+            self._count -= 1
+            try:
+                timer.callback(*timer.args)
+            except Exception as e:
+                print(f"timer callback failed: {e}")
+        return len(due)
+
+    async def run(self) -> None:
+        """Advances the wheel once per tick until cancelled."""
+        while True:
+            await asyncio.sleep(self.tick)
+            self.advance()
+
+    def start(self) -> None:
+        """Starts the background task, if not already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    def stop(self) -> None:
+        """Cancels the background task. Scheduled timers are kept."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+class QuestionTimers:
+    """
+    Open questions keyed by (team ID, question number), timed on the monotonic clock.
+
+    With a time limit set, each question gets a warning at every configured remaining time and an expiry callback
+    at the limit. Callbacks may be plain functions or coroutine functions.
+
+    Attributes:
+        wheel (TimerWheel): Wheel the deadlines are scheduled on.
+        limit (float): Time limit in seconds for newly started questions, or None for no limit.
+        warnings (tuple): Remaining times in seconds at which a warning is sent.
+
+    Args:
+        wheel (TimerWheel): Wheel the deadlines are scheduled on.
+        limit (float): Time limit in seconds. Default is no limit.
+        warnings (tuple): Remaining times in seconds at which to warn. Default is 5 minutes and 1 minute.
+    """
+    def __init__(self, wheel: TimerWheel, limit: Optional[float] = None, warnings: tuple = (300, 60)) -> None:
+        self.wheel = wheel
+        self.limit = limit
+        self.warnings = tuple(warnings)
+        self._open = {} # key -> [start time, time limit, timer handles, expired]
+        self._tasks = set() # running coroutine callbacks
+
+    def __contains__(self, key) -> bool:
+        return key in self._open
+
+    def __len__(self) -> int:
+        return len(self._open)
+
+    def configure(self, limit: Optional[float], warnings: tuple = ()) -> None:
+        """Sets the time limit and warnings for questions started from now on.
+
+        Raises:
+            ValueError: Limit or a warning is not positive.
+        """
+        if (limit is not None and limit <= 0) or any(warning <= 0 for warning in warnings):
+            raise ValueError("limit and warnings must be positive")
+        self.limit = limit
+        self.warnings = tuple(sorted(set(warnings), reverse=True))
+
+    def _call(self, callback: Callable, *args) -> None:
+        result = callback(*args)
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _expire(self, key, on_expire: Optional[Callable]) -> None:
+        entry = self._open.get(key)
+        if entry is None:
+            return
+        entry[3] = True
+        if on_expire is not None:
+            self._call(on_expire)
+
+    def start(self, key, on_warning: Optional[Callable] = None, on_expire: Optional[Callable] = None) -> None:
+        """Starts timing a question. A question already being timed keeps its original start.
+
+        Args:
+            key (tuple): (team ID, question number).
+            on_warning (callable): Called with the remaining seconds at each warning.
+            on_expire (callable): Called with no arguments when the time limit is reached.
+        """
+        if key in self._open:
+            return
+        handles = []
+        if self.limit is not None:
+            for warning in self.warnings:
+                if warning < self.limit and on_warning is not None:
+                    handles.append(self.wheel.schedule(self.limit - warning, self._call, on_warning, warning))
+            handles.append(self.wheel.schedule(self.limit, self._expire, key, on_expire))
+        self._open[key] = [time.monotonic(), self.limit, handles, False]
+
+    def elapsed(self, key) -> float:
+        """Returns seconds since a question was started, or 0 if it is not being timed."""
+        entry = self._open.get(key)
+        return time.monotonic() - entry[0] if entry is not None else 0.0
+
+    def remaining(self, key) -> Optional[float]:
+        """Returns seconds left before a question's time limit, or None without a limit."""
+        entry = self._open.get(key)
+        if entry is None or entry[1] is None:
+            return None
+        return max(entry[1] - (time.monotonic() - entry[0]), 0.0)
+
+    def expired(self, key) -> bool:
+        """Returns True once a question's time limit has been reached."""
+        entry = self._open.get(key)
+        return entry is not None and entry[3]
+
+    def stop(self, key) -> float:
+        """Stops timing a question and cancels its pending warnings and expiry.
+
+        Returns:
+            float: Seconds since the question was started, or 0 if it was not being timed.
+        """
+        entry = self._open.pop(key, None)
+        if entry is None:
+            return 0.0
+        for handle in entry[2]:
+            self.wheel.cancel(handle)
+        return time.monotonic() - entry[0]
+
+    def clear(self) -> None:
+        """Stops timing every question."""
+        for key in list(self._open):
+            self.stop(key)